@@ -8,6 +8,7 @@ from volur.sdk.v1alpha2.sources.csv import (
     Column,
     MaterialsCSVFileSource,
     QuantityColumn,
+    TimestampColumn,
 )
 
 app = FunctionApp()
@@ -30,11 +31,8 @@ def run(source: InputStream) -> None:
                 column_name="WEIGHT",
                 unit="kilogram",
             ),
+            arrived_at_column=TimestampColumn(column_name="ARRIVED_AT"),
             characteristics_columns=[
-                CharacteristicColumnString(
-                    column_name="ARRIVED_AT",
-                    characteristic_name="arrived_at",
-                ),
                 CharacteristicColumnString(
                     column_name="PRODUCT_LABEL",
                     characteristic_name="product_label",
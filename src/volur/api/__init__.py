@@ -1,6 +1,13 @@
-from volur.api.v1alpha1 import VolurApiAsyncClient, VolurApiSettings
+from volur.api.v1alpha1 import (
+    BatchIterable,
+    UploadStatistics,
+    VolurApiAsyncClient,
+    VolurApiSettings,
+)
 
 __all__ = [
+    "BatchIterable",
+    "UploadStatistics",
     "VolurApiAsyncClient",
     "VolurApiSettings",
 ]
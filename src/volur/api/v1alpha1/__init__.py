@@ -1,7 +1,13 @@
-from volur.api.v1alpha1.client import VolurApiAsyncClient
+from volur.api.v1alpha1.client import (
+    BatchIterable,
+    UploadStatistics,
+    VolurApiAsyncClient,
+)
 from volur.api.v1alpha1.settings import VolurApiSettings
 
 __all__ = [
+    "BatchIterable",
+    "UploadStatistics",
     "VolurApiAsyncClient",
     "VolurApiSettings",
 ]
@@ -1,15 +1,118 @@
+import asyncio
+import collections
+import time
+import zlib
 from dataclasses import dataclass, field
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Callable, Protocol, TypeVar, runtime_checkable
 
 import grpc
 from google.rpc.status_pb2 import Status
 from loguru import logger
 
 from volur.api.v1alpha1.settings import VolurApiSettings
+from volur.pork.bom.v1alpha1 import bom_pb2, bom_pb2_grpc
 from volur.pork.demand.v1alpha2 import demand_pb2, demand_pb2_grpc
 from volur.pork.materials.v1alpha3 import material_pb2, material_pb2_grpc
+from volur.pork.product_inventory.v1alpha1 import (
+    product_inventory_pb2,
+    product_inventory_pb2_grpc,
+)
 from volur.pork.products.v1alpha3 import product_pb2, product_pb2_grpc
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class UploadStatistics:
+    """Statistics of an upload collected by the client.
+
+    Arguments:
+        read: A number of records read from a source.
+        sent: A number of records sent to the Völur API.
+        acknowledged: A number of successful responses of the Völur API.
+        rejected: A number of error responses of the Völur API.
+    """
+
+    read: int = field(default=0)
+    sent: int = field(default=0)
+    acknowledged: int = field(default=0)
+    rejected: int = field(default=0)
+
+
+_PARTITION_BUFFER_SIZE = 1024
+
+_BATCH_SIZE = 1024
+
+_COMPRESSION = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+
+class _StreamClosed(Exception):  # noqa: N818
+    """Raised when a stream of a partitioned upload closes before its end."""
+
+
+@runtime_checkable
+class BatchIterable(Protocol[T]):
+    """An iterator of entities which can also be read in batches.
+
+    The client reads such iterators with `aiter_batches`, so the cost of
+    awaiting the next entity is paid once per batch.
+    """
+
+    def aiter_batches(
+        self: "BatchIterable[T]",
+        size: int,
+    ) -> AsyncIterator[list[T]]: ...
+
+
+async def iter_batches(
+    entities: AsyncIterator[T],
+    size: int = _BATCH_SIZE,
+) -> AsyncIterator[list[T]]:
+    """Iterates over batches of entities.
+
+    Entities of iterators that do not support batches are passed on one by
+    one, so they are not held back until a batch is full.
+    """
+    if isinstance(entities, BatchIterable):
+        async for batch in entities.aiter_batches(size):
+            yield batch
+        return
+    async for entity in entities:
+        yield [entity]
+
+
+@dataclass
+class RateLimiter:
+    """A token bucket limiting a number of events per second.
+
+    Arguments:
+        rate: A maximum number of events per second.
+        burst: A maximum number of events let through at once after a pause.
+    """
+
+    rate: float
+    burst: float = field(default=1.0)
+    _next: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self: "RateLimiter") -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be more than 0")
+        self.burst = max(self.burst, 1.0)
+
+    async def acquire(self: "RateLimiter") -> None:
+        """Waits until the next event is allowed."""
+        now = time.monotonic()
+        self._next = max(self._next, now - (self.burst - 1) / self.rate)
+        delay = self._next - now
+        self._next += 1 / self.rate
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 
 @dataclass
 class VolurApiAsyncClient:
@@ -28,6 +131,8 @@ class VolurApiAsyncClient:
     async def upload_materials_information(
         self: "VolurApiAsyncClient",
         materials: AsyncIterator[material_pb2.Material],
+        streams: int = 1,
+        statistics: UploadStatistics | None = None,
     ) -> Status:
         """Uploads Materials Information to the Völur platform using the Völur
         API.
@@ -39,85 +144,27 @@ class VolurApiAsyncClient:
         Args:
             materials: a source of materials data to be uploaded to the Völur
                 platform.
+            streams: a number of concurrent streams used to upload the data.
+            statistics: statistics of the upload updated while uploading.
 
         Returns:
             The status of the operation.
         """
-
-        async def generate_requests() -> (
-            AsyncIterator[material_pb2.UploadMaterialInformationRequest]
-        ):
-            try:
-                async for material in materials:
-                    yield material_pb2.UploadMaterialInformationRequest(
-                        material=material,
-                    )
-            except Exception:
-                logger.exception(
-                    "error occurred while generating requests",
-                )
-
-        try:
-            logger.info("start uploading materials data")
-            channel = grpc.aio.secure_channel(
-                self.settings.address,
-                grpc.ssl_channel_credentials(),
-            )
-            stub = material_pb2_grpc.MaterialInformationServiceStub(channel)
-            requests = generate_requests()
-            stream = stub.UploadMaterialInformation(
-                requests,  # type: ignore[arg-type]
-                metadata=(
-                    (
-                        "authorization",
-                        f"Bearer {self.settings.token.get_secret_value()}",
-                    ),
-                ),
-            )
-            while True:
-                response = await stream.read()  # type: ignore[attr-defined]
-                if response == grpc.aio.EOF:  # type: ignore[attr-defined]
-                    logger.info("successfully uploaded materials information")
-                    break
-                if response.HasField("status"):
-                    if response.status.code != 0:
-                        logger.error(
-                            f"error occurred while uploading materials information "
-                            f"{response.status.code} {response.status.message}",
-                        )
-                    else:
-                        logger.debug(
-                            "successfully uploaded materials information",
-                        )
-                else:
-                    raise ValueError("response from a server does not contain status")
-            return Status(code=0)
-        except grpc.aio.AioRpcError as rpc_error:
-            if rpc_error.code() == grpc.StatusCode.UNAUTHENTICATED:
-                logger.error(
-                    "used token in invalid,"
-                    " please set a valid token using"
-                    " `VOLUR_API_TOKEN` environment variable",
-                )
-            else:
-                with logger.contextualize(
-                    rpc_error_code=rpc_error.code(),
-                    rpc_error_details=rpc_error.details(),
-                ):
-                    logger.exception(
-                        "error occurred while uploading materials information",
-                    )
-            code: int
-            code, _ = rpc_error.code().value  # type: ignore[misc]
-            message = _ if (_ := rpc_error.details()) else ""
-            return Status(
-                code=code,
-                message=message,
-            )
+        return await self._upload(
+            "materials",
+            material_pb2_grpc.MaterialInformationServiceStub,
+            lambda _: _.UploadMaterialInformation,
+            materials,
+            lambda _: material_pb2.UploadMaterialInformationRequest(material=_),
+            streams=streams,
+            statistics=statistics,
+        )
 
     async def upload_products_information(
         self: "VolurApiAsyncClient",
         products: AsyncIterator[product_pb2.Product],
+        streams: int = 1,
+        statistics: UploadStatistics | None = None,
     ) -> Status:
         """Uploads Products Information to the Völur platform using the Völur
         API.
@@ -129,85 +176,27 @@ class VolurApiAsyncClient:
         Args:
             products: an iterable of Product protos to be uploaded via API
                 platform.
+            streams: a number of concurrent streams used to upload the data.
+            statistics: statistics of the upload updated while uploading.
 
         Returns:
             The status of the operation.
         """
-
-        async def generate_requests() -> (
-            AsyncIterator[product_pb2.UploadProductInformationRequest]
-        ):
-            try:
-                async for product in products:
-                    yield product_pb2.UploadProductInformationRequest(
-                        product=product,
-                    )
-            except Exception:
-                logger.exception(
-                    "error occurred while generating requests",
-                )
-
-        try:
-            logger.info("start uploading products data")
-            channel = grpc.aio.secure_channel(
-                self.settings.address,
-                grpc.ssl_channel_credentials(),
-            )
-            stub = product_pb2_grpc.ProductInformationServiceStub(channel)
-            requests = generate_requests()
-            stream = stub.UploadProductInformation(
-                requests,  # type: ignore[arg-type]
-                metadata=(
-                    (
-                        "authorization",
-                        f"Bearer {self.settings.token.get_secret_value()}",
-                    ),
-                ),
-            )
-            while True:
-                response = await stream.read()  # type: ignore[attr-defined]
-                if response == grpc.aio.EOF:  # type: ignore[attr-defined]
-                    logger.info("successfully uploaded products information")
-                    break
-                if response.HasField("status"):
-                    if response.status.code != 0:
-                        logger.error(
-                            f"error occurred while uploading materials information "
-                            f"{response.status.code} {response.status.message}",
-                        )
-                    else:
-                        logger.debug(
-                            "successfully uploaded products information",
-                        )
-                else:
-                    raise ValueError("response from a server does not contain status")
-            return Status(code=0)
-        except grpc.aio.AioRpcError as rpc_error:
-            if rpc_error.code() == grpc.StatusCode.UNAUTHENTICATED:
-                logger.error(
-                    "used token in invalid,"
-                    " please set a valid token using"
-                    " `VOLUR_API_TOKEN` environment variable",
-                )
-            else:
-                with logger.contextualize(
-                    rpc_error_code=rpc_error.code(),
-                    rpc_error_details=rpc_error.details(),
-                ):
-                    logger.exception(
-                        "error occurred while uploading products information",
-                    )
-            code: int
-            code, _ = rpc_error.code().value  # type: ignore[misc]
-            message = _ if (_ := rpc_error.details()) else ""
-            return Status(
-                code=code,
-                message=message,
-            )
+        return await self._upload(
+            "products",
+            product_pb2_grpc.ProductInformationServiceStub,
+            lambda _: _.UploadProductInformation,
+            products,
+            lambda _: product_pb2.UploadProductInformationRequest(product=_),
+            streams=streams,
+            statistics=statistics,
+        )
 
     async def upload_demand_information(
         self: "VolurApiAsyncClient",
         demand: AsyncIterator[demand_pb2.Demand],
+        streams: int = 1,
+        statistics: UploadStatistics | None = None,
     ) -> Status:
         """Uploads Demand Information to the Völur platform using the Völur
         API.
@@ -219,65 +208,254 @@ class VolurApiAsyncClient:
         Args:
             demand: a source of demand data to be uploaded to the Völur
                 platform.
+            streams: a number of concurrent streams used to upload the data.
+            statistics: statistics of the upload updated while uploading.
+
+        Returns:
+            The status of the operation.
+        """
+        return await self._upload(
+            "demand",
+            demand_pb2_grpc.DemandInformationServiceStub,
+            lambda _: _.UploadDemandInformation,
+            demand,
+            lambda _: demand_pb2.UploadDemandInformationRequest(demand=_),
+            streams=streams,
+            statistics=statistics,
+        )
+
+    async def upload_product_inventory_information(
+        self: "VolurApiAsyncClient",
+        product_inventory: AsyncIterator[product_inventory_pb2.ProductInventory],
+        streams: int = 1,
+        statistics: UploadStatistics | None = None,
+    ) -> Status:
+        """Uploads Product Inventory Information to the Völur platform using
+        the Völur API.
+
+        This method is using a source to get the product inventory data and
+        then send it to the Völur API. This method is asynchronous and will
+        return a status of the operation.
+
+        Args:
+            product_inventory: a source of product inventory data to be
+                uploaded to the Völur platform.
+            streams: a number of concurrent streams used to upload the data.
+            statistics: statistics of the upload updated while uploading.
 
         Returns:
             The status of the operation.
         """
+        return await self._upload(
+            "product inventory",
+            product_inventory_pb2_grpc.ProductInventoryInformationServiceStub,
+            lambda _: _.UploadProductInventoryInformation,
+            product_inventory,
+            lambda _: product_inventory_pb2.UploadProductInventoryInformationRequest(
+                product_inventory=_,
+            ),
+            streams=streams,
+            statistics=statistics,
+        )
+
+    async def upload_bom_information(
+        self: "VolurApiAsyncClient",
+        bom: AsyncIterator[bom_pb2.Bom],
+        streams: int = 1,
+        statistics: UploadStatistics | None = None,
+    ) -> Status:
+        """Uploads Bill of Materials Information to the Völur platform using
+        the Völur API.
+
+        This method is using a source to get the bill of materials data and
+        then send it to the Völur API. This method is asynchronous and will
+        return a status of the operation.
 
-        async def generate_requests() -> (
-            AsyncIterator[demand_pb2.UploadDemandInformationRequest]
-        ):
+        With more than one stream, entries are partitioned by their plant, so
+        plants are uploaded concurrently while all entries of a plant are sent
+        over the same stream in the order of the source.
+
+        Args:
+            bom: a source of bill of materials data to be uploaded to the
+                Völur platform.
+            streams: a number of concurrent streams used to upload the data.
+            statistics: statistics of the upload updated while uploading.
+
+        Returns:
+            The status of the operation.
+        """
+        return await self._upload(
+            "bom",
+            bom_pb2_grpc.BomInformationServiceStub,
+            lambda _: _.UploadBomInformation,
+            bom,
+            lambda _: bom_pb2.UploadBomInformationRequest(bom=_),
+            streams=streams,
+            statistics=statistics,
+            partition=lambda _: _.plant,
+        )
+
+    async def _upload(
+        self: "VolurApiAsyncClient",
+        name: str,
+        stub: Callable[[grpc.aio.Channel], Any],
+        method: Callable[[Any], Any],
+        entities: AsyncIterator[T],
+        to_request: Callable[[T], R],
+        streams: int = 1,
+        statistics: UploadStatistics | None = None,
+        partition: Callable[[T], str] | None = None,
+    ) -> Status:
+        """Uploads entities over one channel using one or more streams.
+
+        All streams share the same iterator of entities, so every entity is
+        sent exactly once. With `partition`, entities are instead routed to
+        streams by a hash of their partition key, so entities of the same
+        partition are sent over the same stream in order. An error raised by
+        the iterator stops the upload and is reported as an `ABORTED` status.
+        Entities are read in batches, see `iter_batches`.
+        """
+        if streams <= 0:
+            raise ValueError("number of streams must be more than 0")
+        if statistics is None:
+            statistics = UploadStatistics()
+        errors: list[Exception] = []
+        lock = asyncio.Lock()
+        batches = iter_batches(entities)
+        buffer: collections.deque[T] = collections.deque()
+        limiter = (
+            RateLimiter(self.settings.rate_limit, burst=self.settings.rate_limit)
+            if self.settings.rate_limit is not None
+            else None
+        )
+
+        queues: list[asyncio.Queue[T | None]] = []
+        # streams which have received all entities of their partitions
+        ended: set[int] = set()
+        if partition is not None and streams > 1:
+            queues = [
+                asyncio.Queue(maxsize=_PARTITION_BUFFER_SIZE) for _ in range(streams)
+            ]
+
+        async def dispatch(partition: Callable[[T], str]) -> None:
             try:
-                async for dem in demand:
-                    yield demand_pb2.UploadDemandInformationRequest(
-                        demand=dem,
-                    )
-            except Exception:
+                async for batch in batches:
+                    statistics.read += len(batch)
+                    for entity in batch:
+                        index = zlib.crc32(partition(entity).encode()) % streams
+                        await queues[index].put(entity)
+            except Exception as error:
+                errors.append(error)
                 logger.exception(
                     "error occurred while generating requests",
                 )
+            for queue in queues:
+                await queue.put(None)
 
-        try:
-            logger.info("start uploading demand data")
-            channel = grpc.aio.secure_channel(
-                self.settings.address,
-                grpc.ssl_channel_credentials(),
-            )
-            stub = demand_pb2_grpc.DemandInformationServiceStub(channel)
-            requests = generate_requests()
-            stream = stub.UploadDemandInformation(
-                requests,  # type: ignore[arg-type]
+        async def read_entity() -> T | None:
+            while not buffer:
+                batch = await anext(batches, None)
+                if batch is None:
+                    return None
+                statistics.read += len(batch)
+                buffer.extend(batch)
+            return buffer.popleft()
+
+        async def next_entity(index: int) -> T | None:
+            if queues:
+                return await queues[index].get()
+            if buffer:
+                return buffer.popleft()
+            if streams == 1:
+                return await read_entity()
+            async with lock:
+                return await read_entity()
+
+        async def generate_requests(index: int) -> AsyncIterator[R]:
+            try:
+                while True:
+                    entity = await next_entity(index)
+                    if entity is None:
+                        ended.add(index)
+                        break
+                    if limiter is not None:
+                        await limiter.acquire()
+                    yield to_request(entity)
+                    statistics.sent += 1
+            except Exception as error:
+                errors.append(error)
+                logger.exception(
+                    "error occurred while generating requests",
+                )
+
+        async def upload(call: Any, index: int) -> None:  # noqa: ANN401
+            stream = call(
+                generate_requests(index),
                 metadata=(
                     (
                         "authorization",
                         f"Bearer {self.settings.token.get_secret_value()}",
                     ),
                 ),
+                compression=_COMPRESSION[self.settings.compression],
             )
             while True:
-                response = await stream.read()  # type: ignore[attr-defined]
+                response = await stream.read()
                 if response == grpc.aio.EOF:  # type: ignore[attr-defined]
-                    logger.info("successfully uploaded demand information")
                     break
                 if response.HasField("status"):
                     if response.status.code != 0:
+                        statistics.rejected += 1
                         logger.error(
-                            f"error occurred while uploading demand information "
+                            f"error occurred while uploading {name} information "
                             f"{response.status.code} {response.status.message}",
                         )
                     else:
+                        statistics.acknowledged += 1
                         logger.debug(
-                            "successfully uploaded demand information",
+                            f"successfully uploaded {name} information",
                         )
                 else:
                     raise ValueError("response from a server does not contain status")
+            if queues and index not in ended:
+                # the dispatcher would wait forever for room in the queue of
+                # this stream, so the whole upload is stopped
+                if not errors:
+                    errors.append(
+                        _StreamClosed(f"stream {index} has closed before its end")
+                    )
+                raise _StreamClosed()
+
+        try:
+            logger.info(f"start uploading {name} data")
+            async with grpc.aio.secure_channel(
+                self.settings.address,
+                grpc.ssl_channel_credentials(),
+            ) as channel:
+                call = method(stub(channel))
+                tasks = [asyncio.create_task(upload(call, _)) for _ in range(streams)]
+                if queues and partition is not None:
+                    tasks.append(asyncio.create_task(dispatch(partition)))
+                try:
+                    await asyncio.gather(*tasks)
+                except _StreamClosed:
+                    pass
+                finally:
+                    for task in tasks:
+                        task.cancel()
+            if errors:
+                return Status(
+                    code=grpc.StatusCode.ABORTED.value[0],
+                    message=f"error occurred while generating requests: {errors[0]}",
+                )
+            logger.info(f"successfully uploaded {name} information")
             return Status(code=0)
         except grpc.aio.AioRpcError as rpc_error:
             if rpc_error.code() == grpc.StatusCode.UNAUTHENTICATED:
                 logger.error(
                     "used token in invalid,"
-                    "please set a valid token using"
-                    "`VOLUR_API_TOKEN` environment variable",
+                    " please set a valid token using"
+                    " `VOLUR_API_TOKEN` environment variable",
                 )
             else:
                 with logger.contextualize(
@@ -285,10 +463,10 @@ class VolurApiAsyncClient:
                     rpc_error_details=rpc_error.details(),
                 ):
                     logger.exception(
-                        "error occurred while uploading demand information",
+                        f"error occurred while uploading {name} information",
                     )
             code: int
-            code, _ = rpc_error.code().value  # type: ignore[misc]
+            code, _ = rpc_error.code().value
             message = _ if (_ := rpc_error.details()) else ""
             return Status(
                 code=code,
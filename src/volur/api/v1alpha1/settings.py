@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -13,6 +15,12 @@ class VolurApiSettings(BaseSettings):
     - `VOLUR_API_ADDRESS`: Address of the Völur API server,
     - `VOLUR_API_TOKEN`: Token for authenticating to the Völur API server.
 
+    Optionally, uploads can be tuned with:
+
+    - `VOLUR_API_COMPRESSION`: Compression of uploaded data, `gzip` or
+      `deflate`,
+    - `VOLUR_API_RATE_LIMIT`: Maximum number of records uploaded per second.
+
     Please contact Völur to obtain the endpoint address and the token.
 
     Examples:
@@ -32,3 +40,12 @@ class VolurApiSettings(BaseSettings):
         False,
         description="Enable debug mode",
     )
+    compression: Literal["none", "gzip", "deflate"] = Field(
+        "none",
+        description="Compression of uploaded data",
+    )
+    rate_limit: float | None = Field(
+        None,
+        gt=0,
+        description="Maximum number of records uploaded per second",
+    )
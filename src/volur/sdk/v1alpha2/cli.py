@@ -0,0 +1,260 @@
+"""A command-line interface of the Völur SDK.
+
+The interface uploads data described by a
+[config][volur.sdk.v1alpha2.sources.config] and exposes options tuning the
+upload, so uploads can be run and tuned without writing Python code:
+
+```shell
+volur upload materials.toml exports/materials-*.csv --streams 4 --compression gzip
+```
+"""
+
+import argparse
+import asyncio
+import glob
+import pathlib
+import sys
+import time
+from typing import Any, Sequence
+
+from volur.api.v1alpha1.client import VolurApiAsyncClient
+from volur.api.v1alpha1.settings import VolurApiSettings
+from volur.sdk.v1alpha2.client import VolurClient, check
+from volur.sdk.v1alpha2.progress import ProgressBar, ProgressTracker, log_progress
+from volur.sdk.v1alpha2.report import UploadListener, UploadReport
+from volur.sdk.v1alpha2.sources.config import SourceConfig, load_config
+from volur.sdk.v1alpha2.sources.csv.base import Source
+from volur.sdk.v1alpha2.sources.delta import DeltaSource, default_key, digest
+from volur.sdk.v1alpha2.sources.files import MultiFileSource
+
+
+def _positive_int(value: str) -> int:
+    if (_ := int(value)) <= 0:
+        raise argparse.ArgumentTypeError(f"{value} must be more than 0")
+    return _
+
+
+def _positive_float(value: str) -> float:
+    if (_ := float(value)) <= 0:
+        raise argparse.ArgumentTypeError(f"{value} must be more than 0")
+    return _
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns a parser of command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="volur",
+        description="Uploads data to the Völur platform.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    upload = commands.add_parser(
+        "upload",
+        help="upload data described by a config",
+        description="Uploads data described by a config. The address and the"
+        " token of the Völur API are read from VOLUR_API_ADDRESS and"
+        " VOLUR_API_TOKEN environment variables.",
+    )
+    upload.add_argument(
+        "config",
+        type=pathlib.Path,
+        help="a TOML or YAML config of a source",
+    )
+    upload.add_argument(
+        "inputs",
+        nargs="*",
+        help="input files or glob patterns used instead of the path of the config",
+    )
+    upload.add_argument(
+        "--streams",
+        type=_positive_int,
+        default=1,
+        help="a number of concurrent upload streams (default: %(default)s)",
+    )
+    upload.add_argument(
+        "--parse-workers",
+        type=_positive_int,
+        default=1,
+        help="a number of input files read concurrently (default: %(default)s)",
+    )
+    upload.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        help="a number of rows read at once by sources supporting it",
+    )
+    upload.add_argument(
+        "--compression",
+        choices=["none", "gzip", "deflate"],
+        help="a compression of uploaded data",
+    )
+    upload.add_argument(
+        "--rate-limit",
+        type=_positive_float,
+        metavar="RECORDS_PER_SECOND",
+        help="a maximum number of records uploaded per second",
+    )
+    upload.add_argument(
+        "--resume",
+        type=pathlib.Path,
+        metavar="STATE",
+        help="a state file used to skip records uploaded by previous runs",
+    )
+    upload.add_argument(
+        "--progress",
+        choices=["none", "log", "bar"],
+        help="how to report progress (default: bar on a terminal, log otherwise)",
+    )
+    upload.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="check and convert the data without uploading it",
+    )
+    upload.add_argument(
+        "--cache-directory",
+        type=pathlib.Path,
+        help="a directory caching validated configs",
+    )
+    return parser
+
+
+def _expand(inputs: Sequence[str]) -> list[pathlib.Path]:
+    paths: list[pathlib.Path] = []
+    for _ in inputs:
+        matches = sorted(glob.glob(_, recursive=True))
+        paths.extend(pathlib.Path(path) for path in matches or [_])
+    return paths
+
+
+def _create_source(
+    config: SourceConfig,
+    paths: list[pathlib.Path],
+    parse_workers: int,
+) -> Source[Any]:
+    def create(path: pathlib.Path) -> Source[Any]:
+        return config.model_copy(update={"path": str(path)}).compile()
+
+    if not paths:
+        return config.compile()
+    if len(paths) == 1:
+        return create(paths[0])
+    return MultiFileSource(paths, source=create, concurrency=parse_workers)
+
+
+def _content_key(message: Any) -> str:  # noqa: ANN401
+    # only materials and products have a natural key, other records are
+    # identified by their content
+    return digest(message).hex()
+
+
+def _progress(kind: str | None) -> ProgressTracker | None:
+    if kind is None:
+        kind = "bar" if sys.stderr.isatty() else "log"
+    if kind == "bar":
+        return ProgressTracker([ProgressBar()], interval=0.5)
+    if kind == "log":
+        return ProgressTracker([log_progress], interval=10.0)
+    return None
+
+
+def _summary(report: UploadReport, verb: str) -> str:
+    summary = (
+        f"{verb} {report.sent} records in {report.elapsed:.2f} s"
+        f" ({report.throughput:,.1f} records/s)"
+    )
+    if report.rejected:
+        summary += f", {report.rejected} records rejected"
+    if report.skipped:
+        summary += f", {report.skipped} unchanged records skipped"
+    if report.duplicates:
+        summary += f", {report.duplicates} duplicates dropped"
+    if report.deleted:
+        summary += f", {report.deleted} records deleted"
+    if report.invalid:
+        summary += f", {report.invalid} invalid rows dropped"
+    return summary
+
+
+async def _convert(source: Source[Any]) -> int:
+    count = 0
+    async for batch in source.aiter_batches():
+        count += len(batch)
+    return count
+
+
+def _dry_run(
+    config: SourceConfig,
+    paths: list[pathlib.Path],
+    source: Source[Any],
+) -> UploadReport:
+    if config.format == "csv":
+        for path in paths or [pathlib.Path(config.path)]:
+            check(config.model_copy(update={"path": str(path)}).compile())
+    started = time.perf_counter()
+    sent = asyncio.run(_convert(source))
+    report = UploadReport(sent=sent, elapsed=time.perf_counter() - started)
+    if isinstance(source, UploadListener):
+        source.upload_finished(report)
+    return report
+
+
+def upload(arguments: argparse.Namespace) -> int:
+    """Runs the `upload` command and returns an exit status."""
+    config = load_config(arguments.config, arguments.cache_directory)
+    if arguments.batch_size is not None:
+        config = SourceConfig.model_validate(
+            {
+                **config.model_dump(),
+                "options": {**config.options, "batch_size": arguments.batch_size},
+            }
+        )
+    paths = _expand(arguments.inputs)
+    source = _create_source(config, paths, arguments.parse_workers)
+    if arguments.dry_run:
+        report = _dry_run(config, paths, source)
+        print(_summary(report, "converted"))
+    else:
+        if arguments.resume is not None:
+            natural = config.entity in ("materials", "products")
+            source = DeltaSource(
+                source,
+                store=arguments.resume,
+                namespace=config.entity,
+                key=default_key if natural else _content_key,
+                resume=True,
+                # keys of records identified by their content change with
+                # the content, so keys of previous contents are removed
+                prune=not natural,
+            )
+        overrides: dict[str, Any] = {}
+        if arguments.compression is not None:
+            overrides["compression"] = arguments.compression
+        if arguments.rate_limit is not None:
+            overrides["rate_limit"] = arguments.rate_limit
+        client = VolurClient(
+            api=VolurApiAsyncClient(settings=VolurApiSettings(**overrides)),
+        )
+        report = getattr(client, f"upload_{config.entity}_information")(
+            source,
+            streams=arguments.streams,
+            progress=_progress(arguments.progress),
+        )
+        print(_summary(report, "uploaded"))
+        if not report.ok:
+            print(f"upload failed: {report.code} {report.message}", file=sys.stderr)
+    failed = [_ for _ in report.files.values() if not _.ok]
+    for file in failed:
+        print(f"failed to read {file.path}: {file.error}", file=sys.stderr)
+    return 0 if report.ok and not failed else 1
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the command-line interface."""
+    arguments = build_parser().parse_args(argv)
+    try:
+        return upload(arguments)
+    except (ValueError, OSError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,45 @@
 import asyncio
+import time
 from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Coroutine, TypeVar
 
+from google.rpc.status_pb2 import Status
 from loguru import logger
 
-from volur.api.v1alpha1.client import VolurApiAsyncClient
-from volur.sdk.v1alpha2.sources import DemandSource, MaterialsSource, ProductsSource
+from volur.api.v1alpha1.client import UploadStatistics, VolurApiAsyncClient
+from volur.pork.bom.v1alpha1 import bom_pb2
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.product_inventory.v1alpha1 import product_inventory_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+from volur.sdk.v1alpha2.progress import ProgressTracker
+from volur.sdk.v1alpha2.report import UploadListener, UploadReport
+from volur.sdk.v1alpha2.sources import Source
+from volur.sdk.v1alpha2.sources.csv import CSVFileSource
+from volur.sdk.v1alpha2.sources.csv.preflight import preflight as run_preflight
+
+T = TypeVar("T")
+
+
+def check(source: Source[T]) -> None:
+    """Runs the pre-flight check of a CSV source or a source wrapping it.
+
+    Raises:
+        ValueError: if the check has found a problem or the source does not
+            support it.
+    """
+    inner: object = source
+    while not isinstance(inner, CSVFileSource):
+        if not isinstance(_ := getattr(inner, "source", None), Source):
+            raise ValueError("pre-flight check is supported only by CSV file sources")
+        inner = _
+    report = run_preflight(inner)
+    logger.info(
+        "pre-flight check finished",
+        rows=report.rows,
+        columns={str(_.column_id): _.inferred_type for _ in report.columns},
+    )
+    report.raise_for_problems()
 
 
 @dataclass
@@ -33,47 +68,217 @@ class VolurClient:
 
     def upload_materials_information(
         self: "VolurClient",
-        materials: MaterialsSource,
-    ) -> None:
-        result = asyncio.run(
-            self.api.upload_materials_information(materials),
-            debug=self.api.settings.debug,
+        materials: Source[material_pb2.Material],
+        streams: int = 1,
+        preflight: bool = False,
+        progress: ProgressTracker | None = None,
+    ) -> UploadReport:
+        """Uploads materials from a source.
+
+        Args:
+            materials: a source of materials.
+            streams: a number of concurrent streams used to upload the data.
+            preflight: whether to check the source on a sample of its rows
+                before the upload, see
+                [preflight][volur.sdk.v1alpha2.sources.csv.preflight.preflight].
+            progress: a tracker reporting progress of the upload.
+
+        Returns:
+            A report of the upload.
+        """
+        return self._upload(
+            "materials",
+            self.api.upload_materials_information,
+            materials,
+            streams,
+            preflight,
+            progress,
         )
-        if result.code != 0:
-            logger.error(
-                "error occurred while uploading materials information",
-                response_status_code=result.code,
-                response_status_message=result.message,
-            )
 
     def upload_products_information(
         self: "VolurClient",
-        products: ProductsSource,
-    ) -> None:
-        result = asyncio.run(
-            self.api.upload_products_information(products),
-            debug=self.api.settings.debug,
+        products: Source[product_pb2.Product],
+        streams: int = 1,
+        preflight: bool = False,
+        progress: ProgressTracker | None = None,
+    ) -> UploadReport:
+        """Uploads products from a source.
+
+        Args:
+            products: a source of products.
+            streams: a number of concurrent streams used to upload the data.
+            preflight: whether to check the source on a sample of its rows
+                before the upload, see
+                [preflight][volur.sdk.v1alpha2.sources.csv.preflight.preflight].
+            progress: a tracker reporting progress of the upload.
+
+        Returns:
+            A report of the upload.
+        """
+        return self._upload(
+            "products",
+            self.api.upload_products_information,
+            products,
+            streams,
+            preflight,
+            progress,
         )
-        if result.code != 0:
-            logger.error(
-                "error occurred while uploading products information",
-                response_status_code=result.code,
-                response_status_message=result.message,
-            )
-        logger.info("successfully uploaded products information")
 
     def upload_demand_information(
         self: "VolurClient",
-        demand: DemandSource,
-    ) -> None:
-        result = asyncio.run(
-            self.api.upload_demand_information(demand),
-            debug=self.api.settings.debug,
+        demand: Source[demand_pb2.Demand],
+        streams: int = 1,
+        preflight: bool = False,
+        progress: ProgressTracker | None = None,
+    ) -> UploadReport:
+        """Uploads demand from a source.
+
+        Args:
+            demand: a source of demand.
+            streams: a number of concurrent streams used to upload the data.
+            preflight: whether to check the source on a sample of its rows
+                before the upload, see
+                [preflight][volur.sdk.v1alpha2.sources.csv.preflight.preflight].
+            progress: a tracker reporting progress of the upload.
+
+        Returns:
+            A report of the upload.
+        """
+        return self._upload(
+            "demand",
+            self.api.upload_demand_information,
+            demand,
+            streams,
+            preflight,
+            progress,
+        )
+
+    def upload_product_inventory_information(
+        self: "VolurClient",
+        product_inventory: Source[product_inventory_pb2.ProductInventory],
+        streams: int = 1,
+        preflight: bool = False,
+        progress: ProgressTracker | None = None,
+    ) -> UploadReport:
+        """Uploads product inventory from a source.
+
+        Args:
+            product_inventory: a source of product inventory.
+            streams: a number of concurrent streams used to upload the data.
+            preflight: whether to check the source on a sample of its rows
+                before the upload, see
+                [preflight][volur.sdk.v1alpha2.sources.csv.preflight.preflight].
+            progress: a tracker reporting progress of the upload.
+
+        Returns:
+            A report of the upload.
+        """
+        return self._upload(
+            "product inventory",
+            self.api.upload_product_inventory_information,
+            product_inventory,
+            streams,
+            preflight,
+            progress,
+        )
+
+    def upload_bom_information(
+        self: "VolurClient",
+        bom: Source[bom_pb2.Bom],
+        streams: int = 1,
+        preflight: bool = False,
+        progress: ProgressTracker | None = None,
+    ) -> UploadReport:
+        """Uploads bill of materials from a source.
+
+        With more than one stream, plants are uploaded concurrently and all
+        entries of a plant are sent over the same stream.
+
+        Args:
+            bom: a source of bill of materials.
+            streams: a number of concurrent streams used to upload the data.
+            preflight: whether to check the source on a sample of its rows
+                before the upload, see
+                [preflight][volur.sdk.v1alpha2.sources.csv.preflight.preflight].
+            progress: a tracker reporting progress of the upload.
+
+        Returns:
+            A report of the upload.
+        """
+        return self._upload(
+            "bom",
+            self.api.upload_bom_information,
+            bom,
+            streams,
+            preflight,
+            progress,
         )
-        if result.code != 0:
+
+    def _upload(
+        self: "VolurClient",
+        name: str,
+        upload: Callable[
+            [AsyncIterator[T], int, UploadStatistics],
+            Coroutine[Any, Any, Status],
+        ],
+        source: Source[T],
+        streams: int,
+        preflight: bool = False,
+        progress: ProgressTracker | None = None,
+    ) -> UploadReport:
+        if preflight:
+            check(source)
+        statistics = UploadStatistics()
+        started = time.perf_counter()
+
+        async def run() -> Status:
+            if progress is None:
+                return await upload(source, streams, statistics)
+            tracking = asyncio.create_task(
+                progress.track(source, statistics, started),
+            )
+            try:
+                return await upload(source, streams, statistics)
+            finally:
+                tracking.cancel()
+
+        result = asyncio.run(run(), debug=self.api.settings.debug)
+        if progress is not None:
+            progress.emit(
+                progress.sample(source, statistics, started, finished=True),
+            )
+        report = UploadReport(
+            code=result.code,
+            message=result.message,
+            sent=statistics.sent,
+            acknowledged=statistics.acknowledged,
+            rejected=statistics.rejected,
+            streams=streams,
+            elapsed=time.perf_counter() - started,
+        )
+        if isinstance(source, UploadListener):
+            source.upload_finished(report)
+        for file in report.files.values():
+            if not file.ok:
+                logger.error(
+                    f"error occurred while reading {file.path}",
+                    error=file.error,
+                )
+        if report.code != 0:
             logger.error(
-                "error occurred while uploading demand information",
-                response_status_code=result.code,
-                response_status_message=result.message,
+                f"error occurred while uploading {name} information",
+                response_status_code=report.code,
+                response_status_message=report.message,
+            )
+        else:
+            logger.info(
+                f"successfully uploaded {name} information",
+                sent=report.sent,
+                rejected=report.rejected,
+                skipped=report.skipped,
+                deleted=report.deleted,
+                duplicates=report.duplicates,
+                invalid=report.invalid,
+                elapsed=report.elapsed,
             )
-        logger.info("successfully uploaded demand information")
+        return report
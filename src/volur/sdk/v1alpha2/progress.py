@@ -0,0 +1,231 @@
+"""A package that contains progress reporting of uploads.
+
+Progress is sampled at a fixed interval by a background task instead of being
+reported by every record, so reporting costs nothing per record. The
+completion and the remaining time of an upload are estimated from byte
+offsets of files read by a source, so no pass counting rows is needed.
+"""
+
+import asyncio
+import io
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import IO, Any, Callable, Protocol, Sequence, TextIO, runtime_checkable
+
+from loguru import logger
+
+from volur.api.v1alpha1.client import UploadStatistics
+
+
+@runtime_checkable
+class Measurable(Protocol):
+    """A source reporting how many bytes of its input it has read."""
+
+    @property
+    def bytes_consumed(self: "Measurable") -> int | None: ...
+
+    @property
+    def bytes_total(self: "Measurable") -> int | None: ...
+
+
+@dataclass
+class FileProgress:
+    """A mixin of sources measuring progress by the offset in a file.
+
+    Sources set `_file` to the file they read and `_file_size` to its size.
+    """
+
+    _file: IO[Any] | io.IOBase | None = field(default=None, init=False, repr=False)
+    _file_size: int | None = field(default=None, init=False, repr=False)
+
+    def _track(self: "FileProgress", file: IO[Any] | io.IOBase) -> None:
+        self._file = file
+        self._file_size = None
+        try:
+            self._file_size = os.fstat(file.fileno()).st_size
+        except (OSError, AttributeError, ValueError):
+            if file.seekable():
+                position = file.tell()
+                self._file_size = file.seek(0, os.SEEK_END)
+                file.seek(position)
+
+    @property
+    def bytes_consumed(self: "FileProgress") -> int | None:
+        if self._file is None:
+            return None
+        file = getattr(self._file, "buffer", self._file)
+        try:
+            return int(file.tell())
+        except (OSError, ValueError):
+            return self._file_size if self._file.closed else None
+
+    @property
+    def bytes_total(self: "FileProgress") -> int | None:
+        return self._file_size
+
+
+def find_measurable(source: Any) -> Measurable | None:  # noqa: ANN401
+    """Returns a source measuring its progress, looking inside wrappers."""
+    while source is not None:
+        if isinstance(source, Measurable):
+            return source
+        source = getattr(source, "source", None)
+    return None
+
+
+@dataclass
+class Progress:
+    """A progress of an upload.
+
+    Arguments:
+        read: A number of records read from a source.
+        sent: A number of records sent to the Völur API.
+        acknowledged: A number of successful responses of the Völur API.
+        bytes_consumed: A number of bytes read from input files, if known.
+        bytes_total: A total size of input files, if known.
+        elapsed: A duration of the upload in seconds.
+        finished: Whether the upload has finished.
+    """
+
+    read: int = field(default=0)
+    sent: int = field(default=0)
+    acknowledged: int = field(default=0)
+    bytes_consumed: int | None = field(default=None)
+    bytes_total: int | None = field(default=None)
+    elapsed: float = field(default=0.0)
+    finished: bool = field(default=False)
+
+    @property
+    def fraction(self: "Progress") -> float | None:
+        """A completed fraction of the upload, if known."""
+        if self.finished:
+            return 1.0
+        if not self.bytes_total or self.bytes_consumed is None:
+            return None
+        return min(self.bytes_consumed / self.bytes_total, 1.0)
+
+    @property
+    def eta(self: "Progress") -> float | None:
+        """An estimated number of seconds until the upload finishes."""
+        fraction = self.fraction
+        if fraction is None or fraction <= 0:
+            return None
+        return self.elapsed * (1 - fraction) / fraction
+
+    @property
+    def throughput(self: "Progress") -> float:
+        """A number of records sent per second."""
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ProgressSink = Callable[[Progress], None]
+
+
+def _duration(seconds: float | None) -> str:
+    if seconds is None:
+        return "--:--:--"
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def log_progress(progress: Progress) -> None:
+    """A sink writing progress to the log."""
+    logger.info(
+        "upload progress",
+        read=progress.read,
+        sent=progress.sent,
+        acknowledged=progress.acknowledged,
+        percent=round(100 * fraction, 1)
+        if (fraction := progress.fraction) is not None
+        else None,
+        throughput=round(progress.throughput, 1),
+        eta=_duration(progress.eta),
+    )
+
+
+@dataclass
+class ProgressBar:
+    """A sink drawing a progress bar on a terminal.
+
+    Arguments:
+        stream: A stream to draw the bar to.
+        width: A width of the bar in characters.
+    """
+
+    stream: TextIO = field(default_factory=lambda: sys.stderr)
+    width: int = field(default=30)
+
+    def __call__(self: "ProgressBar", progress: Progress) -> None:
+        fraction = progress.fraction
+        if fraction is None:
+            bar = "?" * self.width
+            percent = "  ?.?%"
+        else:
+            done = int(fraction * self.width)
+            bar = "#" * done + "-" * (self.width - done)
+            percent = f"{100 * fraction:5.1f}%"
+        self.stream.write(
+            f"\r[{bar}] {percent} {progress.sent:,} records"
+            f" {progress.throughput:,.0f}/s ETA {_duration(progress.eta)}"
+        )
+        if progress.finished:
+            self.stream.write("\n")
+        self.stream.flush()
+
+
+@dataclass
+class ProgressTracker:
+    """Emits progress of an upload to sinks at a fixed interval.
+
+    Arguments:
+        sinks: Functions receiving progress, for example `log_progress` or
+            `ProgressBar()`.
+        interval: A number of seconds between emitted progress.
+    """
+
+    sinks: Sequence[ProgressSink] = field(default_factory=lambda: [log_progress])
+    interval: float = field(default=1.0)
+
+    def __post_init__(self: "ProgressTracker") -> None:
+        if self.interval <= 0:
+            raise ValueError("interval must be more than 0")
+
+    def sample(
+        self: "ProgressTracker",
+        source: Any,  # noqa: ANN401
+        statistics: UploadStatistics,
+        started: float,
+        finished: bool = False,
+    ) -> Progress:
+        """Returns the current progress of an upload."""
+        measurable = find_measurable(source)
+        return Progress(
+            read=statistics.read,
+            sent=statistics.sent,
+            acknowledged=statistics.acknowledged,
+            bytes_consumed=measurable.bytes_consumed if measurable else None,
+            bytes_total=measurable.bytes_total if measurable else None,
+            elapsed=time.perf_counter() - started,
+            finished=finished,
+        )
+
+    def emit(self: "ProgressTracker", progress: Progress) -> None:
+        for sink in self.sinks:
+            try:
+                sink(progress)
+            except Exception:
+                logger.exception("error occurred while reporting progress")
+
+    async def track(
+        self: "ProgressTracker",
+        source: Any,  # noqa: ANN401
+        statistics: UploadStatistics,
+        started: float,
+    ) -> None:
+        """Emits progress until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            self.emit(self.sample(source, statistics, started))
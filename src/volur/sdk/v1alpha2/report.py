@@ -0,0 +1,84 @@
+"""A package that contains reports of uploads."""
+
+from dataclasses import dataclass, field
+from typing import Protocol, runtime_checkable
+
+
+@dataclass
+class FileReport:
+    """A report of a single file read during an upload.
+
+    Arguments:
+        path: A path to the file.
+        records: A number of records read from the file.
+        invalid: A number of rows of the file dropped because they can not be
+            converted.
+        error: A description of an error that stopped reading the file.
+    """
+
+    path: str
+    records: int = field(default=0)
+    invalid: int = field(default=0)
+    error: str | None = field(default=None)
+
+    @property
+    def ok(self: "FileReport") -> bool:
+        return self.error is None
+
+
+@dataclass
+class UploadReport:
+    """A report of an upload returned by the client.
+
+    Arguments:
+        code: A status code of the upload, `0` means success.
+        message: A status message of the upload.
+        sent: A number of records sent to the Völur API.
+        acknowledged: A number of successful responses of the Völur API.
+        rejected: A number of error responses of the Völur API.
+        streams: A number of concurrent streams used by the upload.
+        skipped: A number of records skipped because they have not changed.
+        deleted: A number of records deleted from the source.
+        duplicates: A number of records dropped as duplicates.
+        invalid: A number of rows dropped because they can not be converted,
+            see the `on_error` argument of sources.
+        lookup_hits: A number of records found in lookup tables, see `Enrich`.
+        lookup_misses: A number of records not found in lookup tables.
+        elapsed: A duration of the upload in seconds.
+        files: Reports of all files read during the upload.
+    """
+
+    code: int = field(default=0)
+    message: str = field(default="")
+    sent: int = field(default=0)
+    acknowledged: int = field(default=0)
+    rejected: int = field(default=0)
+    streams: int = field(default=1)
+    skipped: int = field(default=0)
+    deleted: int = field(default=0)
+    duplicates: int = field(default=0)
+    invalid: int = field(default=0)
+    lookup_hits: int = field(default=0)
+    lookup_misses: int = field(default=0)
+    elapsed: float = field(default=0.0)
+    files: dict[str, FileReport] = field(default_factory=dict)
+
+    @property
+    def ok(self: "UploadReport") -> bool:
+        return self.code == 0
+
+    @property
+    def throughput(self: "UploadReport") -> float:
+        """A number of records sent per second."""
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@runtime_checkable
+class UploadListener(Protocol):
+    """A source that is notified when its upload has finished.
+
+    Sources implementing this protocol can add their own information to the
+    report or act on the result of the upload.
+    """
+
+    def upload_finished(self: "UploadListener", report: UploadReport) -> None: ...
@@ -1,7 +1,17 @@
-from .csv import DemandSource, MaterialsSource, ProductsSource
+from .csv import (
+    BomSource,
+    DemandSource,
+    MaterialsSource,
+    ProductInventorySource,
+    ProductsSource,
+    Source,
+)
 
 __all__ = [
+    "Source",
     "MaterialsSource",
     "ProductsSource",
     "DemandSource",
+    "ProductInventorySource",
+    "BomSource",
 ]
@@ -0,0 +1,25 @@
+from .source import (
+    ArrowFileSource,
+    DemandArrowFileSource,
+    DemandParquetFileSource,
+    MaterialsArrowFileSource,
+    MaterialsParquetFileSource,
+    ParquetFileSource,
+    ProductsArrowFileSource,
+    ProductsParquetFileSource,
+    RecordBatchFileSource,
+    RecordBatchSource,
+)
+
+__all__ = [
+    "ArrowFileSource",
+    "DemandArrowFileSource",
+    "DemandParquetFileSource",
+    "MaterialsArrowFileSource",
+    "MaterialsParquetFileSource",
+    "ParquetFileSource",
+    "ProductsArrowFileSource",
+    "ProductsParquetFileSource",
+    "RecordBatchFileSource",
+    "RecordBatchSource",
+]
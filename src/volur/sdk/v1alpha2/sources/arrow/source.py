@@ -0,0 +1,335 @@
+"""A package that contains implementation of Apache Parquet and Arrow sources.
+
+These sources read typed record batches instead of text. Only the configured
+columns are read from a file and values are passed to the columns with their
+native types, so there is no round-trip through strings.
+"""
+
+import abc
+import contextlib
+import io
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generator, Iterator, TypeVar
+
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+
+from ..core import RowSource
+from ..csv.base import DemandSource, MaterialsSource, ProductsSource
+from ..mapping import DemandMapping, MaterialsMapping, ProductsMapping
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "pyarrow is required to use Parquet and Arrow sources,"
+        " install the library with the `arrow` extra"
+    ) from error
+
+T = TypeVar("T")
+
+
+@dataclass
+class RecordBatchSource(RowSource[T]):
+    """Base class for sources reading record batches.
+
+    Only the selected columns of a batch are converted to Python values, one
+    column at a time, see `RowSource`.
+    """
+
+    @abc.abstractmethod
+    def _read_batches(
+        self: "RecordBatchSource[T]",
+        select: Callable[[list[str]], list[str]],
+    ) -> Iterator["pa.RecordBatch"]:
+        """Reads batches containing only the columns selected from all names.
+
+        Columns of the batches must be in the order returned by `select`.
+        """
+        ...
+
+    def _read_rows(
+        self: "RecordBatchSource[T]",
+    ) -> Generator[list[dict[str | int, Any]], None, None]:
+        keys: list[str | int] = []
+        positions: list[int] = []
+
+        def select(all_names: list[str]) -> list[str]:
+            names: list[str] = []
+            for column_id in self.columns:
+                if column_id in keys:
+                    continue
+                if isinstance(column_id, int):
+                    if column_id >= len(all_names):
+                        raise ValueError(
+                            f"column index {column_id} is out of range of the schema"
+                        )
+                    name = all_names[column_id]
+                elif column_id in all_names:
+                    name = column_id
+                else:
+                    raise ValueError(f"column {column_id} is not present in the schema")
+                if name not in names:
+                    names.append(name)
+                keys.append(column_id)
+                positions.append(names.index(name))
+            return names
+
+        for batch in self._read_batches(select):
+            columns: list[list[Any]] = [_.to_pylist() for _ in batch.columns]
+            yield [
+                dict(zip(keys, row, strict=True))
+                for row in zip(*[columns[_] for _ in positions], strict=True)
+            ]
+
+
+@dataclass
+class RecordBatchFileSource(RecordBatchSource[T]):
+    """Base class for sources reading record batches from a file.
+
+    Batches are read and converted in a worker thread, one batch at a time, so
+    the event loop is not blocked and memory usage is bounded by the batch
+    size, see `RowSource`.
+
+    Arguments:
+        path: A path to the file or a binary file object.
+        batch_size: A maximum number of rows read at once.
+    """
+
+    path: str | pathlib.Path | io.BufferedIOBase
+    batch_size: int = field(default=65_536)
+
+    def __post_init__(self: "RecordBatchFileSource[T]") -> None:
+        if self.batch_size <= 0:
+            raise ValueError("batch size must be more than 0")
+
+
+@dataclass
+class ParquetFileSource(RecordBatchFileSource[T]):
+    """Base class for Apache Parquet sources."""
+
+    def _read_batches(
+        self: "ParquetFileSource[T]",
+        select: Callable[[list[str]], list[str]],
+    ) -> Iterator["pa.RecordBatch"]:
+        with pq.ParquetFile(self.path) as file:
+            yield from file.iter_batches(
+                batch_size=self.batch_size,
+                columns=select(file.schema_arrow.names),
+            )
+
+
+@dataclass
+class ArrowFileSource(RecordBatchFileSource[T]):
+    """Base class for Apache Arrow IPC sources.
+
+    Both the IPC file (Feather v2) and the IPC stream formats are supported.
+    Files given by a path are memory mapped.
+    """
+
+    def _read_batches(
+        self: "ArrowFileSource[T]",
+        select: Callable[[list[str]], list[str]],
+    ) -> Iterator["pa.RecordBatch"]:
+        with contextlib.ExitStack() as stack:
+            if isinstance(self.path, (str, pathlib.Path)):
+                source = stack.enter_context(pa.memory_map(str(self.path)))
+            else:
+                source = self.path
+            batches: Iterator[pa.RecordBatch]
+            try:
+                reader = stack.enter_context(pa.ipc.open_file(source))
+                batches = (
+                    reader.get_batch(_) for _ in range(reader.num_record_batches)
+                )
+            except pa.ArrowInvalid:
+                source.seek(0)
+                reader = stack.enter_context(pa.ipc.open_stream(source))
+                batches = iter(reader)
+            names = select(reader.schema.names)
+            for batch in batches:
+                batch = batch.select(names)
+                for offset in range(0, batch.num_rows, self.batch_size):
+                    yield batch.slice(offset, self.batch_size)
+
+
+@dataclass
+class MaterialsParquetFileSource(
+    MaterialsMapping,
+    ParquetFileSource[material_pb2.Material],
+    MaterialsSource,
+):
+    """A Parquet source for Materials.
+
+    Arguments:
+        path: A path to the Parquet file containing materials information.
+        batch_size: A maximum number of rows read at once
+        material_id_column: A column that is used to uniquely identify a material in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        quantity_column: A column that represent the quantity of material
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given material
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = MaterialsParquetFileSource(
+            "materials.parquet",
+            material_id_column=Column(
+                "material_id",
+            ),
+            quantity_column=QuantityColumn(
+                "weight",
+                unit="kilogram",
+            ),
+            characteristics_columns=[
+                CharacteristicColumnBool(
+                    column_name="frozen",
+                    characteristic_name="is_frozen",
+                ),
+            ],
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class ProductsParquetFileSource(
+    ProductsMapping,
+    ParquetFileSource[product_pb2.Product],
+    ProductsSource,
+):
+    """A Parquet source for Products.
+
+    Arguments:
+        path: A path to the Parquet file containing product information.
+        batch_size: A maximum number of rows read at once
+        product_id_column: A column that is used to uniquely identify a product in a dataset
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given product
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = ProductsParquetFileSource(
+            "products.parquet",
+            product_id_column=Column(
+                "product_id",
+            ),
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class DemandParquetFileSource(
+    DemandMapping,
+    ParquetFileSource[demand_pb2.Demand],
+    DemandSource,
+):
+    """A Parquet source for Demand.
+
+    Arguments:
+        path: A path to the Parquet file containing demand information.
+        batch_size: A maximum number of rows read at once
+        product_id_column: A column that is used to identify a product in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        customer_id_column: A column that is used to reference a customer ordering the product
+        quantity_column: A column that represent the quantity of product
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given demand
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = DemandParquetFileSource(
+            "demand.parquet",
+            product_id_column=Column(
+                "product_id",
+            ),
+            customer_id_column=Column(
+                "customer_id",
+            ),
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class MaterialsArrowFileSource(
+    MaterialsMapping,
+    ArrowFileSource[material_pb2.Material],
+    MaterialsSource,
+):
+    """An Arrow IPC source for Materials.
+
+    Arguments:
+        path: A path to the Arrow IPC file containing materials information.
+        batch_size: A maximum number of rows read at once
+        material_id_column: A column that is used to uniquely identify a material in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        quantity_column: A column that represent the quantity of material
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given material
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = MaterialsArrowFileSource(
+            "materials.arrow",
+            material_id_column=Column(
+                "material_id",
+            ),
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class ProductsArrowFileSource(
+    ProductsMapping,
+    ArrowFileSource[product_pb2.Product],
+    ProductsSource,
+):
+    """An Arrow IPC source for Products.
+
+    Arguments:
+        path: A path to the Arrow IPC file containing product information.
+        batch_size: A maximum number of rows read at once
+        product_id_column: A column that is used to uniquely identify a product in a dataset
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given product
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = ProductsArrowFileSource(
+            "products.arrow",
+            product_id_column=Column(
+                "product_id",
+            ),
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class DemandArrowFileSource(
+    DemandMapping,
+    ArrowFileSource[demand_pb2.Demand],
+    DemandSource,
+):
+    """An Arrow IPC source for Demand.
+
+    Arguments:
+        path: A path to the Arrow IPC file containing demand information.
+        batch_size: A maximum number of rows read at once
+        product_id_column: A column that is used to identify a product in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        customer_id_column: A column that is used to reference a customer ordering the product
+        quantity_column: A column that represent the quantity of product
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given demand
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = DemandArrowFileSource(
+            "demand.arrow",
+            product_id_column=Column(
+                "product_id",
+            ),
+        )
+        ```
+    """  # noqa: E501
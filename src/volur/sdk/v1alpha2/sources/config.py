@@ -0,0 +1,404 @@
+"""A package that compiles declarative mapping configs into sources.
+
+A config describes an entity, an input format, a file and a mapping of its
+columns, so feeds that differ only in their columns do not need their own
+scripts. Configs are written in TOML or YAML:
+
+```toml title="materials.toml" linenums="1"
+entity = "materials"
+format = "csv"
+path = "materials.csv"
+
+[options]
+delimiter = ";"
+
+[columns]
+material_id = "MATERIAL_ID"
+quantity = { column = "WEIGHT", unit = "kilogram" }
+
+[[characteristics]]
+column = "IS_FROZEN"
+name = "is_frozen"
+type = "bool"
+```
+"""
+
+import dataclasses
+import hashlib
+import importlib
+import pathlib
+import tomllib
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from volur.pork.materials.v1alpha3 import material_pb2
+
+from .csv.base import (
+    CharacteristicColumn,
+    CharacteristicColumnBool,
+    CharacteristicColumnDate,
+    CharacteristicColumnExpression,
+    CharacteristicColumnFloat,
+    CharacteristicColumnInteger,
+    CharacteristicColumnPricePerUnit,
+    CharacteristicColumnString,
+    Column,
+    EnumColumn,
+    ProtobufEnum,
+    QuantityColumn,
+    Source,
+    TimestampColumn,
+    WeightColumn,
+)
+
+_ENTITIES = {
+    "materials": "Materials",
+    "products": "Products",
+    "demand": "Demand",
+    "product_inventory": "ProductInventory",
+    "bom": "Bom",
+}
+_FORMATS = {
+    "csv": ("volur.sdk.v1alpha2.sources.csv", "CSVFileSource"),
+    "parquet": ("volur.sdk.v1alpha2.sources.arrow", "ParquetFileSource"),
+    "arrow": ("volur.sdk.v1alpha2.sources.arrow", "ArrowFileSource"),
+    "jsonl": ("volur.sdk.v1alpha2.sources.jsonl", "JSONLinesFileSource"),
+}
+_CHARACTERISTICS: dict[str, type[CharacteristicColumn]] = {
+    "float": CharacteristicColumnFloat,
+    "integer": CharacteristicColumnInteger,
+    "string": CharacteristicColumnString,
+    "bool": CharacteristicColumnBool,
+    "date": CharacteristicColumnDate,
+    "price_per_unit": CharacteristicColumnPricePerUnit,
+    "expression": CharacteristicColumnExpression,
+}
+_ENUMS: dict[str, ProtobufEnum] = {
+    "type": material_pb2.MaterialType,
+}
+_COLUMN_OPTIONS = {"sample_by_key"}
+_SUFFIXES = {".toml", ".yaml", ".yml"}
+
+
+def source_class(entity: str, format: str) -> type[Source[Any]]:
+    """Returns a class of sources of an entity reading a given format."""
+    module, suffix = _FORMATS[format]
+    name = f"{_ENTITIES[entity]}{suffix}"
+    if not hasattr(_ := importlib.import_module(module), name):
+        raise ValueError(f"{entity} can not be read from {format} files")
+    return getattr(_, name)  # type: ignore[no-any-return]
+
+
+def _optional_column(column: str | int | None) -> Column | None:
+    return Column(column) if column is not None else None
+
+
+class ColumnConfig(BaseModel):
+    """A config of a column.
+
+    Arguments:
+        column: A name or an index of the column in a file.
+        unit: A unit of a quantity or a weight column.
+        unit_column: A column with a unit of a row of a weight column.
+        normalize: Whether a weight column converts pounds to kilograms.
+        formats: Formats of a timestamp column, see `TimestampColumn`.
+        timezone: A time zone of a timestamp column.
+        aliases: Extra labels of an enum column, see `EnumColumn`.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    column: str | int
+    unit: Literal["kilogram", "pound", "box", "piece"] | None = None
+    unit_column: str | int | None = None
+    normalize: bool = False
+    formats: list[str] = []
+    timezone: str | None = None
+    aliases: dict[str, str] = {}
+
+
+class CharacteristicConfig(BaseModel):
+    """A config of a characteristic column.
+
+    Arguments:
+        column: A name or an index of the column in a file, or an expression
+            of `expression` columns.
+        name: A name of the characteristic.
+        type: A type of the characteristic.
+        extra_values_true: Extra values interpreted as true by `bool` columns.
+        extra_values_false: Extra values interpreted as false by `bool` columns.
+        extra_date_formats: Extra formats of `date` columns.
+        currency: A currency of `price_per_unit` columns.
+        currency_column: A column with a currency of `price_per_unit` columns.
+        unit: A unit of `price_per_unit` columns.
+        unit_column: A column with a unit of `price_per_unit` columns.
+        normalize: Whether `price_per_unit` columns convert prices per pound
+            to prices per kilogram.
+        result: A type of values of `expression` columns.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    column: str | int
+    name: str
+    type: Literal[
+        "float",
+        "integer",
+        "string",
+        "bool",
+        "date",
+        "price_per_unit",
+        "expression",
+    ] = "string"
+    extra_values_true: list[str] = []
+    extra_values_false: list[str] = []
+    extra_date_formats: list[str] = []
+    currency: str | None = None
+    currency_column: str | int | None = None
+    unit: str | None = None
+    unit_column: str | int | None = None
+    normalize: bool = False
+    result: Literal["float", "integer", "string", "bool"] | None = None
+
+    @model_validator(mode="after")
+    def _check_extras(self: "CharacteristicConfig") -> "CharacteristicConfig":
+        if self.type != "bool" and (self.extra_values_true or self.extra_values_false):
+            raise ValueError("extra values can be set only for bool characteristics")
+        if self.type != "date" and self.extra_date_formats:
+            raise ValueError(
+                "extra date formats can be set only for date characteristics"
+            )
+        if self.type != "price_per_unit" and (
+            self.currency is not None
+            or self.currency_column is not None
+            or self.unit is not None
+            or self.unit_column is not None
+            or self.normalize
+        ):
+            raise ValueError(
+                "currency and unit can be set only for price per unit characteristics"
+            )
+        if self.type != "expression" and self.result is not None:
+            raise ValueError("result can be set only for expression characteristics")
+        return self
+
+    def compile(self: "CharacteristicConfig") -> CharacteristicColumn:
+        kwargs: dict[str, Any] = {}
+        if self.type == "bool":
+            kwargs["extra_values_true"] = self.extra_values_true
+            kwargs["extra_values_false"] = self.extra_values_false
+        if self.type == "date":
+            kwargs["extra_date_formats"] = self.extra_date_formats
+        if self.type == "price_per_unit":
+            kwargs["currency"] = self.currency
+            kwargs["currency_column"] = _optional_column(self.currency_column)
+            kwargs["unit"] = self.unit
+            kwargs["unit_column"] = _optional_column(self.unit_column)
+            kwargs["normalize"] = self.normalize
+        if self.type == "expression" and self.result is not None:
+            kwargs["result"] = self.result
+        return _CHARACTERISTICS[self.type](
+            column_name=self.column,
+            characteristic_name=self.name,
+            **kwargs,
+        )
+
+
+class SourceConfig(BaseModel):
+    """A config of a source.
+
+    Arguments:
+        entity: An entity read by the source.
+        format: A format of the file.
+        path: A path to the file.
+        options: Other arguments of the source, for example `delimiter`.
+        columns: Columns of the entity by their name, for example
+            `material_id` for the `material_id_column` argument.
+        characteristics: Characteristic columns of the entity.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    entity: Literal["materials", "products", "demand", "product_inventory", "bom"]
+    format: Literal["csv", "parquet", "arrow", "jsonl"] = "csv"
+    path: str
+    options: dict[str, Any] = {}
+    columns: dict[str, str | int | ColumnConfig] = {}
+    characteristics: list[CharacteristicConfig] = []
+
+    @model_validator(mode="after")
+    def _check_arguments(self: "SourceConfig") -> "SourceConfig":
+        fields = {
+            _.name
+            for _ in dataclasses.fields(source_class(self.entity, self.format))  # type: ignore[arg-type]
+            if _.init
+        }
+        for name, column in self.columns.items():
+            if f"{name}_column" not in fields:
+                raise ValueError(
+                    f"column {name} is not supported by {self.entity} sources"
+                )
+            unit = column.unit if isinstance(column, ColumnConfig) else None
+            unit_column = (
+                column.unit_column if isinstance(column, ColumnConfig) else None
+            )
+            if name == "quantity" and unit is None:
+                raise ValueError("unit must be set for the quantity column")
+            if name == "weight" and (unit is None) == (unit_column is None):
+                raise ValueError(
+                    "either unit or unit column must be set for the weight column"
+                )
+            if name == "weight" and unit not in (None, "kilogram", "pound"):
+                raise ValueError(f"unit {unit} is not a weight unit")
+            if name not in ("quantity", "weight") and unit is not None:
+                raise ValueError(f"unit can not be set for the {name} column")
+            if (
+                isinstance(column, ColumnConfig)
+                and (column.unit_column is not None or column.normalize)
+                and name != "weight"
+            ):
+                raise ValueError(
+                    f"unit column and normalize can not be set for the {name} column"
+                )
+            if (
+                isinstance(column, ColumnConfig)
+                and (column.formats or column.timezone is not None)
+                and not name.endswith("_at")
+            ):
+                raise ValueError(
+                    f"formats and timezone can not be set for the {name} column"
+                )
+            if (
+                isinstance(column, ColumnConfig)
+                and column.aliases
+                and name not in _ENUMS
+            ):
+                raise ValueError(f"aliases can not be set for the {name} column")
+        for name in self.options:
+            if (
+                name not in fields
+                or name == "path"
+                or name.endswith("_column")
+                or name.endswith("_columns")
+            ):
+                raise ValueError(
+                    f"option {name} is not supported by {self.format} sources"
+                )
+        return self
+
+    def compile(self: "SourceConfig") -> Source[Any]:
+        """Creates a source described by the config."""
+        kwargs: dict[str, Any] = {}
+        for name, value in self.options.items():
+            kwargs[name] = Column(value) if name in _COLUMN_OPTIONS else value
+        for name, column in self.columns.items():
+            if not isinstance(column, ColumnConfig):
+                column = ColumnConfig(column=column)
+            if name == "weight":
+                kwargs[f"{name}_column"] = WeightColumn(
+                    column.column,
+                    unit=column.unit,  # type: ignore[arg-type]
+                    unit_column=_optional_column(column.unit_column),
+                    normalize=column.normalize,
+                )
+            elif name in _ENUMS:
+                kwargs[f"{name}_column"] = EnumColumn(
+                    column.column,
+                    enum=_ENUMS[name],
+                    aliases=column.aliases,
+                )
+            elif column.unit is not None:
+                kwargs[f"{name}_column"] = QuantityColumn(
+                    column.column, unit=column.unit
+                )
+            elif name.endswith("_at"):
+                kwargs[f"{name}_column"] = TimestampColumn(
+                    column.column,
+                    formats=column.formats,
+                    timezone=column.timezone or "UTC",
+                )
+            else:
+                kwargs[f"{name}_column"] = Column(column.column)
+        if self.characteristics:
+            kwargs["characteristics_columns"] = [
+                _.compile() for _ in self.characteristics
+            ]
+        return source_class(self.entity, self.format)(  # type: ignore[call-arg]
+            self.path,
+            **kwargs,
+        )
+
+
+def parse_config(
+    content: bytes,
+    suffix: str,
+) -> dict[str, Any]:
+    """Parses a TOML or a YAML config."""
+    if suffix == ".toml":
+        return tomllib.loads(content.decode("utf-8"))
+    try:
+        import yaml
+    except ImportError as error:  # pragma: no cover
+        raise ImportError(
+            "PyYAML is required to read YAML configs,"
+            " install the library with the `yaml` extra"
+        ) from error
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(content, Loader=loader)
+    if not isinstance(data, dict):
+        raise ValueError("config must be a mapping")
+    return data
+
+
+def load_config(
+    path: str | pathlib.Path,
+    cache_directory: str | pathlib.Path | None = None,
+) -> SourceConfig:
+    """Loads and validates a config from a TOML or a YAML file.
+
+    A relative path of a file in the config is resolved against the directory
+    of the config. When a cache directory is given, the validated config is
+    stored there as JSON keyed by a digest of the config, so a config that
+    has not changed is read from JSON instead of being parsed from TOML or
+    YAML again. The cached config is still validated when it is read.
+
+    Args:
+        path: a path to the config, `.toml`, `.yaml` or `.yml`.
+        cache_directory: a directory of validated configs.
+
+    Returns:
+        A validated config.
+    """
+    path = pathlib.Path(path).resolve()
+    if path.suffix not in _SUFFIXES:
+        raise ValueError(f"config must be a TOML or a YAML file, got {path.name}")
+    content = path.read_bytes()
+    cached: pathlib.Path | None = None
+    if cache_directory is not None:
+        key = hashlib.blake2b(content, digest_size=16)
+        key.update(str(path).encode())
+        cached = pathlib.Path(cache_directory) / f"{key.hexdigest()}.json"
+        if cached.exists():
+            return SourceConfig.model_validate_json(cached.read_bytes())
+    data = parse_config(content, path.suffix)
+    if isinstance(data.get("path"), str):
+        data["path"] = str(path.parent / data["path"])
+    config = SourceConfig.model_validate(data)
+    if cached is not None:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        temporary = cached.with_suffix(".tmp")
+        temporary.write_text(config.model_dump_json())
+        temporary.replace(cached)
+    return config
+
+
+def load_source(
+    path: str | pathlib.Path,
+    cache_directory: str | pathlib.Path | None = None,
+) -> Source[Any]:
+    """Loads a config and creates a source described by it.
+
+    See [load_config][volur.sdk.v1alpha2.sources.config.load_config].
+    """
+    return load_config(path, cache_directory).compile()
@@ -0,0 +1,194 @@
+"""A package that contains the core shared by all sources reading rows.
+
+Sources of every format only differ in how they read rows, a CSV source
+splits lines of text, a Parquet source slices record batches and a SQL source
+fetches rows of a query. Everything after that, converting rows to entities
+in a worker thread, handling of invalid rows and iteration, is implemented
+once here, so sources of every entity and format share the same hot loop.
+"""
+
+import abc
+import contextlib
+import os
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Generator, Generic, Literal, TypeVar
+
+import anyio
+from anyio.lowlevel import RunVar
+from loguru import logger
+
+from ..report import UploadReport
+from .mapping import BatchValues, Mapping
+
+T = TypeVar("T")
+
+OnError = Literal["raise", "skip", "log"]
+
+WORKER_THREADS = min(32, (os.cpu_count() or 1) + 4)
+
+_limiter: RunVar[anyio.CapacityLimiter] = RunVar("_limiter")
+
+
+def worker_limiter() -> anyio.CapacityLimiter:
+    """Returns the limiter of worker threads shared by sources.
+
+    Sources do not compete for the default limiter of anyio with the rest of
+    an application, instead they share a limiter of `WORKER_THREADS` threads
+    in each event loop. The limiter can be resized with `total_tokens`.
+    """
+    try:
+        return _limiter.get()
+    except LookupError:
+        limiter = anyio.CapacityLimiter(WORKER_THREADS)
+        _limiter.set(limiter)
+        return limiter
+
+
+@dataclass
+class BatchBuffer(Generic[T]):
+    """A mixin of sources producing entities in batches.
+
+    Sources implement `_load` iterating over non-empty batches. Iterating
+    over entities takes them one by one from the current batch, while
+    `aiter_batches` passes batches on as they are, only batches of more than
+    `size` entities are split.
+    """
+
+    _batches: AsyncIterator[list[T]] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _batch: list[T] = field(default_factory=list, init=False, repr=False)
+    _index: int = field(default=0, init=False, repr=False)
+
+    def __aiter__(
+        self: "BatchBuffer[T]",
+    ) -> AsyncIterator[T]:
+        self._batches = self._load()
+        self._batch = []
+        self._index = 0
+        return self
+
+    async def __anext__(
+        self: "BatchBuffer[T]",
+    ) -> T:
+        if self._index == len(self._batch):
+            if self._batches is None:
+                self._batches = self._load()
+            batch = await anext(self._batches, None)
+            if batch is None:
+                raise StopAsyncIteration()
+            self._batch, self._index = batch, 0
+        self._index += 1
+        return self._batch[self._index - 1]
+
+    async def aiter_batches(
+        self: "BatchBuffer[T]",
+        size: int = 1024,
+    ) -> AsyncIterator[list[T]]:
+        """Iterates over batches as they are produced.
+
+        Only batches of more than `size` entities are split.
+        """
+        if size <= 0:
+            raise ValueError("batch size must be more than 0")
+        async for batch in self._load():
+            if len(batch) <= size:
+                yield batch
+                continue
+            for offset in range(0, len(batch), size):
+                yield batch[offset : offset + size]
+
+    @abc.abstractmethod
+    def _load(
+        self: "BatchBuffer[T]",
+    ) -> AsyncIterator[list[T]]:
+        """Iterates over non-empty batches of entities."""
+        ...
+
+
+@dataclass(kw_only=True)
+class RowSource(BatchBuffer[T], Mapping[T]):
+    """Base class for sources converting batches of rows to entities.
+
+    A source reads batches of rows in `_read_rows`, rows are dictionaries
+    keyed by `columns`. Batches are read and converted by a mapping in a
+    worker thread, one batch at a time, so the event loop is not blocked and
+    memory usage is bounded by the size of a batch. Converted batches are
+    passed on as they are, see `BatchBuffer`.
+
+    Arguments:
+        on_error: A handling of rows which can not be converted, `raise`
+            stops the upload, `skip` drops the row and `log` drops the row and
+            logs a warning. Dropped rows are counted in `invalid` and in the
+            report of the upload.
+        limiter: A limiter of worker threads reading and converting batches,
+            by default the limiter returned by `worker_limiter`.
+    """
+
+    on_error: OnError = field(default="raise")
+    limiter: anyio.CapacityLimiter | None = field(default=None, repr=False)
+    invalid: int = field(default=0, init=False)
+    _rows: int = field(default=0, init=False, repr=False)
+
+    def upload_finished(
+        self: "RowSource[T]",
+        report: UploadReport,
+    ) -> None:
+        report.invalid += self.invalid
+
+    @abc.abstractmethod
+    def _read_rows(
+        self: "RowSource[T]",
+    ) -> Generator[list[dict[str | int, Any]], None, None]:
+        """Reads batches of rows.
+
+        The iterator is advanced in worker threads, but never concurrently.
+        """
+        ...
+
+    def _convert(
+        self: "RowSource[T]",
+        rows: list[dict[str | int, Any]],
+    ) -> list[T]:
+        """Converts a batch of rows following the error policy."""
+        start, self._rows = self._rows, self._rows + len(rows)
+        values = BatchValues(rows, self.batch_columns)
+        records: list[T] = []
+        for index, data in enumerate(rows):
+            values.index = index
+            if self.on_error == "raise":
+                records.append(self._create(data, values))
+                continue
+            try:
+                records.append(self._create(data, values))
+            except (ValueError, TypeError) as error:
+                self.invalid += 1
+                if self.on_error == "log":
+                    logger.warning(f"row {start + index + 1} is skipped: {error}")
+        return records
+
+    def _next_batch(
+        self: "RowSource[T]",
+        batches: Generator[list[dict[str | int, Any]], None, None],
+    ) -> list[T] | None:
+        rows = next(batches, None)
+        return None if rows is None else self._convert(rows)
+
+    async def _load(
+        self: "RowSource[T]",
+    ) -> AsyncIterator[list[T]]:
+        self.invalid = 0
+        self._rows = 0
+        limiter = self.limiter or worker_limiter()
+        with contextlib.closing(self._read_rows()) as batches:
+            while (
+                batch := await anyio.to_thread.run_sync(
+                    self._next_batch,
+                    batches,
+                    limiter=limiter,
+                )
+            ) is not None:
+                if batch:
+                    yield batch
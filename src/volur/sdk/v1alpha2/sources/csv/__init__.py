@@ -1,35 +1,71 @@
-from volur.sdk.v1alpha2.sources.csv.base import DemandSource, ProductsSource
+from volur.sdk.v1alpha2.sources.csv.base import (
+    BomSource,
+    DemandSource,
+    ProductInventorySource,
+    ProductsSource,
+)
 
 from .base import (
     CharacteristicColumn,
     CharacteristicColumnBool,
     CharacteristicColumnDate,
+    CharacteristicColumnExpression,
     CharacteristicColumnFloat,
     CharacteristicColumnInteger,
+    CharacteristicColumnPricePerUnit,
     CharacteristicColumnString,
     Column,
+    EnumColumn,
     MaterialsSource,
     QuantityColumn,
+    Source,
+    TimestampColumn,
+    WeightColumn,
+    enum_labels,
 )
+from .encoding import detect_encoding
+from .expression import Expression, compile_expression
+from .preflight import ColumnPreflight, PreflightReport, preflight
 from .source import (
+    BomCSVFileSource,
+    CSVFileSource,
     DemandCSVFileSource,
     MaterialsCSVFileSource,
+    ProductInventoryCSVFileSource,
     ProductsCSVFileSource,
 )
 
 __all__ = [
+    "Source",
     "ProductsSource",
     "ProductsCSVFileSource",
     "DemandSource",
     "DemandCSVFileSource",
+    "ProductInventorySource",
+    "ProductInventoryCSVFileSource",
+    "BomSource",
+    "BomCSVFileSource",
+    "CSVFileSource",
     "CharacteristicColumn",
     "CharacteristicColumnBool",
     "CharacteristicColumnFloat",
     "CharacteristicColumnInteger",
     "CharacteristicColumnString",
     "CharacteristicColumnDate",
+    "CharacteristicColumnPricePerUnit",
+    "CharacteristicColumnExpression",
+    "Expression",
+    "compile_expression",
     "Column",
+    "EnumColumn",
+    "enum_labels",
     "MaterialsSource",
     "MaterialsCSVFileSource",
     "QuantityColumn",
+    "TimestampColumn",
+    "WeightColumn",
+    "ColumnPreflight",
+    "PreflightReport",
+    "preflight",
+    "detect_encoding",
 ]
@@ -1,19 +1,106 @@
 """A package that contains base classes for CSV sources."""
 
 import abc
+import contextlib
+import re
 from dataclasses import InitVar, dataclass, field
-from datetime import datetime
-from typing import Any, AsyncIterator, Literal
+from datetime import date, datetime, timezone, tzinfo
+from decimal import Decimal, InvalidOperation
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterable,
+    Literal,
+    Protocol,
+    TypeVar,
+    runtime_checkable,
+)
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+from google.protobuf.descriptor import EnumDescriptor
+from google.protobuf.timestamp_pb2 import Timestamp
 from google.type.date_pb2 import Date
+from google.type.money_pb2 import Money
 
+from volur.pork.bom.v1alpha1 import bom_pb2
 from volur.pork.demand.v1alpha2 import demand_pb2
 from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.product_inventory.v1alpha1 import product_inventory_pb2
 from volur.pork.products.v1alpha3 import product_pb2
-from volur.pork.shared.v1alpha1 import characteristic_pb2, quantity_pb2
+from volur.pork.shared.v1alpha1 import (
+    characteristic_pb2,
+    price_per_unit_pb2,
+    quantity_pb2,
+    weight_pb2,
+)
 
+from .expression import Expression, compile_expression
 
-class MaterialsSource:
+T = TypeVar("T")
+V = TypeVar("V")
+
+_QUANTITY_UNITS: dict[str, Callable[[Any], float | int]] = {
+    "kilogram": float,
+    "pound": float,
+    "box": int,
+    "piece": int,
+}
+_KILOGRAMS_PER_POUND = Decimal("0.45359237")
+_UNIT_ALIASES = {
+    "kilogram": "kilogram",
+    "kilograms": "kilogram",
+    "kg": "kilogram",
+    "kgs": "kilogram",
+    "pound": "pound",
+    "pounds": "pound",
+    "lb": "pound",
+    "lbs": "pound",
+}
+_NANOS = Decimal(1_000_000_000)
+_NANO = 1 / _NANOS
+
+
+class Source(Generic[T]):
+    """
+    Base class for all sources.
+
+    A source is an asynchronous iterator of entities of a single type. Sources
+    producing a specific entity derive from a corresponding base class, for
+    example `MaterialsSource`.
+
+    Entities can also be read in batches with `aiter_batches`, which is how
+    the client reads sources. The default implementation collects entities
+    of the iterator, sources that produce entities in batches override it,
+    so the cost of awaiting is paid once per batch instead of once per
+    entity.
+    """
+
+    @abc.abstractmethod
+    def __aiter__(self: "Source[T]") -> AsyncIterator[T]: ...
+
+    @abc.abstractmethod
+    async def __anext__(self: "Source[T]") -> T: ...
+
+    async def aiter_batches(
+        self: "Source[T]",
+        size: int = 1024,
+    ) -> AsyncIterator[list[T]]:
+        """Iterates over non-empty batches of at most `size` entities."""
+        if size <= 0:
+            raise ValueError("batch size must be more than 0")
+        batch: list[T] = []
+        async for entity in self:
+            batch.append(entity)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class MaterialsSource(Source[material_pb2.Material]):
     """
     Base class for material sources.
 
@@ -44,7 +131,7 @@ class MaterialsSource:
 
 
 @dataclass
-class ProductsSource:
+class ProductsSource(Source[product_pb2.Product]):
     """
     Base class for the product sources.
     This class in an abstract class that defines the interface for the products CSV
@@ -72,7 +159,7 @@ class ProductsSource:
 
 
 @dataclass
-class DemandSource:
+class DemandSource(Source[demand_pb2.Demand]):
     """
     Base class for the demand sources.
     This class in an abstract class that defines the interface for the demand CSV
@@ -99,6 +186,64 @@ class DemandSource:
         ...
 
 
+@dataclass
+class ProductInventorySource(Source[product_inventory_pb2.ProductInventory]):
+    """
+    Base class for the product inventory sources.
+    This class in an abstract class that defines the interface for the product
+    inventory CSV source.
+    """
+
+    @abc.abstractmethod
+    def __aiter__(
+        self: "ProductInventorySource",
+    ) -> AsyncIterator[product_inventory_pb2.ProductInventory]:
+        """ProductInventorySource implements Asynchronous Iterator.
+        This allows you to use any implementation of ProductInventorySource as
+        ```python title="example.py" linenums="1"
+        source = ProductInventorySourceImplementation()
+        for _ in source:
+            # do something with ProductInventory
+        ```
+        """
+        ...
+
+    @abc.abstractmethod
+    async def __anext__(
+        self: "ProductInventorySource",
+    ) -> product_inventory_pb2.ProductInventory:
+        """You can fetch the next element in the asynchronous iterator."""
+        ...
+
+
+@dataclass
+class BomSource(Source[bom_pb2.Bom]):
+    """
+    Base class for the bill of materials sources.
+    This class in an abstract class that defines the interface for the bill of
+    materials CSV source.
+    """
+
+    @abc.abstractmethod
+    def __aiter__(self: "BomSource") -> AsyncIterator[bom_pb2.Bom]:
+        """BomSource implements Asynchronous Iterator.
+        This allows you to use any implementation of BomSource as
+        ```python title="example.py" linenums="1"
+        source = BomSourceImplementation()
+        for _ in source:
+            # do something with Bom
+        ```
+        """
+        ...
+
+    @abc.abstractmethod
+    async def __anext__(
+        self: "BomSource",
+    ) -> bom_pb2.Bom:
+        """You can fetch the next element in the asynchronous iterator."""
+        ...
+
+
 @dataclass
 class Column:
     column_name: InitVar[str | int]
@@ -113,6 +258,60 @@ class Column:
                 raise ValueError("column index must be equal or more than 0")
         self.column_id = column_name
 
+    @property
+    def column_ids(self: "Column") -> list[str | int]:
+        """Returns identifiers of all columns a value is read from."""
+        return [self.column_id]
+
+
+@runtime_checkable
+class BatchColumn(Protocol):
+    """A column converting values of a whole batch of rows at once.
+
+    Mappings convert such columns once per batch instead of calling
+    `get_value` for every row, see `BatchValues`.
+    """
+
+    def get_values(
+        self: "BatchColumn",
+        rows: list[dict[str | int, Any]],
+    ) -> list[Any]:
+        """Returns values of a batch of rows.
+
+        A value which can not be converted is returned as the `ValueError`
+        or `TypeError` raised for it, so only its row is invalid.
+        """
+        ...
+
+
+def convert_distinct(
+    values: Iterable[Any],
+    convert: Callable[[Any], Any],
+) -> list[Any]:
+    """Converts values, every distinct value only once.
+
+    A value which can not be converted is returned as the `ValueError` or
+    `TypeError` raised for it.
+    """
+    converted: dict[Any, Any] = {}
+    results: list[Any] = []
+    for value in values:
+        try:
+            if value in converted:
+                results.append(converted[value])
+                continue
+        except TypeError:
+            # unhashable values, for example lists, are not cached
+            pass
+        try:
+            result = convert(value)
+        except (ValueError, TypeError) as error:
+            result = error
+        with contextlib.suppress(TypeError):
+            converted[value] = result
+        results.append(result)
+    return results
+
 
 @dataclass
 class QuantityColumn(Column):
@@ -125,6 +324,11 @@ class QuantityColumn(Column):
         ]
     ]
     unit_id: str = field(init=False)
+    _convert: Callable[[Any], float | int] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
 
     def __post_init__(
         self: "QuantityColumn",
@@ -135,6 +339,7 @@ class QuantityColumn(Column):
         if unit == "":
             raise ValueError("unit can not be empty string")
         self.unit_id = unit
+        self._convert = _QUANTITY_UNITS.get(unit, None)
 
     def get_value(
         self: "QuantityColumn",
@@ -146,18 +351,10 @@ class QuantityColumn(Column):
             return quantity_pb2.Quantity(value=value)
         if _ == "":
             return quantity_pb2.Quantity(value=value)
+        if self._convert is None:
+            return quantity_pb2.Quantity(value=value)
         try:
-            match self.unit_id:
-                case "kilogram":
-                    value.kilogram = float(_)
-                case "pound":
-                    value.pound = float(_)
-                case "box":
-                    value.box = int(_)
-                case "piece":
-                    value.piece = int(_)
-                case _:
-                    pass
+            setattr(value, self.unit_id, self._convert(_))
         except ValueError as error:
             raise ValueError(
                 f"provided value {_} in column {self.column_id} can not be interpreted as {self.unit_id}"  # noqa: E501
@@ -165,6 +362,376 @@ class QuantityColumn(Column):
         return quantity_pb2.Quantity(value=value)
 
 
+def _unit_labels(
+    aliases: dict[str, str],
+) -> dict[str, str]:
+    labels = dict(_UNIT_ALIASES)
+    for alias, unit in aliases.items():
+        labels[alias.strip().lower()] = unit
+    return labels
+
+
+@dataclass
+class _LabelCache(Generic[V]):
+    """Values of labels of a column, for example of units.
+
+    A label is looked up as it is in a row first. A label which is not found
+    is normalized, stripped and lowercased, and looked up again or passed to
+    `missing`. Its value is then cached by the label as it is in the row, so
+    a label is resolved only once and every next row hits it as it is.
+
+    Arguments:
+        labels: Values by normalized labels.
+        missing: A function returning a value of a label which is not known,
+            or raising an exception.
+    """
+
+    labels: dict[Any, V]
+    missing: Callable[[Any], V]
+
+    def get(self: "_LabelCache[V]", label: Any) -> V:  # noqa: ANN401
+        try:
+            return self.labels[label]
+        except KeyError:
+            pass
+        key = str(label).strip().lower() if label is not None else ""
+        value = self.labels[key] if key in self.labels else self.missing(label)
+        self.labels[label] = value
+        return value
+
+
+@dataclass
+class WeightColumn(Column):
+    """A column of weights.
+
+    All rows are either in the same `unit`, or the unit of a row is read from
+    `unit_column`, which allows to read exports mixing kilograms and pounds.
+    Labels of units are matched case insensitively, common abbreviations like
+    `kg` or `lbs` are recognized and more labels can be added with
+    `unit_aliases`. Units of labels are resolved when the column is created
+    and for every distinct label only once, not for every row. Sources
+    convert the column per batch of rows, the units of a batch are resolved
+    before its values are converted.
+
+    Arguments:
+        unit: A unit of all rows.
+        unit_column: A column with a unit of a row.
+        unit_aliases: Extra labels of units, for example `{"kilo": "kilogram"}`.
+        normalize: Whether weights in pounds are converted to kilograms.
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        weight_column = WeightColumn(
+            "weight",
+            unit_column=Column("weight_unit"),
+            normalize=True,
+        )
+        ```
+    """
+
+    unit: Literal["kilogram", "pound"] | None = field(default=None)
+    unit_column: Column | None = field(default=None)
+    unit_aliases: dict[str, str] = field(default_factory=dict)
+    normalize: bool = field(default=False)
+    _units: _LabelCache[tuple[str, float]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(
+        self: "WeightColumn",
+        column_name: str | int,
+    ) -> None:
+        super().__post_init__(column_name)
+        if (self.unit is None) == (self.unit_column is None):
+            raise ValueError("either unit or unit column must be set")
+        units: dict[Any, tuple[str, float]] = {}
+        for label, unit in _unit_labels(self.unit_aliases).items():
+            if unit not in ("kilogram", "pound"):
+                raise ValueError(f"unit {unit} of label {label} is not a weight unit")
+            if self.normalize and unit == "pound":
+                units[label] = ("kilogram", float(_KILOGRAMS_PER_POUND))
+            else:
+                units[label] = (unit, 1.0)
+        self._units = _LabelCache(units, self._unknown_unit)
+
+    @property
+    def column_ids(self: "WeightColumn") -> list[str | int]:
+        if self.unit_column is None:
+            return [self.column_id]
+        return [self.column_id, self.unit_column.column_id]
+
+    def _unknown_unit(
+        self: "WeightColumn",
+        label: Any,  # noqa: ANN401
+    ) -> tuple[str, float]:
+        column = self.unit_column or self
+        raise ValueError(
+            f"provided unit {label} in column {column.column_id} is not a weight unit"
+        )
+
+    def _weight(
+        self: "WeightColumn",
+        value: Any,  # noqa: ANN401
+        unit: tuple[str, float],
+    ) -> weight_pb2.Weight:
+        try:
+            converted = float(value) * unit[1]
+        except ValueError as error:
+            raise ValueError(
+                f"provided value {value} in column {self.column_id} can not be interpreted as weight"  # noqa: E501
+            ) from error
+        if unit[0] == "kilogram":
+            return weight_pb2.Weight(
+                value=weight_pb2.WeightValue(kilogram=converted),
+            )
+        return weight_pb2.Weight(value=weight_pb2.WeightValue(pound=converted))
+
+    def get_value(
+        self: "WeightColumn",
+        data: dict[str | int, Any],
+    ) -> weight_pb2.Weight | None:
+        """Returns a weight of a row, or `None` if the value is empty."""
+        _ = data.get(self.column_id, None)
+        if _ is None or _ == "":
+            return None
+        return self._weight(
+            _,
+            self._units.get(
+                self.unit
+                if self.unit_column is None
+                else data.get(self.unit_column.column_id, None),
+            ),
+        )
+
+    def get_values(
+        self: "WeightColumn",
+        rows: list[dict[str | int, Any]],
+    ) -> list[weight_pb2.Weight | ValueError | None]:
+        """Returns weights of a batch of rows.
+
+        Units of the distinct labels of the batch are resolved before values
+        are converted, so converting a value only multiplies it by the factor
+        of its unit.
+        """
+        units = (
+            [self._units.get(self.unit)] * len(rows)
+            if self.unit_column is None
+            else convert_distinct(
+                (data.get(self.unit_column.column_id, None) for data in rows),
+                self._units.get,
+            )
+        )
+        weights: list[weight_pb2.Weight | ValueError | None] = []
+        for data, unit in zip(rows, units, strict=True):
+            _ = data.get(self.column_id, None)
+            if _ is None or _ == "":
+                weights.append(None)
+            elif isinstance(unit, ValueError):
+                weights.append(unit)
+            else:
+                try:
+                    weights.append(self._weight(_, unit))
+                except ValueError as error:
+                    weights.append(error)
+        return weights
+
+
+class ProtobufEnum(Protocol):
+    """A protobuf enum, for example `material_pb2.MaterialType`."""
+
+    @property
+    def DESCRIPTOR(self: "ProtobufEnum") -> EnumDescriptor: ...  # noqa: N802
+
+
+def enum_labels(enum: EnumDescriptor) -> dict[str, int]:
+    """Returns values of an enum by their lowercase labels.
+
+    Every value is labeled by its name, for example `material_type_carcass`,
+    its name without the prefix of the enum, `carcass`, and its number, `1`.
+    """
+    prefix = re.sub(r"(?<!^)(?=[A-Z])", "_", enum.name).upper() + "_"
+    labels: dict[str, int] = {}
+    for value in enum.values:
+        labels[value.name.lower()] = value.number
+        labels[value.name.removeprefix(prefix).lower()] = value.number
+        labels[str(value.number)] = value.number
+    return labels
+
+
+@dataclass
+class EnumColumn(Column):
+    """A column of values of a protobuf enum.
+
+    Labels are mapped to values through a dictionary built once from the
+    descriptor of the enum, so converting a row is a dictionary lookup. Labels
+    are matched case insensitively against the names of values, with or
+    without the prefix of the enum, and their numbers, see `enum_labels`.
+    Other labels can be mapped with `aliases`. A label which can not be mapped
+    raises an exception like an invalid value of any other column.
+
+    Arguments:
+        enum: An enum, for example `material_pb2.MaterialType`.
+        aliases: Extra labels of values by their name, for example
+            `{"slakt": "MATERIAL_TYPE_CARCASS"}`.
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        type_column = EnumColumn(
+            "type",
+            enum=material_pb2.MaterialType,
+            aliases={"slakt": "carcass"},
+        )
+        ```
+    """
+
+    enum: ProtobufEnum | EnumDescriptor
+    aliases: dict[str, str] = field(default_factory=dict)
+    _values: _LabelCache[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(
+        self: "EnumColumn",
+        column_name: str | int,
+    ) -> None:
+        super().__post_init__(column_name)
+        descriptor = (
+            self.enum if isinstance(self.enum, EnumDescriptor) else self.enum.DESCRIPTOR
+        )
+        labels = enum_labels(descriptor)
+        values: dict[Any, int] = dict(labels)
+        for alias, name in self.aliases.items():
+            if (number := labels.get(name.lower(), None)) is None:
+                raise ValueError(f"{name} is not a value of {descriptor.name}")
+            values[alias.strip().lower()] = number
+        self._values = _LabelCache(values, self._unknown_label)
+
+    def _unknown_label(
+        self: "EnumColumn",
+        label: Any,  # noqa: ANN401
+    ) -> int:
+        raise ValueError(
+            f"provided value {label} in column {self.column_id} is not a known label"
+        )
+
+    def get_value(
+        self: "EnumColumn",
+        data: dict[str | int, Any],
+    ) -> int | None:
+        """Returns a number of the value of a row, or `None` if it is empty."""
+        _ = data.get(self.column_id, None)
+        if _ is None or _ == "":
+            return None
+        return self._values.get(_)
+
+
+@dataclass
+class TimestampColumn(Column):
+    """A column of timestamps.
+
+    Values in ISO 8601 are parsed with `datetime.fromisoformat`, which is
+    the fastest way to parse a timestamp. Other values are parsed with
+    `formats` of `datetime.strptime`. A column rarely mixes formats, so the
+    first format matching a value is locked and tried first for all following
+    values. Values without a time zone are interpreted in `timezone`. Sources
+    convert the column per batch of rows, parsing every distinct value of a
+    batch only once.
+
+    Arguments:
+        formats: Formats tried for values which are not in ISO 8601.
+        timezone: A name of the time zone of values without a time zone, for
+            example `Europe/Oslo`.
+    """
+
+    formats: list[str] = field(default_factory=list)
+    timezone: str = field(default="UTC")
+    _zone: tzinfo = field(init=False, repr=False)
+    _format: str | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(
+        self: "TimestampColumn",
+        column_name: str | int,
+    ) -> None:
+        super().__post_init__(column_name)
+        if self.timezone == "UTC":
+            self._zone = timezone.utc
+        else:
+            try:
+                self._zone = ZoneInfo(self.timezone)
+            except (ZoneInfoNotFoundError, ValueError) as error:
+                raise ValueError(f"unknown time zone {self.timezone}") from error
+
+    def parse(
+        self: "TimestampColumn",
+        value: str,
+    ) -> datetime:
+        """Parses a value to a datetime with a time zone."""
+        try:
+            if self._format is not None:
+                parsed = datetime.strptime(value, self._format)
+            else:
+                parsed = datetime.fromisoformat(value)
+        except ValueError:
+            parsed = self._parse_with_formats(value)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=self._zone)
+        return parsed
+
+    def _parse_with_formats(
+        self: "TimestampColumn",
+        value: str,
+    ) -> datetime:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        for _ in self.formats:
+            try:
+                parsed = datetime.strptime(value, _)
+            except ValueError:
+                continue
+            self._format = _
+            return parsed
+        raise ValueError(
+            f"provided value {value} in column {self.column_id} can not be interpreted as timestamp"  # noqa: E501
+        )
+
+    def _timestamp(
+        self: "TimestampColumn",
+        value: Any,  # noqa: ANN401
+    ) -> Timestamp | None:
+        if value is None or value == "":
+            return None
+        if isinstance(value, datetime):
+            parsed = (
+                value if value.tzinfo is not None else value.replace(tzinfo=self._zone)
+            )
+        else:
+            parsed = self.parse(str(value))
+        timestamp = Timestamp()
+        timestamp.FromDatetime(parsed)
+        return timestamp
+
+    def get_value(
+        self: "TimestampColumn",
+        data: dict[str | int, Any],
+    ) -> Timestamp | None:
+        """Returns a timestamp of a row, or `None` if the value is empty."""
+        return self._timestamp(data.get(self.column_id, None))
+
+    def get_values(
+        self: "TimestampColumn",
+        rows: list[dict[str | int, Any]],
+    ) -> list[Timestamp | ValueError | None]:
+        """Returns timestamps of a batch of rows.
+
+        Every distinct value of the batch is parsed only once, rows usually
+        share few timestamps, for example a day of arrival.
+        """
+        return convert_distinct(
+            (data.get(self.column_id, None) for data in rows),
+            self._timestamp,
+        )
+
+
 @dataclass
 class CharacteristicColumn(Column):
     characteristic_name: InitVar[str]
@@ -322,6 +889,18 @@ class CharacteristicColumnBool(CharacteristicColumn):
                 name=self.characteristic_id,
                 value=characteristic_pb2.CharacteristicValue(),
             )
+        elif isinstance(_, bool) or (isinstance(_, int) and _ in (0, 1)):
+            # database drivers, for example SQLite, return booleans as 0 and 1
+            return characteristic_pb2.Characteristic(
+                name=self.characteristic_id,
+                value=characteristic_pb2.CharacteristicValue(
+                    value_bool=bool(_),
+                ),
+            )
+        elif not isinstance(_, str):
+            raise ValueError(
+                f"provided value {_} in column {self.column_id} can not be interpreted as bool characteristic"  # noqa: E501
+            )
         else:
             if _.lower() in set(self.true_values):
                 return characteristic_pb2.Characteristic(
@@ -400,7 +979,278 @@ class CharacteristicColumnDate(CharacteristicColumn):
             raise ValueError(
                 f"provided value {_} in column {self.column_id} has invalid date format"
             )
+        elif isinstance(_, date):
+            return characteristic_pb2.Characteristic(
+                name=self.characteristic_id,
+                value=characteristic_pb2.CharacteristicValue(
+                    value_date=Date(
+                        year=_.year,
+                        month=_.month,
+                        day=_.day,
+                    )
+                ),
+            )
         else:
             raise ValueError(
                 f"provided value {_} in column {self.column_id} can not be interpreted as date characteristic"  # noqa: E501
             )
+
+
+@dataclass
+class CharacteristicColumnPricePerUnit(CharacteristicColumn):
+    """A characteristic column of prices per unit.
+
+    The currency and the unit are the same for all rows, `currency` and
+    `unit`, or are read from `currency_column` and `unit_column` of a row.
+    Weight units are recognized like by `WeightColumn` and other units are
+    passed as they are, for example `piece`. Prices are read as decimals, so
+    they are not rounded on the way to the platform.
+
+    Arguments:
+        currency: A three-letter ISO 4217 currency code of all rows.
+        currency_column: A column with a currency code of a row.
+        unit: A unit of all rows.
+        unit_column: A column with a unit of a row.
+        unit_aliases: Extra labels of units, for example `{"kilo": "kilogram"}`.
+        normalize: Whether prices per pound are converted to prices per
+            kilogram.
+    """
+
+    currency: str | None = field(default=None)
+    currency_column: Column | None = field(default=None)
+    unit: str | None = field(default=None)
+    unit_column: Column | None = field(default=None)
+    unit_aliases: dict[str, str] = field(default_factory=dict)
+    normalize: bool = field(default=False)
+    _units: _LabelCache[tuple[str, Decimal]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(
+        self: "CharacteristicColumnPricePerUnit",
+        column_name: str | int,
+        characteristic_name: str,
+    ) -> None:
+        super().__post_init__(column_name, characteristic_name)
+        if (self.currency is None) == (self.currency_column is None):
+            raise ValueError("either currency or currency column must be set")
+        if (self.unit is None) == (self.unit_column is None):
+            raise ValueError("either unit or unit column must be set")
+        units: dict[Any, tuple[str, Decimal]] = {}
+        for label, unit in _unit_labels(self.unit_aliases).items():
+            if self.normalize and unit == "pound":
+                units[label] = ("kilogram", _KILOGRAMS_PER_POUND)
+            else:
+                units[label] = (unit, Decimal(1))
+        # other units, for example piece, are passed as they are
+        self._units = _LabelCache(
+            units,
+            lambda _: (str(_).strip() if _ is not None else "", Decimal(1)),
+        )
+
+    @property
+    def column_ids(self: "CharacteristicColumnPricePerUnit") -> list[str | int]:
+        _ = [self.column_id]
+        if self.currency_column is not None:
+            _.append(self.currency_column.column_id)
+        if self.unit_column is not None:
+            _.append(self.unit_column.column_id)
+        return _
+
+    def _price(
+        self: "CharacteristicColumnPricePerUnit",
+        value: Any,  # noqa: ANN401
+        unit: tuple[str, Decimal],
+        currency: Any,  # noqa: ANN401
+    ) -> characteristic_pb2.Characteristic:
+        if not currency:
+            raise ValueError(
+                f"currency of value {value} in column {self.column_id} is not provided"
+            )
+        try:
+            price = (Decimal(str(value).strip()) / unit[1]).quantize(_NANO)
+            units = int(price)
+            nanos = int((price - units) * _NANOS)
+        except (InvalidOperation, OverflowError, ValueError) as error:
+            raise ValueError(
+                f"provided value {value} in column {self.column_id} can not be interpreted as price per unit characteristic"  # noqa: E501
+            ) from error
+        return characteristic_pb2.Characteristic(
+            name=self.characteristic_id,
+            value=characteristic_pb2.CharacteristicValue(
+                value_price_per_unit=price_per_unit_pb2.PricePerUnit(
+                    value=Money(
+                        currency_code=str(currency).strip().upper(),
+                        units=units,
+                        nanos=nanos,
+                    ),
+                    unit=unit[0],
+                ),
+            ),
+        )
+
+    def get_value(
+        self: "CharacteristicColumnPricePerUnit",
+        data: dict[str | int, Any],
+    ) -> characteristic_pb2.Characteristic:
+        _ = data.get(self.column_id, None)
+        if _ is None or _ == "":
+            return characteristic_pb2.Characteristic(
+                name=self.characteristic_id,
+                value=characteristic_pb2.CharacteristicValue(),
+            )
+        return self._price(
+            _,
+            self._units.get(
+                self.unit
+                if self.unit_column is None
+                else data.get(self.unit_column.column_id, None),
+            ),
+            self.currency
+            if self.currency_column is None
+            else data.get(self.currency_column.column_id, None),
+        )
+
+    def get_values(
+        self: "CharacteristicColumnPricePerUnit",
+        rows: list[dict[str | int, Any]],
+    ) -> list[characteristic_pb2.Characteristic | ValueError]:
+        """Returns characteristics of a batch of rows.
+
+        Units of the distinct labels of the batch are resolved before prices
+        are converted, like by `WeightColumn`.
+        """
+        units = (
+            [self._units.get(self.unit)] * len(rows)
+            if self.unit_column is None
+            else convert_distinct(
+                (data.get(self.unit_column.column_id, None) for data in rows),
+                self._units.get,
+            )
+        )
+        prices: list[characteristic_pb2.Characteristic | ValueError] = []
+        for data, unit in zip(rows, units, strict=True):
+            _ = data.get(self.column_id, None)
+            if _ is None or _ == "":
+                prices.append(
+                    characteristic_pb2.Characteristic(
+                        name=self.characteristic_id,
+                        value=characteristic_pb2.CharacteristicValue(),
+                    )
+                )
+                continue
+            try:
+                prices.append(
+                    self._price(
+                        _,
+                        unit,
+                        self.currency
+                        if self.currency_column is None
+                        else data.get(self.currency_column.column_id, None),
+                    )
+                )
+            except ValueError as error:
+                prices.append(error)
+        return prices
+
+
+@dataclass
+class CharacteristicColumnExpression(CharacteristicColumn):
+    """A characteristic computed from other columns of a row.
+
+    The column name is an expression, for example `lean_weight / weight *
+    100` or `plant & "-" & material_id`, see
+    [compile_expression][volur.sdk.v1alpha2.sources.csv.expression.compile_expression]
+    for the supported syntax. The expression is compiled once, when the
+    column is created. Sources evaluate it once per batch of rows over arrays
+    of values of its columns. A characteristic is empty if a value of a column
+    the expression needs is missing.
+
+    Arguments:
+        result: A type of the characteristic, `float`, `integer`, `string`
+            or `bool`.
+    """
+
+    result: Literal["float", "integer", "string", "bool"] = field(default="float")
+    expression: Expression = field(init=False, repr=False)
+
+    def __post_init__(
+        self: "CharacteristicColumnExpression",
+        column_name: str | int,
+        characteristic_name: str,
+    ) -> None:
+        super().__post_init__(column_name, characteristic_name)
+        if not isinstance(column_name, str):
+            raise ValueError("expression must be a string")
+        if self.result not in _EXPRESSION_RESULTS:
+            raise ValueError(
+                "result must be either float, integer, string or bool,"
+                f" got {self.result}"
+            )
+        self.expression = compile_expression(column_name)
+
+    @property
+    def column_ids(self: "CharacteristicColumnExpression") -> list[str | int]:
+        return list(self.expression.columns)
+
+    def get_value(
+        self: "CharacteristicColumnExpression",
+        data: dict[str | int, Any],
+    ) -> characteristic_pb2.Characteristic:
+        return self._characteristic(self.expression.evaluate(data))
+
+    def get_values(
+        self: "CharacteristicColumnExpression",
+        rows: list[dict[str | int, Any]],
+    ) -> list[characteristic_pb2.Characteristic | Exception]:
+        """Returns characteristics of a batch of rows.
+
+        The expression is evaluated for all rows of the batch at once, see
+        [Expression.evaluate_batch][volur.sdk.v1alpha2.sources.csv.expression.Expression.evaluate_batch].
+        """
+        characteristics: list[characteristic_pb2.Characteristic | Exception] = []
+        for value in self.expression.evaluate_batch(rows):
+            if isinstance(value, Exception):
+                characteristics.append(value)
+                continue
+            try:
+                characteristics.append(self._characteristic(value))
+            except ValueError as error:
+                characteristics.append(error)
+        return characteristics
+
+    def _characteristic(
+        self: "CharacteristicColumnExpression",
+        _: Any,  # noqa: ANN401
+    ) -> characteristic_pb2.Characteristic:
+        if _ is None:
+            return characteristic_pb2.Characteristic(
+                name=self.characteristic_id,
+                value=characteristic_pb2.CharacteristicValue(),
+            )
+        try:
+            value = _EXPRESSION_RESULTS[self.result](_)
+        except (TypeError, ValueError, OverflowError) as error:
+            raise ValueError(
+                f"value {_!r} of expression {self.column_id} can not be interpreted as {self.result} characteristic"  # noqa: E501
+            ) from error
+        return characteristic_pb2.Characteristic(
+            name=self.characteristic_id,
+            value=characteristic_pb2.CharacteristicValue(
+                **{f"value_{self.result}": value},
+            ),
+        )
+
+
+def _to_integer(value: Any) -> int:  # noqa: ANN401
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{value} is not an integer")
+    return int(value)
+
+
+_EXPRESSION_RESULTS: dict[str, Callable[[Any], Any]] = {
+    "float": float,
+    "integer": _to_integer,
+    "string": str,
+    "bool": bool,
+}
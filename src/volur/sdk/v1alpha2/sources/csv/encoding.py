@@ -0,0 +1,136 @@
+"""A package that contains detection and decoding of text encodings.
+
+Exports of ERP systems are not always encoded in UTF-8, Windows code pages
+and UTF-8 with a byte order mark are common. Sources detect the encoding on a
+sample from the start of a file and decode the file incrementally in large
+blocks, so the file is never decoded line by line nor read entirely into
+memory.
+"""
+
+import codecs
+import contextlib
+import io
+import pathlib
+from dataclasses import dataclass, field
+from typing import IO, Any, Iterator, TextIO
+
+SAMPLE_SIZE = 1 << 16
+BLOCK_SIZE = 1 << 20
+
+_BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def detect_encoding(sample: bytes) -> str:
+    """Detects an encoding of a text from a sample of its first bytes.
+
+    A byte order mark decides the encoding if it is present. Otherwise the
+    sample is decoded as UTF-8, and when it is not valid UTF-8 the text is
+    assumed to be encoded with Windows-1252, or with Latin-1 as a last resort,
+    which decodes any bytes.
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        # a sample may end in the middle of a multibyte character
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    try:
+        sample.decode("cp1252")
+        return "cp1252"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def normalize_encoding(encoding: str) -> str:
+    """Returns an encoding stripping a UTF-8 byte order mark if it is UTF-8."""
+    if codecs.lookup(encoding).name == "utf-8":
+        return "utf-8-sig"
+    return encoding
+
+
+def decode_lines(
+    file: IO[bytes] | io.BufferedIOBase,
+    encoding: str,
+    errors: str = "strict",
+    head: bytes = b"",
+    block_size: int = BLOCK_SIZE,
+) -> Iterator[str]:
+    """Decodes lines of a binary file incrementally in blocks.
+
+    Lines are split on `\\n` only and keep their line endings.
+
+    Arguments:
+        file: A binary file to read.
+        encoding: An encoding of the file.
+        errors: A handling of decoding errors, see `codecs`.
+        head: Bytes already read from the start of the file.
+        block_size: A number of bytes read and decoded at once.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    rest = ""
+    block = head or file.read(block_size)
+    while block:
+        lines = (rest + decoder.decode(block)).split("\n")
+        rest = lines.pop()
+        for line in lines:
+            yield line + "\n"
+        block = file.read(block_size)
+    rest += decoder.decode(b"", final=True)
+    if rest:
+        yield rest
+
+
+@dataclass(kw_only=True)
+class TextEncoding:
+    """Options of decoding a text file.
+
+    Arguments:
+        encoding: An encoding of a file, detected from its first bytes when
+            it is not set, see `detect_encoding`. A UTF-8 byte order mark is
+            always stripped.
+        encoding_errors: A handling of bytes that can not be decoded, for
+            example `replace` to replace them instead of failing the upload.
+    """
+
+    encoding: str | None = field(default=None)
+    encoding_errors: str = field(default="strict")
+
+    @contextlib.contextmanager
+    def _open_text(
+        self: "TextEncoding",
+        path: str | pathlib.Path,
+    ) -> Iterator[TextIO]:
+        encoding = self.encoding
+        if encoding is None:
+            with open(path, mode="rb") as file:
+                encoding = detect_encoding(file.read(SAMPLE_SIZE))
+        with open(
+            path,
+            mode="r",
+            encoding=normalize_encoding(encoding),
+            errors=self.encoding_errors,
+        ) as file:
+            yield file
+
+    def _decode_lines(
+        self: "TextEncoding",
+        file: IO[Any] | io.BufferedIOBase,
+    ) -> Iterator[str]:
+        head = b""
+        encoding = self.encoding
+        if encoding is None:
+            head = file.read(SAMPLE_SIZE)
+            encoding = detect_encoding(head)
+        return decode_lines(
+            file,
+            normalize_encoding(encoding),
+            self.encoding_errors,
+            head,
+        )
@@ -0,0 +1,429 @@
+"""A package that contains a compiler of expressions of computed columns.
+
+Expressions are written in a small subset of Python, for example
+`lean_weight / weight * 100`. An expression is parsed and checked once and
+compiled to a Python function, so a row is evaluated by a single call of
+bytecode instead of interpreting the expression again for every row.
+
+Sources evaluate an expression for a whole batch of rows at once, values of
+the columns it refers to are gathered into arrays and a list comprehension,
+compiled together with the expression, evaluates it for all rows of the batch.
+
+Names in an expression refer to columns, `col("LEAN WEIGHT")` or `col(3)`
+refer to columns which names are not identifiers or to columns of a file
+without a header. Values of columns are converted to numbers by arithmetic
+operators, `+`, `-`, `*`, `/`, `//`, `%` and `**`, and to strings by `&`,
+which concatenates strings. Operands of `**` are converted to floats, so a
+power can not grow into an integer which takes ages to compute. Comparisons,
+`and`, `or`, `not` and conditional expressions `a if condition else b` are
+supported, as well as functions `float`, `int`, `str`, `round`, `abs`, `min`,
+`max`, `lower`, `upper` and `strip`. Attributes, subscripts and any other
+functions are not.
+"""
+
+import ast
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+_ROW = "_row"
+
+_COLUMNS = "_columns"
+
+# a marker of rows which are evaluated one by one
+_INCOMPLETE = object()
+
+_NUMERIC_OPERATORS = (
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+)
+
+_ORDER_OPERATORS = (ast.Lt, ast.LtE, ast.Gt, ast.GtE)
+
+_COMPARISON_OPERATORS = (ast.Eq, ast.NotEq, *_ORDER_OPERATORS)
+
+
+class MissingValue(Exception):  # noqa: N818
+    """Raised when a value of a column needed by an expression is missing."""
+
+
+def _number(value: Any) -> int | float:  # noqa: ANN401
+    if value is None or value == "":
+        raise MissingValue()
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"{value!r} can not be interpreted as a number") from error
+
+
+def _integer(value: Any) -> int:  # noqa: ANN401
+    number = _number(value)
+    if isinstance(number, float):
+        if not number.is_integer():
+            raise ValueError(f"{value!r} can not be interpreted as an integer")
+        return int(number)
+    return number
+
+
+def _real(value: Any) -> float:  # noqa: ANN401
+    return float(_number(value))
+
+
+def _text(value: Any) -> str:  # noqa: ANN401
+    if value is None:
+        raise MissingValue()
+    return value if isinstance(value, str) else str(value)
+
+
+_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "float": lambda _: float(_number(_)),
+    "int": _integer,
+    "str": _text,
+    "round": lambda _, digits=0: round(_number(_), int(_number(digits))),
+    "abs": lambda _: abs(_number(_)),
+    "min": lambda *_: min(_number(value) for value in _),
+    "max": lambda *_: max(_number(value) for value in _),
+    "lower": lambda _: _text(_).lower(),
+    "upper": lambda _: _text(_).upper(),
+    "strip": lambda _: _text(_).strip(),
+}
+
+_ARGUMENTS = {
+    "float": (1, 1),
+    "int": (1, 1),
+    "str": (1, 1),
+    "round": (1, 2),
+    "abs": (1, 1),
+    "min": (1, None),
+    "max": (1, None),
+    "lower": (1, 1),
+    "upper": (1, 1),
+    "strip": (1, 1),
+}
+
+
+def _call(name: str, *arguments: ast.expr) -> ast.expr:
+    return ast.Call(
+        func=ast.Name(id=name, ctx=ast.Load()),
+        args=list(arguments),
+        keywords=[],
+    )
+
+
+@dataclass
+class _Compiler:
+    expression: str
+    columns: list[str | int] = field(default_factory=list)
+
+    def error(self: "_Compiler", message: str) -> ValueError:
+        return ValueError(f"{message} in expression {self.expression!r}")
+
+    def column(self: "_Compiler", column_id: str | int) -> ast.expr:
+        if column_id not in self.columns:
+            self.columns.append(column_id)
+        return ast.Call(
+            func=ast.Attribute(
+                value=ast.Name(id=_ROW, ctx=ast.Load()),
+                attr="get",
+                ctx=ast.Load(),
+            ),
+            args=[ast.Constant(value=column_id)],
+            keywords=[],
+        )
+
+    def compile(self: "_Compiler", node: ast.expr) -> ast.expr:
+        if isinstance(node, ast.Constant):
+            if node.value is not None and not isinstance(
+                node.value, (bool, int, float, str)
+            ):
+                raise self.error(f"constant {node.value!r} is not supported")
+            return ast.Constant(value=node.value)
+        if isinstance(node, ast.Name):
+            return self.column(node.id)
+        if isinstance(node, ast.BinOp):
+            left, right = self.compile(node.left), self.compile(node.right)
+            if isinstance(node.op, ast.BitAnd):
+                return ast.BinOp(
+                    left=_call("_text", left),
+                    op=ast.Add(),
+                    right=_call("_text", right),
+                )
+            if not isinstance(node.op, _NUMERIC_OPERATORS):
+                raise self.error(f"operator {type(node.op).__name__} is not supported")
+            convert = "_real" if isinstance(node.op, ast.Pow) else "_number"
+            return ast.BinOp(
+                left=_call(convert, left),
+                op=node.op,
+                right=_call(convert, right),
+            )
+        if isinstance(node, ast.UnaryOp):
+            operand = self.compile(node.operand)
+            if isinstance(node.op, ast.Not):
+                return ast.UnaryOp(op=node.op, operand=operand)
+            if isinstance(node.op, (ast.USub, ast.UAdd)):
+                return ast.UnaryOp(op=node.op, operand=_call("_number", operand))
+            raise self.error(f"operator {type(node.op).__name__} is not supported")
+        if isinstance(node, ast.BoolOp):
+            return ast.BoolOp(
+                op=node.op,
+                values=[self.compile(_) for _ in node.values],
+            )
+        if isinstance(node, ast.Compare):
+            return self.compare(node)
+        if isinstance(node, ast.IfExp):
+            return ast.IfExp(
+                test=self.compile(node.test),
+                body=self.compile(node.body),
+                orelse=self.compile(node.orelse),
+            )
+        if isinstance(node, ast.Call):
+            return self.call(node)
+        raise self.error(f"{type(node).__name__} is not supported")
+
+    def compare(self: "_Compiler", node: ast.Compare) -> ast.expr:
+        for operator in node.ops:
+            if not isinstance(operator, _COMPARISON_OPERATORS):
+                raise self.error(f"operator {type(operator).__name__} is not supported")
+        operands = [node.left, *node.comparators]
+        constants = [_.value for _ in operands if isinstance(_, ast.Constant)]
+        convert: str | None = None
+        if any(isinstance(_, str) for _ in constants):
+            convert = "_text"
+        elif any(
+            isinstance(_, (int, float)) and not isinstance(_, bool) for _ in constants
+        ) or any(isinstance(_, _ORDER_OPERATORS) for _ in node.ops):
+            convert = "_number"
+        compiled = [
+            _call(convert, self.compile(_))
+            if convert is not None and not isinstance(_, ast.Constant)
+            else self.compile(_)
+            for _ in operands
+        ]
+        return ast.Compare(left=compiled[0], ops=node.ops, comparators=compiled[1:])
+
+    def call(self: "_Compiler", node: ast.Call) -> ast.expr:
+        if not isinstance(node.func, ast.Name):
+            raise self.error("only functions can be called")
+        name = node.func.id
+        if node.keywords or any(isinstance(_, ast.Starred) for _ in node.args):
+            raise self.error(f"function {name} accepts only positional arguments")
+        if name == "col":
+            if (
+                len(node.args) != 1
+                or not isinstance(node.args[0], ast.Constant)
+                or not isinstance(node.args[0].value, (str, int))
+                or isinstance(node.args[0].value, bool)
+            ):
+                raise self.error("col accepts a single name or index of a column")
+            return self.column(node.args[0].value)
+        if name not in _FUNCTIONS:
+            raise self.error(f"function {name} is not supported")
+        least, most = _ARGUMENTS[name]
+        if len(node.args) < least or (most is not None and len(node.args) > most):
+            raise self.error(f"wrong number of arguments of function {name}")
+        return _call(name, *(self.compile(_) for _ in node.args))
+
+
+class _Columns(ast.NodeTransformer):
+    """Replaces lookups of columns in a row with variables of a comprehension."""
+
+    def __init__(self: "_Columns", columns: list[str | int]) -> None:
+        self.columns = columns
+
+    def visit_Call(self: "_Columns", node: ast.Call) -> ast.expr:
+        if (
+            isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == _ROW
+        ):
+            column_id = node.args[0].value  # type: ignore[attr-defined]
+            return ast.Name(id=f"_c{self.columns.index(column_id)}", ctx=ast.Load())
+        self.generic_visit(node)
+        return node
+
+
+def _batch(body: ast.expr, columns: list[str | int]) -> ast.expr:
+    """Returns a comprehension evaluating an expression for arrays of values.
+
+    Rows with an empty value of any column are marked incomplete instead of
+    being evaluated, as the expression may need the missing value.
+    """
+    names = [f"_c{_}" for _ in range(len(columns))]
+    checks: list[ast.expr] = [
+        ast.Compare(
+            left=ast.Name(id=name, ctx=ast.Load()),
+            ops=[ast.NotIn()],
+            comparators=[
+                ast.Tuple(
+                    elts=[ast.Constant(value=None), ast.Constant(value="")],
+                    ctx=ast.Load(),
+                )
+            ],
+        )
+        for name in names
+    ]
+    complete = (
+        ast.BoolOp(op=ast.And(), values=checks)
+        if len(checks) > 1
+        else next(iter(checks), ast.Constant(value=True))
+    )
+    return ast.ListComp(
+        elt=ast.IfExp(
+            test=complete,
+            body=_Columns(columns).visit(body),
+            orelse=ast.Name(id="_INCOMPLETE", ctx=ast.Load()),
+        ),
+        generators=[
+            ast.comprehension(
+                target=ast.Tuple(
+                    elts=[ast.Name(id=name, ctx=ast.Store()) for name in names],
+                    ctx=ast.Store(),
+                ),
+                iter=ast.Call(
+                    func=ast.Name(id="zip", ctx=ast.Load()),
+                    args=[
+                        ast.Starred(
+                            value=ast.Name(id=_COLUMNS, ctx=ast.Load()),
+                            ctx=ast.Load(),
+                        )
+                    ],
+                    keywords=[],
+                ),
+                ifs=[],
+                is_async=0,
+            )
+        ],
+    )
+
+
+def _lambda(argument: str, body: ast.expr) -> ast.Expression:
+    return ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(arg=argument)],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=body,
+        ),
+    )
+
+
+@dataclass
+class Expression:
+    """A compiled expression, see `compile_expression`.
+
+    Arguments:
+        expression: A text of the expression.
+        columns: Identifiers of columns the expression refers to.
+    """
+
+    expression: str
+    columns: list[str | int]
+    _function: Callable[[dict[str | int, Any]], Any] = field(repr=False)
+    _batch: Callable[[list[list[Any]]], list[Any]] = field(repr=False)
+
+    def evaluate(
+        self: "Expression",
+        data: dict[str | int, Any],
+    ) -> Any:  # noqa: ANN401
+        """Evaluates the expression for a row.
+
+        Returns:
+            A value of the expression, or `None` if a value of a column the
+            expression needs is missing.
+
+        Raises:
+            ValueError: if the expression can not be evaluated for the row,
+                for example because of a division by zero.
+        """
+        try:
+            return self._function(data)
+        except MissingValue:
+            return None
+        except ArithmeticError as error:
+            raise ValueError(
+                f"expression {self.expression!r} can not be evaluated: {error}"
+            ) from error
+
+    def evaluate_batch(
+        self: "Expression",
+        rows: list[dict[str | int, Any]],
+    ) -> list[Any]:
+        """Evaluates the expression for a batch of rows.
+
+        Values of the columns are gathered into arrays and the expression is
+        evaluated for all rows by a single comprehension. Only rows with an
+        empty value, and all rows of a batch the comprehension fails for, are
+        evaluated one by one, see `evaluate`.
+
+        Returns:
+            Values of the expression, `None` for rows missing a value the
+            expression needs, or the exception raised for rows for which the
+            expression can not be evaluated.
+        """
+        if not self.columns:
+            values = [_INCOMPLETE] * len(rows)
+        else:
+            try:
+                values = self._batch(
+                    [[data.get(_, None) for data in rows] for _ in self.columns]
+                )
+            except (MissingValue, ArithmeticError, TypeError, ValueError):
+                values = [_INCOMPLETE] * len(rows)
+        for index, value in enumerate(values):
+            if value is _INCOMPLETE:
+                try:
+                    values[index] = self.evaluate(rows[index])
+                except (TypeError, ValueError) as error:
+                    values[index] = error
+        return values
+
+
+def compile_expression(expression: str) -> Expression:
+    """Compiles an expression of a computed column.
+
+    Raises:
+        ValueError: if the expression is not valid or uses a construct which
+            is not supported.
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as error:
+        raise ValueError(f"expression {expression!r} is not valid") from error
+    compiler = _Compiler(expression)
+    body = compiler.compile(tree.body)
+    scope: dict[str, Any] = {
+        "__builtins__": {},
+        "_number": _number,
+        "_real": _real,
+        "_text": _text,
+        "_INCOMPLETE": _INCOMPLETE,
+        "zip": zip,
+        **_FUNCTIONS,
+    }
+    function = compile(
+        ast.fix_missing_locations(_lambda(_ROW, copy.deepcopy(body))),
+        "<expression>",
+        "eval",
+    )
+    batch = compile(
+        ast.fix_missing_locations(_lambda(_COLUMNS, _batch(body, compiler.columns))),
+        "<expression>",
+        "eval",
+    )
+    return Expression(
+        expression=expression,
+        columns=compiler.columns,
+        _function=eval(function, scope),
+        _batch=eval(batch, scope),
+    )
@@ -0,0 +1,301 @@
+"""A package that contains a pre-flight check of CSV sources.
+
+A misconfigured column is otherwise discovered only when its value fails to
+convert somewhere in the middle of an upload. The check samples rows from the
+head, the tail and random offsets of a file, so it takes about the same time
+for any size of a file, and runs the configured columns on them.
+"""
+
+import contextlib
+import csv
+import dataclasses
+import io
+import pathlib
+import random
+from dataclasses import dataclass, field
+from datetime import date
+from typing import IO, Any, Iterator
+
+from .base import CharacteristicColumnExpression, Column
+from .encoding import SAMPLE_SIZE, detect_encoding, normalize_encoding
+from .source import CSVFileSource
+
+_BOOLEANS = {"true", "false", "yes", "no", "y", "n", "t", "f"}
+_MESSAGES = 3
+
+
+@dataclass
+class ColumnPreflight:
+    """A result of the pre-flight check of a column.
+
+    Arguments:
+        column_id: An identifier of the column.
+        inferred_type: A type matching all sampled values of the column, one
+            of `empty`, `integer`, `float`, `boolean`, `date` or `string`.
+        values: A number of sampled values.
+        empty: A number of empty sampled values.
+        errors: A number of sampled values that can not be converted.
+        messages: Messages of the first conversion errors.
+    """
+
+    column_id: str | int
+    inferred_type: str = field(default="empty")
+    values: int = field(default=0)
+    empty: int = field(default=0)
+    errors: int = field(default=0)
+    messages: list[str] = field(default_factory=list)
+
+    @property
+    def error_rate(self: "ColumnPreflight") -> float:
+        return self.errors / self.values if self.values else 0.0
+
+
+@dataclass
+class PreflightReport:
+    """A result of the pre-flight check of a source.
+
+    Arguments:
+        rows: A number of sampled rows.
+        encoding: An encoding used to decode the file.
+        malformed: A number of sampled rows that can not be parsed or
+            decoded.
+        missing_columns: Configured columns that are not present in the file.
+        columns: Results of the configured columns.
+    """
+
+    rows: int = field(default=0)
+    encoding: str = field(default="utf-8")
+    malformed: int = field(default=0)
+    missing_columns: list[str | int] = field(default_factory=list)
+    columns: list[ColumnPreflight] = field(default_factory=list)
+
+    def problems(
+        self: "PreflightReport",
+        max_error_rate: float = 0.0,
+    ) -> list[str]:
+        """Returns descriptions of all problems found by the check."""
+        problems: list[str] = []
+        if self.missing_columns:
+            problems.append(
+                "columns "
+                + ", ".join(str(_) for _ in self.missing_columns)
+                + " are not present in the file"
+            )
+        if self.malformed:
+            problems.append(f"{self.malformed} of {self.rows} rows are malformed")
+        for column in self.columns:
+            if column.errors and column.error_rate > max_error_rate:
+                problems.append(
+                    f"column {column.column_id} of type {column.inferred_type}"
+                    f" can not be converted in {column.errors} of"
+                    f" {column.values} rows: {'; '.join(column.messages)}"
+                )
+        return problems
+
+    def raise_for_problems(
+        self: "PreflightReport",
+        max_error_rate: float = 0.0,
+    ) -> None:
+        """Raises an exception if the check has found any problem."""
+        if problems := self.problems(max_error_rate):
+            raise ValueError("pre-flight check failed: " + ", ".join(problems))
+
+
+def find_columns(source: Any) -> list[Column]:  # noqa: ANN401
+    """Returns all columns configured in a source."""
+    columns: list[Column] = []
+    for _ in dataclasses.fields(source):
+        value = getattr(source, _.name)
+        if isinstance(value, Column):
+            columns.append(value)
+        elif isinstance(value, list):
+            columns.extend(column for column in value if isinstance(column, Column))
+    return columns
+
+
+def _sample_value(column: Column, data: dict[str | int, Any]) -> Any:  # noqa: ANN401
+    if isinstance(column, CharacteristicColumnExpression):
+        try:
+            return column.expression.evaluate(data)
+        except ValueError:
+            return None
+    return data.get(column.column_id, None)
+
+
+def infer_type(value: Any) -> str:  # noqa: ANN401
+    """Returns the most specific type a value can be interpreted as."""
+    if value is None or value == "":
+        return "empty"
+    if not isinstance(value, str):
+        return type(value).__name__
+    try:
+        int(value)
+        return "integer"
+    except ValueError:
+        pass
+    try:
+        float(value)
+        return "float"
+    except ValueError:
+        pass
+    if value.lower() in _BOOLEANS:
+        return "boolean"
+    try:
+        date.fromisoformat(value)
+        return "date"
+    except ValueError:
+        pass
+    return "string"
+
+
+def _merge_types(current: str, new: str) -> str:
+    if current == new or new == "empty":
+        return current
+    if current == "empty":
+        return new
+    if {current, new} == {"integer", "float"}:
+        return "float"
+    return "string"
+
+
+def _sample_lines(
+    file: IO[bytes],
+    has_header: bool,
+    sample_size: int,
+    seed: int,
+) -> tuple[bytes | None, list[bytes]]:
+    file.seek(0)
+    header = file.readline() if has_header else None
+    start = file.tell()
+    total = file.seek(0, io.SEEK_END)
+    lines: dict[int, bytes] = {}
+
+    def read_from(position: int) -> Iterator[tuple[int, bytes]]:
+        file.seek(position)
+        if position > start:
+            file.readline()
+        while True:
+            offset = file.tell()
+            if not (line := file.readline()):
+                return
+            yield offset, line
+
+    part = max(1, sample_size // 3)
+    for offset, line in read_from(start):
+        if len(lines) >= part:
+            break
+        lines[offset] = line
+    if not lines:
+        return header, []
+    width = max(1, sum(len(_) for _ in lines.values()) // len(lines))
+    for offset, line in read_from(max(start, total - 2 * width * part)):
+        lines.setdefault(offset, line)
+    generator = random.Random(seed)
+    for position in sorted(generator.randrange(start, total) for _ in range(part)):
+        for offset, line in read_from(position):
+            lines.setdefault(offset, line)
+            break
+    return header, [lines[_] for _ in sorted(lines)]
+
+
+@contextlib.contextmanager
+def _open(source: CSVFileSource[Any]) -> Iterator[IO[bytes]]:
+    if isinstance(source.path, (str, pathlib.Path)):
+        with open(source.path, "rb") as file:
+            yield file
+        return
+    if not source.path.seekable():
+        raise ValueError("pre-flight check requires a seekable file")
+    yield source.path  # type: ignore[misc]
+
+
+def preflight(
+    source: CSVFileSource[Any],
+    sample_size: int = 1000,
+    seed: int = 0,
+) -> PreflightReport:
+    """Checks the configuration of a source on a sample of its rows.
+
+    The check reads the header and about `sample_size` rows from the head,
+    the tail and random offsets of the file, then infers types of configured
+    columns and converts their values as an upload would.
+
+    Args:
+        source: a CSV source reading a file from a path or a seekable buffer.
+        sample_size: an approximate number of sampled rows.
+        seed: a seed of random offsets.
+
+    Returns:
+        A report of the check.
+    """
+    if sample_size <= 0:
+        raise ValueError("sample size must be more than 0")
+    with _open(source) as file:
+        position = file.tell()
+        try:
+            file.seek(0)
+            encoding = source.encoding or detect_encoding(file.read(SAMPLE_SIZE))
+            header, lines = _sample_lines(file, source.has_header, sample_size, seed)
+        finally:
+            file.seek(position)
+
+    def parse(line: bytes) -> list[str]:
+        return next(
+            csv.reader(
+                [
+                    line.decode(
+                        normalize_encoding(encoding),
+                        source.encoding_errors,
+                    ).rstrip("\r\n")
+                ],
+                delimiter=source.delimiter,
+                strict=True,
+            ),
+            [],
+        )
+
+    columns = find_columns(source)
+    report = PreflightReport(rows=len(lines), encoding=encoding)
+    names: list[str] = parse(header) if header is not None else []
+    width = len(names)
+    rows: list[dict[str | int, Any]] = []
+    for line in lines:
+        try:
+            row = parse(line)
+        except (csv.Error, UnicodeDecodeError):
+            report.malformed += 1
+            continue
+        width = max(width, len(row))
+        if header is not None:
+            rows.append(dict(zip(names, row, strict=False)))
+        else:
+            rows.append(dict(enumerate(row)))
+    for column in columns:
+        # a column can read values of more columns, for example a unit column
+        # or columns an expression refers to
+        for column_id in column.column_ids:
+            present = (
+                column_id in names
+                if header is not None
+                else isinstance(column_id, int) and column_id < width
+            )
+            if not present and column_id not in report.missing_columns:
+                report.missing_columns.append(column_id)
+        result = ColumnPreflight(column_id=column.column_id)
+        get_value = getattr(column, "get_value", None)
+        for data in rows:
+            value = _sample_value(column, data)
+            result.values += 1
+            result.inferred_type = _merge_types(result.inferred_type, infer_type(value))
+            if value is None or value == "":
+                result.empty += 1
+            if get_value is None:
+                continue
+            try:
+                get_value(data)
+            except ValueError as error:
+                result.errors += 1
+                if len(result.messages) < _MESSAGES:
+                    result.messages.append(str(error))
+        report.columns.append(result)
+    return report
@@ -1,35 +1,245 @@
 """A package that contains actual implementation of various CSV sources"""
 
+import contextlib
 import csv
 import io
+import itertools
+import operator
 import pathlib
+import zlib
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any, AsyncIterator, Iterable
-
-import anyio
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    TypeVar,
+)
 
+from volur.pork.bom.v1alpha1 import bom_pb2
 from volur.pork.demand.v1alpha2 import demand_pb2
 from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.product_inventory.v1alpha1 import product_inventory_pb2
 from volur.pork.products.v1alpha3 import product_pb2
 
+from ...progress import FileProgress
+from ..core import RowSource
+from ..mapping import (
+    BomMapping,
+    DemandMapping,
+    MaterialsMapping,
+    ProductInventoryMapping,
+    ProductsMapping,
+)
 from .base import (
-    CharacteristicColumn,
+    BomSource,
     Column,
     DemandSource,
     MaterialsSource,
+    ProductInventorySource,
     ProductsSource,
-    QuantityColumn,
 )
+from .encoding import TextEncoding
+
+T = TypeVar("T")
+
+
+def row_to_data_by_index(
+    columns: list[str | int],
+) -> Callable[[list[str]], dict[str | int, Any]]:
+    """Creates a function that maps a row of a file without header to data.
+
+    Column indices are resolved once, so mapping a row only picks the
+    configured fields instead of building a dictionary of the whole row.
+    Fields missing in a short row are left out of the data.
+    """
+    indices: list[int] = []
+    for column in columns:
+        if not isinstance(column, int):
+            raise ValueError(
+                f"column {column} must be referenced by index in a file without header"
+            )
+        if column not in indices:
+            indices.append(column)
+    if not indices:
+        return lambda _: {}
+    width = max(indices) + 1
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda _: {index: _[index]} if len(_) > index else {}
+    getter = operator.itemgetter(*indices)
+
+    def to_data(row: list[str]) -> dict[str | int, Any]:
+        if len(row) >= width:
+            return dict(zip(indices, getter(row), strict=True))
+        return {index: row[index] for index in indices if index < len(row)}
+
+    return to_data
+
+
+def row_to_data_by_name(
+    header: list[str],
+    columns: list[str | int],
+) -> Callable[[list[str]], dict[str | int, Any]]:
+    """Creates a function that maps a row of a file with header to data.
+
+    Column names are resolved to indices once, so mapping a row only picks
+    the configured fields instead of zipping the whole row with the header.
+    """
+    indices: dict[str | int, int] = {}
+    for column in columns:
+        if isinstance(column, int):
+            indices[column] = column
+        elif column in header:
+            indices[column] = header.index(column)
+        else:
+            raise ValueError(f"column {column} is not present in the header")
+    items = list(indices.items())
+
+    def to_data(row: list[str]) -> dict[str | int, Any]:
+        width = len(row)
+        return {column: row[index] for column, index in items if index < width}
+
+    return to_data
+
+
+@dataclass(kw_only=True)
+class RowSelection:
+    """Options selecting a subset of rows of a file.
+
+    Rows are selected after they are parsed, so a quoted field spanning more
+    than one line is part of a single row, but before they are converted.
+    Sampling is deterministic, the same rows are selected on every run.
+
+    Arguments:
+        offset: A number of rows skipped at the start of a file.
+        limit: A maximum number of rows read from a file.
+        sample_rate: A fraction of rows read from a file, from 0 to 1.
+        sample_by_key: A column whose value decides whether a row is sampled,
+            so all rows with the same key are either read or skipped.
+    """
+
+    offset: int = field(default=0)
+    limit: int | None = field(default=None)
+    sample_rate: float | None = field(default=None)
+    sample_by_key: Column | None = field(default=None)
+
+    def __post_init__(self: "RowSelection") -> None:
+        if self.offset < 0:
+            raise ValueError("offset can not be negative")
+        if self.limit is not None and self.limit < 0:
+            raise ValueError("limit can not be negative")
+        if self.sample_rate is not None and not 0 <= self.sample_rate <= 1:
+            raise ValueError("sample rate must be between 0 and 1")
+        if self.sample_by_key is not None and self.sample_rate is None:
+            raise ValueError("sample rate must be set to sample by key")
+
+    def _sampled(
+        self: "RowSelection",
+        header: list[str] | None,
+        delimiter: str,
+    ) -> Callable[[list[str]], bool] | None:
+        if self.sample_rate is None:
+            return None
+        threshold = int(self.sample_rate * (1 << 32))
+        if self.sample_by_key is None:
+            return lambda _: zlib.crc32(delimiter.join(_).encode()) < threshold
+        column_id = self.sample_by_key.column_id
+        if isinstance(column_id, int):
+            index = column_id
+        elif header is not None and column_id in header:
+            index = header.index(column_id)
+        else:
+            raise ValueError(f"column {column_id} is not present in the header")
+
+        def sampled(row: list[str]) -> bool:
+            key = row[index] if index < len(row) else ""
+            return zlib.crc32(key.encode()) < threshold
+
+        return sampled
+
+    def _select(
+        self: "RowSelection",
+        delimiter: str,
+        rows: Iterable[list[str]],
+        header: list[str] | None,
+    ) -> Iterable[list[str]]:
+        """Selects parsed rows of a file following its header."""
+        if self.offset:
+            rows = itertools.islice(rows, self.offset, None)
+        if sampled := self._sampled(header, delimiter):
+            rows = filter(sampled, rows)
+        if self.limit is not None:
+            rows = itertools.islice(rows, self.limit)
+        return rows
+
+
+@dataclass
+class CSVFileSource(RowSelection, TextEncoding, FileProgress, RowSource[T]):
+    """Base class for CSV sources.
+
+    Rows are parsed by a single CSV reader and converted to entities in
+    batches of `batch_size` rows in a worker thread, so the event loop is
+    entered once per batch instead of once per row. Columns are resolved to
+    indices of the header once for the whole file.
+
+    Arguments:
+        path: A path to the CSV file or a binary file object.
+        has_header: Whether the first line of the file is a header, columns
+            of a file without a header are referenced by their index.
+        delimiter: A delimiter used in the CSV file.
+        batch_size: A number of rows parsed and converted at once.
+    """
+
+    path: str | pathlib.Path | io.BufferedIOBase
+    has_header: bool = field(default=True)
+    delimiter: str = field(
+        default=",",
+    )
+    batch_size: int = field(default=1024, kw_only=True)
 
+    def __post_init__(self: "CSVFileSource[T]") -> None:
+        super().__post_init__()
+        if self.batch_size <= 0:
+            raise ValueError("batch size must be more than 0")
 
-def buffered_io_base_to_str_iterable(source: io.BufferedIOBase) -> Iterable[str]:
-    while data := source.readline():
-        yield data.strip().decode(encoding="utf-8")
+    @contextlib.contextmanager
+    def _open_lines(
+        self: "CSVFileSource[T]",
+    ) -> Iterator[Iterator[str]]:
+        if isinstance(self.path, io.BufferedIOBase):
+            self._track(self.path)
+            yield iter(self._decode_lines(self.path))
+            return
+        with self._open_text(self.path) as source:
+            self._track(source)
+            yield source
+
+    def _read_rows(
+        self: "CSVFileSource[T]",
+    ) -> Generator[list[dict[str | int, Any]], None, None]:
+        with self._open_lines() as lines:
+            rows = csv.reader(lines, delimiter=self.delimiter, strict=True)
+            header: list[str] | None = None
+            if self.has_header:
+                header = next(rows, [])
+                to_data = row_to_data_by_name(header, self.columns)
+            else:
+                to_data = row_to_data_by_index(self.columns)
+            selected = iter(self._select(self.delimiter, rows, header))
+            while batch := [
+                to_data(_) for _ in itertools.islice(selected, self.batch_size)
+            ]:
+                yield batch
 
 
 @dataclass
-class MaterialsCSVFileSource(MaterialsSource):
+class MaterialsCSVFileSource(
+    MaterialsMapping,
+    CSVFileSource[material_pb2.Material],
+    MaterialsSource,
+):
     """A CSV source for Materials.
 
     This class simplifies the upload of Materials Information using CSV.
@@ -40,6 +250,9 @@ class MaterialsCSVFileSource(MaterialsSource):
         delimiter: A delimiter used in CSV file
         plant_id_column: A column that is used to reference a production plant where material is used
         quantity_column: A column that represent the quantity of material
+        type_column: A column that represent the type of material, see `EnumColumn`
+        arrived_at_column: A column that represent when the material has arrived
+        expires_at_column: A column that represent when the material expires
         characteristics_columns: Specifies a list of arbitrary characteristics of a given material
 
     Examples:
@@ -91,176 +304,13 @@ class MaterialsCSVFileSource(MaterialsSource):
         ```
     """  # noqa: E501
 
-    path: str | pathlib.Path | io.BufferedIOBase
-    has_header: bool = field(default=True)
-    _data: AsyncIterator[material_pb2.Material] | None = field(
-        default=None,
-        init=False,
-        repr=False,
-    )
-    delimiter: str = field(
-        default=",",
-    )
-    material_id_column: Column | None = field(default=None)
-    plant_id_column: Column | None = field(default=None)
-    quantity_column: QuantityColumn | None = field(default=None)
-    characteristics_columns: list[CharacteristicColumn] = field(
-        default_factory=list,
-    )
-
-    @property
-    def columns(
-        self: "MaterialsCSVFileSource",
-    ) -> list[str | int]:
-        _: list[str | int] = []
-        if self.material_id_column:
-            if self.material_id_column:
-                _.append(self.material_id_column.column_id)
-        if self.plant_id_column:
-            _.append(self.plant_id_column.column_id)
-        if self.quantity_column:
-            _.append(self.quantity_column.column_id)
-        if self.characteristics_columns:
-            for characteristic in self.characteristics_columns:
-                _.append(characteristic.column_id)
-        return _
-
-    def __aiter__(
-        self: "MaterialsCSVFileSource",
-    ) -> AsyncIterator[material_pb2.Material]:
-        self._data = self._load()
-        return self
-
-    async def __anext__(
-        self: "MaterialsCSVFileSource",
-    ) -> material_pb2.Material:
-        if self._data is None:
-            self._data = self._load()
-        data = await anext(self._data, None)
-        if data is None:
-            raise StopAsyncIteration()
-        return data
-
-    def _load(
-        self: "MaterialsCSVFileSource",
-    ) -> AsyncIterator[material_pb2.Material]:
-        return (
-            self._load_data_from_a_file_with_header()
-            if self.has_header
-            else self._load_data_from_a_file_without_header()
-        )
-
-    async def _load_data_from_a_file_with_header(
-        self: "MaterialsCSVFileSource",
-    ) -> AsyncIterator[material_pb2.Material]:
-        if isinstance(self.path, io.BufferedIOBase):
-            reader = csv.DictReader(
-                buffered_io_base_to_str_iterable(self.path),
-                delimiter=self.delimiter,
-            )
-            for data in reader:
-                yield self._create_material(data)
-        if isinstance(self.path, (str, Path)):
-            with open(self.path, mode="r") as source:
-                reader = csv.reader(  # type: ignore[assignment]
-                    source,
-                    delimiter=self.delimiter,
-                    strict=True,
-                )
-                header = next(reader)
-                async for row in anyio.wrap_file(source):
-                    data = dict(
-                        zip(
-                            header,
-                            next(
-                                csv.reader(
-                                    [row],
-                                    delimiter=self.delimiter,
-                                    strict=True,
-                                )
-                            ),
-                            strict=False,
-                        ),
-                    )
-                    yield self._create_material(data)
-
-    async def _load_data_from_a_file_without_header(
-        self: "MaterialsCSVFileSource",
-    ) -> AsyncIterator[material_pb2.Material]:
-        if isinstance(self.path, io.BufferedIOBase):
-            dialect = csv.Sniffer().sniff(self.path.read(1024).decode("utf-8"))
-            self.path.seek(0)
-            reader = csv.reader(
-                buffered_io_base_to_str_iterable(self.path),
-                dialect=dialect,
-                strict=True,
-            )
-            first_row = next(reader)
-            number_of_columns = max(
-                max(self.columns),
-                len(first_row),
-            )
-            self.path.seek(0)
-            reader = csv.reader(
-                buffered_io_base_to_str_iterable(self.path),
-                dialect=dialect,
-                strict=True,
-            )
-            for _ in reader:
-                data = dict(zip(range(number_of_columns), _, strict=False))  # type: ignore[arg-type]
-                print(data)
-                yield self._create_material(data)  # type: ignore[arg-type]
-        if isinstance(self.path, (str, Path)):
-            with open(self.path, mode="r") as source:
-                reader = csv.reader(
-                    source,
-                    delimiter=self.delimiter,
-                    strict=True,
-                )
-                first_row = next(reader)
-                number_of_columns = max(max(self.columns), len(first_row))
-                source.seek(0)
-                async for row in anyio.wrap_file(source):
-                    data = dict(
-                        zip(
-                            range(number_of_columns),  # type: ignore[arg-type]
-                            next(
-                                csv.reader(
-                                    [row],
-                                    delimiter=self.delimiter,
-                                    strict=True,
-                                )
-                            ),
-                            strict=False,
-                        ),
-                    )
-                    yield self._create_material(data)  # type: ignore[arg-type]
-
-    def _create_material(
-        self: "MaterialsCSVFileSource",
-        data: dict[str | int, Any],
-    ) -> material_pb2.Material:
-        material = material_pb2.Material()
-        if self.material_id_column:
-            material.material_id = data.get(
-                self.material_id_column.column_id,
-                None,
-            )
-            # todo: support auto-generation of material_id
-        if self.plant_id_column:
-            material.plant = data.get(self.plant_id_column.column_id, None)
-        if self.quantity_column:
-            quantity = self.quantity_column.get_value(data)
-            material.quantity.CopyFrom(quantity)
-        if self.characteristics_columns:
-            material.characteristics.extend(
-                [column.get_value(data) for column in self.characteristics_columns]
-            )
-        return material
-
 
 @dataclass
-class ProductsCSVFileSource(ProductsSource):
+class ProductsCSVFileSource(
+    ProductsMapping,
+    CSVFileSource[product_pb2.Product],
+    ProductsSource,
+):
     """A CSV source for Products.
 
     This class simplifies the upload of Product Information using CSV.
@@ -306,164 +356,13 @@ class ProductsCSVFileSource(ProductsSource):
         ```
     """  # noqa: E501
 
-    path: str | pathlib.Path | io.BufferedIOBase
-    has_header: bool = field(default=True)
-    _data: AsyncIterator[product_pb2.Product] | None = field(
-        default=None,
-        init=False,
-        repr=False,
-    )
-    delimiter: str = field(
-        default=",",
-    )
-    product_id_column: Column | None = field(default=None)
-    characteristics_columns: list[CharacteristicColumn] = field(
-        default_factory=list,
-    )
-
-    @property
-    def columns(
-        self: "ProductsCSVFileSource",
-    ) -> list[str | int]:
-        _: list[str | int] = []
-        if self.product_id_column:
-            if self.product_id_column:
-                _.append(self.product_id_column.column_id)
-        if self.characteristics_columns:
-            for characteristic in self.characteristics_columns:
-                _.append(characteristic.column_id)
-        return _
-
-    def __aiter__(
-        self: "ProductsCSVFileSource",
-    ) -> AsyncIterator[product_pb2.Product]:
-        self._data = self._load()
-        return self
-
-    async def __anext__(
-        self: "ProductsCSVFileSource",
-    ) -> product_pb2.Product:
-        if self._data is None:
-            self._data = self._load()
-        data = await anext(self._data, None)
-        if data is None:
-            raise StopAsyncIteration()
-        return data
-
-    def _load(
-        self: "ProductsCSVFileSource",
-    ) -> AsyncIterator[product_pb2.Product]:
-        return (
-            self._load_data_from_a_file_with_header()
-            if self.has_header
-            else self._load_data_from_a_file_without_header()
-        )
-
-    async def _load_data_from_a_file_with_header(
-        self: "ProductsCSVFileSource",
-    ) -> AsyncIterator[product_pb2.Product]:
-        if isinstance(self.path, io.BufferedIOBase):
-            reader = csv.DictReader(
-                buffered_io_base_to_str_iterable(self.path),
-                delimiter=self.delimiter,
-            )
-            for data in reader:
-                yield self._create_product(data)
-        if isinstance(self.path, (str, Path)):
-            with open(self.path, mode="r") as source:
-                reader = csv.reader(  # type: ignore[assignment]
-                    source,
-                    delimiter=self.delimiter,
-                    strict=True,
-                )
-                header = next(reader)
-                async for row in anyio.wrap_file(source):
-                    data = dict(
-                        zip(
-                            header,
-                            next(
-                                csv.reader(
-                                    [row],
-                                    delimiter=self.delimiter,
-                                    strict=True,
-                                )
-                            ),
-                            strict=False,
-                        ),
-                    )
-                    yield self._create_product(data)
-
-    async def _load_data_from_a_file_without_header(
-        self: "ProductsCSVFileSource",
-    ) -> AsyncIterator[product_pb2.Product]:
-        if isinstance(self.path, io.BufferedIOBase):
-            dialect = csv.Sniffer().sniff(self.path.read(1024).decode("utf-8"))
-            self.path.seek(0)
-            reader = csv.reader(
-                buffered_io_base_to_str_iterable(self.path),
-                dialect=dialect,
-                strict=True,
-            )
-            first_row = next(reader)
-            number_of_columns = max(
-                max(self.columns),
-                len(first_row),
-            )
-            self.path.seek(0)
-            reader = csv.reader(
-                buffered_io_base_to_str_iterable(self.path),
-                dialect=dialect,
-                strict=True,
-            )
-            for _ in reader:
-                data = dict(zip(range(number_of_columns), _, strict=False))  # type: ignore[arg-type]
-                print(data)
-                yield self._create_product(data)  # type: ignore[arg-type]
-        if isinstance(self.path, (str, Path)):
-            with open(self.path, mode="r") as source:
-                reader = csv.reader(
-                    source,
-                    delimiter=self.delimiter,
-                    strict=True,
-                )
-                first_row = next(reader)
-                number_of_columns = max(max(self.columns), len(first_row))
-                source.seek(0)
-                async for row in anyio.wrap_file(source):
-                    data = dict(
-                        zip(
-                            range(number_of_columns),  # type: ignore[arg-type]
-                            next(
-                                csv.reader(
-                                    [row],
-                                    delimiter=self.delimiter,
-                                    strict=True,
-                                )
-                            ),
-                            strict=False,
-                        ),
-                    )
-                    yield self._create_product(data)  # type: ignore[arg-type]
-
-    def _create_product(
-        self: "ProductsCSVFileSource",
-        data: dict[str | int, Any],
-    ) -> product_pb2.Product:
-        product = product_pb2.Product()
-        if self.product_id_column:
-            product.product_id = data.get(
-                self.product_id_column.column_id,
-                None,
-            )
-        if self.characteristics_columns:
-            product.characteristics.extend(
-                [column.get_value(data) for column in self.characteristics_columns]
-            )
-        return product
-
 
 @dataclass
-class DemandCSVFileSource(DemandSource):
+class DemandCSVFileSource(
+    DemandMapping,
+    CSVFileSource[demand_pb2.Demand],
+    DemandSource,
+):
     """A CSV source for Demand.
 
     This class simplifies the upload of Demand Information using CSV.
@@ -518,167 +417,93 @@ class DemandCSVFileSource(DemandSource):
         ```
     """  # noqa: E501
 
-    path: str | pathlib.Path | io.BufferedIOBase
-    has_header: bool = field(default=True)
-    _data: AsyncIterator[demand_pb2.Demand] | None = field(
-        default=None,
-        init=False,
-        repr=False,
-    )
-    delimiter: str = field(
-        default=",",
-    )
-    product_id_column: Column | None = field(default=None)
-    plant_id_column: Column | None = field(default=None)
-    customer_id_column: Column | None = field(default=None)
-    quantity_column: QuantityColumn | None = field(default=None)
-    characteristics_columns: list[CharacteristicColumn] = field(
-        default_factory=list,
-    )
 
-    @property
-    def columns(
-        self: "DemandCSVFileSource",
-    ) -> list[str | int]:
-        _: list[str | int] = []
-        if self.product_id_column:
-            if self.product_id_column:
-                _.append(self.product_id_column.column_id)
-        if self.characteristics_columns:
-            for characteristic in self.characteristics_columns:
-                _.append(characteristic.column_id)
-        return _
-
-    def __aiter__(
-        self: "DemandCSVFileSource",
-    ) -> AsyncIterator[demand_pb2.Demand]:
-        self._data = self._load()
-        return self
-
-    async def __anext__(
-        self: "DemandCSVFileSource",
-    ) -> demand_pb2.Demand:
-        if self._data is None:
-            self._data = self._load()
-        data = await anext(self._data, None)
-        if data is None:
-            raise StopAsyncIteration()
-        return data
-
-    def _load(
-        self: "DemandCSVFileSource",
-    ) -> AsyncIterator[demand_pb2.Demand]:
-        return (
-            self._load_data_from_a_file_with_header()
-            if self.has_header
-            else self._load_data_from_a_file_without_header()
+@dataclass
+class ProductInventoryCSVFileSource(
+    ProductInventoryMapping,
+    CSVFileSource[product_inventory_pb2.ProductInventory],
+    ProductInventorySource,
+):
+    """A CSV source for Product Inventory.
+
+    This class simplifies the upload of Product Inventory Information using
+    CSV. Inventory is updated often, so rows are read in batches, see
+    `CSVFileSource`.
+
+    Arguments:
+        path: A path to the CSV file containing product inventory information.
+        product_id_column: A column that is used to identify a product in a dataset
+        delimiter: A delimiter used in CSV file
+        plant_id_column: A column that is used to reference a plant where the inventory is located
+        quantity_column: A column that represent the available quantity of a product
+        weight_column: A column that represent the weight of the inventory
+        available_at_column: A column that represent when the inventory is available to use
+        expires_at_column: A column that represent when the inventory expires
+        characteristics_columns: Specifies a list of arbitrary characteristics of the inventory
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = ProductInventoryCSVFileSource(
+            "inventory.csv",
+            product_id_column=Column(
+                "product_id",
+            ),
+            plant_id_column=Column(
+                "plant",
+            ),
+            quantity_column=QuantityColumn(
+                "pieces",
+                unit="piece",
+            ),
+            characteristics_columns=[
+                CharacteristicColumnString(
+                    column_name="status",
+                    characteristic_name="status",
+                ),
+            ],
         )
+        ```
+    """  # noqa: E501
 
-    async def _load_data_from_a_file_with_header(
-        self: "DemandCSVFileSource",
-    ) -> AsyncIterator[demand_pb2.Demand]:
-        if isinstance(self.path, io.BufferedIOBase):
-            reader = csv.DictReader(
-                buffered_io_base_to_str_iterable(self.path),
-                delimiter=self.delimiter,
-            )
-            for data in reader:
-                yield self._create_demand(data)
-        if isinstance(self.path, (str, Path)):
-            with open(self.path, mode="r") as source:
-                reader = csv.reader(  # type: ignore[assignment]
-                    source,
-                    delimiter=self.delimiter,
-                    strict=True,
-                )
-                header = next(reader)
-                async for row in anyio.wrap_file(source):
-                    data = dict(
-                        zip(
-                            header,
-                            next(
-                                csv.reader(
-                                    [row],
-                                    delimiter=self.delimiter,
-                                    strict=True,
-                                )
-                            ),
-                            strict=False,
-                        ),
-                    )
-                    yield self._create_demand(data)
-
-    async def _load_data_from_a_file_without_header(
-        self: "DemandCSVFileSource",
-    ) -> AsyncIterator[demand_pb2.Demand]:
-        if isinstance(self.path, io.BufferedIOBase):
-            dialect = csv.Sniffer().sniff(self.path.read(1024).decode("utf-8"))
-            self.path.seek(0)
-            reader = csv.reader(
-                buffered_io_base_to_str_iterable(self.path),
-                dialect=dialect,
-                strict=True,
-            )
-            first_row = next(reader)
-            number_of_columns = max(
-                max(self.columns),
-                len(first_row),
-            )
-            self.path.seek(0)
-            reader = csv.reader(
-                buffered_io_base_to_str_iterable(self.path),
-                dialect=dialect,
-                strict=True,
-            )
-            for _ in reader:
-                data = dict(zip(range(number_of_columns), _, strict=False))  # type: ignore[arg-type]
-                print(data)
-                yield self._create_demand(data)  # type: ignore[arg-type]
-        if isinstance(self.path, (str, Path)):
-            with open(self.path, mode="r") as source:
-                reader = csv.reader(
-                    source,
-                    delimiter=self.delimiter,
-                    strict=True,
-                )
-                first_row = next(reader)
-                number_of_columns = max(max(self.columns), len(first_row))
-                source.seek(0)
-                async for row in anyio.wrap_file(source):
-                    data = dict(
-                        zip(
-                            range(number_of_columns),  # type: ignore[arg-type]
-                            next(
-                                csv.reader(
-                                    [row],
-                                    delimiter=self.delimiter,
-                                    strict=True,
-                                )
-                            ),
-                            strict=False,
-                        ),
-                    )
-                    yield self._create_demand(data)  # type: ignore[arg-type]
-
-    def _create_demand(
-        self: "DemandCSVFileSource",
-        data: dict[str | int, Any],
-    ) -> demand_pb2.Demand:
-        demand = demand_pb2.Demand()
-        if self.product_id_column:
-            product = product_pb2.Product(
-                product_id=data.get(self.product_id_column.column_id, None)
-            )
-            demand.product.CopyFrom(product)
-        if self.plant_id_column:
-            demand.plant = data.get(self.plant_id_column.column_id, None)
-        if self.customer_id_column:
-            demand.customer_id = data.get(self.customer_id_column.column_id, None)
-        if self.quantity_column:
-            quantity = self.quantity_column.get_value(data)
-            demand.quantity.CopyFrom(quantity)
-        if self.characteristics_columns:
-            demand.characteristics.extend(
-                [column.get_value(data) for column in self.characteristics_columns]
-            )
-        return demand
+
+@dataclass
+class BomCSVFileSource(
+    BomMapping,
+    CSVFileSource[bom_pb2.Bom],
+    BomSource,
+):
+    """A CSV source for Bill of Materials.
+
+    This class simplifies the upload of Bill of Materials Information using
+    CSV. Files are usually large, so rows are read in batches, see
+    `CSVFileSource`. When uploaded with more than one stream, entries are
+    partitioned by their plant and plants are uploaded concurrently.
+
+    Arguments:
+        path: A path to the CSV file containing bill of materials information.
+        process_id_column: A column that is used to identify a process
+        delimiter: A delimiter used in CSV file
+        plant_id_column: A column that is used to reference a plant where the process is located
+        machine_id_column: A column that is used to reference a machine used in the process
+        product_id_column: A column that is used to reference a product that is input or output of the process
+        quantity_percent_column: A column that represent the amount of a product in the process, given in percentage decimals
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = BomCSVFileSource(
+            "bom.csv",
+            process_id_column=Column(
+                "process_id",
+            ),
+            plant_id_column=Column(
+                "plant",
+            ),
+            product_id_column=Column(
+                "product_id",
+            ),
+            quantity_percent_column=Column(
+                "share",
+            ),
+        )
+        ```
+    """  # noqa: E501
@@ -0,0 +1,17 @@
+from .source import (
+    BomDataFrameSource,
+    DataFrameSource,
+    DemandDataFrameSource,
+    MaterialsDataFrameSource,
+    ProductInventoryDataFrameSource,
+    ProductsDataFrameSource,
+)
+
+__all__ = [
+    "BomDataFrameSource",
+    "DataFrameSource",
+    "DemandDataFrameSource",
+    "MaterialsDataFrameSource",
+    "ProductInventoryDataFrameSource",
+    "ProductsDataFrameSource",
+]
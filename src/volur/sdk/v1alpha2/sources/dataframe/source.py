@@ -0,0 +1,202 @@
+"""A package that contains implementation of DataFrame sources.
+
+These sources read data that is already in memory, a pandas or a Polars
+DataFrame or an Arrow table, without writing it to a file first. Only the
+configured columns are converted to Arrow, which shares the memory of numeric
+columns, and values are converted one column and one batch at a time, never
+row by row.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, TypeVar
+
+from volur.pork.bom.v1alpha1 import bom_pb2
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.product_inventory.v1alpha1 import product_inventory_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+
+from ..arrow import RecordBatchSource
+from ..csv.base import (
+    BomSource,
+    DemandSource,
+    MaterialsSource,
+    ProductInventorySource,
+    ProductsSource,
+)
+from ..mapping import (
+    BomMapping,
+    DemandMapping,
+    MaterialsMapping,
+    ProductInventoryMapping,
+    ProductsMapping,
+)
+
+try:
+    import pyarrow as pa
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "pyarrow is required to use DataFrame sources,"
+        " install the library with the `arrow` extra"
+    ) from error
+
+T = TypeVar("T")
+
+
+def frame_to_table(
+    frame: Any,  # noqa: ANN401
+    select: Callable[[list[str]], list[str]],
+) -> "pa.Table":
+    """Converts the selected columns of a DataFrame to an Arrow table.
+
+    Polars DataFrames and Arrow tables are converted without copying.
+    Columns of pandas DataFrames are named by the string representation of
+    their labels, numeric columns are converted without copying.
+    """
+    if isinstance(frame, pa.Table):
+        return frame.select(select(frame.column_names))
+    if hasattr(frame, "to_arrow"):
+        return frame.select(select(list(frame.columns))).to_arrow()
+    if hasattr(frame, "iloc"):
+        labels = {str(_): _ for _ in frame.columns}
+        return pa.Table.from_pandas(
+            frame,
+            columns=[labels[_] for _ in select(list(labels))],
+            preserve_index=False,
+        )
+    raise ValueError(
+        f"{type(frame).__name__} is not a pandas or a Polars DataFrame"
+        " or an Arrow table"
+    )
+
+
+@dataclass
+class DataFrameSource(RecordBatchSource[T]):
+    """Base class for DataFrame sources.
+
+    Arguments:
+        frame: A pandas or a Polars DataFrame or an Arrow table.
+        batch_size: A maximum number of rows converted at once.
+    """
+
+    frame: Any
+    batch_size: int = field(default=65_536)
+
+    def __post_init__(self: "DataFrameSource[T]") -> None:
+        if self.batch_size <= 0:
+            raise ValueError("batch size must be more than 0")
+
+    def _read_batches(
+        self: "DataFrameSource[T]",
+        select: Callable[[list[str]], list[str]],
+    ) -> Iterator["pa.RecordBatch"]:
+        table = frame_to_table(self.frame, select)
+        yield from table.to_batches(max_chunksize=self.batch_size)
+
+
+@dataclass
+class MaterialsDataFrameSource(
+    MaterialsMapping,
+    DataFrameSource[material_pb2.Material],
+    MaterialsSource,
+):
+    """A DataFrame source for Materials.
+
+    Arguments:
+        frame: A DataFrame containing materials information.
+        batch_size: A maximum number of rows converted at once
+        material_id_column: A column that is used to uniquely identify a material in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        quantity_column: A column that represent the quantity of material
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given material
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        frame = pandas.read_sql("SELECT * FROM materials", connection)
+        source = MaterialsDataFrameSource(
+            frame,
+            material_id_column=Column(
+                "material_id",
+            ),
+            quantity_column=QuantityColumn(
+                "weight",
+                unit="kilogram",
+            ),
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class ProductsDataFrameSource(
+    ProductsMapping,
+    DataFrameSource[product_pb2.Product],
+    ProductsSource,
+):
+    """A DataFrame source for Products.
+
+    Arguments:
+        frame: A DataFrame containing product information.
+        batch_size: A maximum number of rows converted at once
+        product_id_column: A column that is used to uniquely identify a product in a dataset
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given product
+    """  # noqa: E501
+
+
+@dataclass
+class DemandDataFrameSource(
+    DemandMapping,
+    DataFrameSource[demand_pb2.Demand],
+    DemandSource,
+):
+    """A DataFrame source for Demand.
+
+    Arguments:
+        frame: A DataFrame containing demand information.
+        batch_size: A maximum number of rows converted at once
+        product_id_column: A column that is used to identify a product in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        customer_id_column: A column that is used to reference a customer ordering the product
+        quantity_column: A column that represent the quantity of product
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given demand
+    """  # noqa: E501
+
+
+@dataclass
+class ProductInventoryDataFrameSource(
+    ProductInventoryMapping,
+    DataFrameSource[product_inventory_pb2.ProductInventory],
+    ProductInventorySource,
+):
+    """A DataFrame source for Product Inventory.
+
+    Arguments:
+        frame: A DataFrame containing product inventory information.
+        batch_size: A maximum number of rows converted at once
+        product_id_column: A column that is used to identify a product in a dataset
+        plant_id_column: A column that is used to reference a plant where the inventory is located
+        quantity_column: A column that represent the available quantity of a product
+        weight_column: A column that represent the weight of the inventory
+        available_at_column: A column that represent when the inventory is available to use
+        expires_at_column: A column that represent when the inventory expires
+        characteristics_columns: Specifies a list of arbitrary characteristics of the inventory
+    """  # noqa: E501
+
+
+@dataclass
+class BomDataFrameSource(
+    BomMapping,
+    DataFrameSource[bom_pb2.Bom],
+    BomSource,
+):
+    """A DataFrame source for Bill of Materials.
+
+    Arguments:
+        frame: A DataFrame containing bill of materials information.
+        batch_size: A maximum number of rows converted at once
+        process_id_column: A column that is used to identify a process
+        plant_id_column: A column that is used to reference a plant where the process is located
+        machine_id_column: A column that is used to reference a machine used in the process
+        product_id_column: A column that is used to reference a product that is input or output of the process
+        quantity_percent_column: A column that represent the amount of a product in the process, given in percentage decimals
+    """  # noqa: E501
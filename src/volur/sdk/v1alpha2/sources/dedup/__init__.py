@@ -0,0 +1,10 @@
+from .keyset import KeyTable, LossyKeySet, hash_check, hash_key
+from .source import DeduplicateSource
+
+__all__ = [
+    "DeduplicateSource",
+    "KeyTable",
+    "LossyKeySet",
+    "hash_check",
+    "hash_key",
+]
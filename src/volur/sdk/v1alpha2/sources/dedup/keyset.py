@@ -0,0 +1,163 @@
+"""A package that contains compact sets of hashed keys.
+
+Keys are stored as 64-bit hashes in flat arrays of 8 bytes per slot instead of
+Python objects. A table is kept between 3/8 and 3/4 full, so every array takes
+from 11 bytes per key at the maximum load to 21 bytes per key right after the
+table has grown, and while a table grows its old arrays are kept until all keys
+are moved. Full keys are not stored, so keys with the same hashes can not be
+told apart.
+"""
+
+import hashlib
+from array import array
+from dataclasses import dataclass, field
+
+_MASK = 0xFFFF_FFFF_FFFF_FFFF
+_INITIAL_CAPACITY = 1 << 10
+
+
+def hash_key(key: str) -> int:
+    """Returns a non-zero 64-bit hash of a key.
+
+    The hash is stable only within a single process.
+    """
+    return (hash(key) & _MASK) or 1
+
+
+def hash_check(key: str) -> int:
+    """Returns a 64-bit hash of a key independent of `hash_key`.
+
+    Keys with the same `hash_key` are told apart by this hash, see `KeyTable`.
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest())
+
+
+@dataclass
+class KeyTable:
+    """An open addressing hash table of 64-bit hashes with 64-bit values.
+
+    The table grows until it holds `max_size` keys, after that new keys are
+    rejected. With `checks`, a key is a pair of a hash and a check hash, see
+    `hash_check`, so keys whose hashes collide are kept apart and the chance
+    of two keys being taken for the same key drops to about `2 ** -128`.
+
+    Arguments:
+        max_size: A maximum number of keys in the table.
+        values: Whether the table stores values of keys.
+        checks: Whether the table stores check hashes of keys.
+    """
+
+    max_size: int
+    values: bool = field(default=False)
+    checks: bool = field(default=False)
+    size: int = field(default=0, init=False)
+    _keys: "array[int]" = field(init=False, repr=False)
+    _values: "array[int] | None" = field(default=None, init=False, repr=False)
+    _checks: "array[int] | None" = field(default=None, init=False, repr=False)
+
+    def __post_init__(self: "KeyTable") -> None:
+        if self.max_size <= 0:
+            raise ValueError("maximum size must be more than 0")
+        self._keys = array("Q", bytes(8 * _INITIAL_CAPACITY))
+        if self.values:
+            self._values = array("Q", bytes(8 * _INITIAL_CAPACITY))
+        if self.checks:
+            self._checks = array("Q", bytes(8 * _INITIAL_CAPACITY))
+
+    @property
+    def full(self: "KeyTable") -> bool:
+        return self.size >= self.max_size
+
+    def _slot(self: "KeyTable", hashed: int, check: int) -> int:
+        keys, checks = self._keys, self._checks
+        mask = len(keys) - 1
+        slot = hashed & mask
+        if checks is None:
+            while (_ := keys[slot]) != 0 and _ != hashed:
+                slot = (slot + 1) & mask
+        else:
+            while (_ := keys[slot]) != 0 and (_ != hashed or checks[slot] != check):
+                slot = (slot + 1) & mask
+        return slot
+
+    def get(self: "KeyTable", hashed: int, check: int = 0) -> int | None:
+        """Returns a value of a key or `None` if the key is not present."""
+        slot = self._slot(hashed, check)
+        if self._keys[slot] == 0:
+            return None
+        return self._values[slot] if self._values is not None else 0
+
+    def put(self: "KeyTable", hashed: int, value: int = 0, check: int = 0) -> bool:
+        """Sets a value of a key.
+
+        Returns:
+            `False` if the key is new and the table is full, `True` otherwise.
+        """
+        slot = self._slot(hashed, check)
+        if self._keys[slot] == 0:
+            if self.full:
+                return False
+            if 4 * (self.size + 1) > 3 * len(self._keys):
+                self._grow()
+                slot = self._slot(hashed, check)
+            self._keys[slot] = hashed
+            if self._checks is not None:
+                self._checks[slot] = check
+            self.size += 1
+        if self._values is not None:
+            self._values[slot] = value
+        return True
+
+    def _grow(self: "KeyTable") -> None:
+        keys, values, checks = self._keys, self._values, self._checks
+        self._keys = array("Q", bytes(16 * len(keys)))
+        self._values = grown = (
+            array("Q", bytes(16 * len(values))) if values is not None else None
+        )
+        self._checks = grown_checks = (
+            array("Q", bytes(16 * len(checks))) if checks is not None else None
+        )
+        for index, key in enumerate(keys):
+            if key != 0:
+                check = checks[index] if checks is not None else 0
+                slot = self._slot(key, check)
+                self._keys[slot] = key
+                if values is not None and grown is not None:
+                    grown[slot] = values[index]
+                if grown_checks is not None:
+                    grown_checks[slot] = check
+
+
+@dataclass
+class LossyKeySet:
+    """A fixed size set of 64-bit hashes that may forget keys.
+
+    Every key has a single slot and a new key replaces an old one in the same
+    slot. A key reported as present was added before, but a key added before
+    may be reported as missing, so duplicates can pass. Like in `KeyTable`
+    without checks, two keys with the same 64-bit hash are the same key for
+    the set.
+
+    Arguments:
+        size: A number of slots of the set.
+    """
+
+    size: int
+    _keys: "array[int]" = field(init=False, repr=False)
+
+    def __post_init__(self: "LossyKeySet") -> None:
+        if self.size <= 0:
+            raise ValueError("size must be more than 0")
+        self._keys = array("Q", bytes(8 * self.size))
+
+    def add(self: "LossyKeySet", hashed: int) -> bool:
+        """Adds a key to the set.
+
+        Returns:
+            `True` if the key was present in the set.
+        """
+        slot = hashed % self.size
+        if self._keys[slot] == hashed:
+            return True
+        self._keys[slot] = hashed
+        return False
@@ -0,0 +1,165 @@
+"""A package that contains implementation of a deduplicating source.
+
+Exports often contain the same entity more than once. A deduplicating source
+drops such duplicates before they are sent, keeping either the first or the
+last record of every key.
+"""
+
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Literal, TypeVar
+
+from loguru import logger
+
+from ...report import UploadListener, UploadReport
+from ..csv.base import Source
+from ..keys import default_key
+from .keyset import KeyTable, LossyKeySet, hash_check, hash_key
+
+T = TypeVar("T")
+
+
+@dataclass
+class DeduplicateSource(Source[T]):
+    """A source dropping records with duplicate keys from another source.
+
+    Keys are remembered as pairs of independent 64-bit hashes in a compact
+    table of up to `max_exact_keys` keys, see `KeyTable`. Beyond that,
+    first-wins deduplication continues with a fixed size set that may let
+    some duplicates through, while last-wins deduplication passes records of
+    the remaining keys unchanged.
+
+    Keys whose first hashes collide are told apart by their second hashes,
+    so a unique record is dropped only if both hashes of its key are equal
+    to the hashes of another key, which for `n` distinct keys happens with
+    a probability of about `n * n / 2 ** 129`.
+
+    The table takes from about 21 to 43 bytes per key, or from 32 to 64 bytes per
+    key when keeping the last record, and half as much again while it grows.
+    For the default of 10 million keys that is at most about 400 MiB, or
+    about 600 MiB when keeping the last record.
+
+    Keeping the last record reads the source twice, first to find the last
+    record of every key and then to pass it through, so the source must
+    support being iterated more than once, for example a source reading a
+    file from a path.
+
+    Arguments:
+        source: A source to read records from.
+        keep: Which record of duplicates to keep, `first` or `last`.
+        key: A function returning a key of a record, see `default_key`.
+        max_exact_keys: A maximum number of keys deduplicated exactly.
+        lossy_size: A number of slots of the set used beyond `max_exact_keys`.
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = DeduplicateSource(
+            MaterialsCSVFileSource(
+                "materials.csv",
+                material_id_column=Column(
+                    "material_id",
+                ),
+            ),
+            keep="last",
+        )
+        ```
+    """
+
+    source: Source[T]
+    keep: Literal["first", "last"] = field(default="first")
+    key: Callable[[T], str] = field(default=default_key)
+    max_exact_keys: int = field(default=10_000_000)
+    lossy_size: int = field(default=1 << 24)
+    duplicates: int = field(default=0, init=False)
+    _data: AsyncIterator[T] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self: "DeduplicateSource[T]") -> None:
+        if self.keep not in ("first", "last"):
+            raise ValueError(f"keep must be either first or last, got {self.keep}")
+        if self.max_exact_keys <= 0:
+            raise ValueError("maximum number of exact keys must be more than 0")
+        if self.lossy_size <= 0:
+            raise ValueError("lossy size must be more than 0")
+
+    def __aiter__(
+        self: "DeduplicateSource[T]",
+    ) -> AsyncIterator[T]:
+        self._data = self._load()
+        return self
+
+    async def __anext__(
+        self: "DeduplicateSource[T]",
+    ) -> T:
+        if self._data is None:
+            self._data = self._load()
+        data = await anext(self._data, None)
+        if data is None:
+            raise StopAsyncIteration()
+        return data
+
+    def upload_finished(
+        self: "DeduplicateSource[T]",
+        report: UploadReport,
+    ) -> None:
+        if isinstance(self.source, UploadListener):
+            self.source.upload_finished(report)
+        report.duplicates += self.duplicates
+
+    def _warn_about_overflow(self: "DeduplicateSource[T]") -> None:
+        logger.warning(
+            f"number of keys exceeds {self.max_exact_keys},"
+            " some duplicates may not be dropped",
+        )
+
+    async def _load_first(
+        self: "DeduplicateSource[T]",
+    ) -> AsyncIterator[T]:
+        table = KeyTable(self.max_exact_keys, checks=True)
+        lossy: LossyKeySet | None = None
+        async for record in self.source:
+            key = self.key(record)
+            hashed, check = hash_key(key), hash_check(key)
+            if table.get(hashed, check) is not None:
+                self.duplicates += 1
+                continue
+            if not table.put(hashed, check=check):
+                if lossy is None:
+                    self._warn_about_overflow()
+                    lossy = LossyKeySet(self.lossy_size)
+                if lossy.add(hashed):
+                    self.duplicates += 1
+                    continue
+            yield record
+
+    async def _load_last(
+        self: "DeduplicateSource[T]",
+    ) -> AsyncIterator[T]:
+        table = KeyTable(self.max_exact_keys, values=True, checks=True)
+        overflow = False
+        index = 0
+        async for record in self.source:
+            key = self.key(record)
+            if not table.put(hash_key(key), index, hash_check(key)) and not overflow:
+                self._warn_about_overflow()
+                overflow = True
+            index += 1
+        index = 0
+        async for record in self.source:
+            key = self.key(record)
+            last = table.get(hash_key(key), hash_check(key))
+            index += 1
+            if last is not None and last != index - 1:
+                self.duplicates += 1
+                continue
+            yield record
+
+    def _load(
+        self: "DeduplicateSource[T]",
+    ) -> AsyncIterator[T]:
+        self.duplicates = 0
+        if self.keep == "last":
+            return self._load_last()
+        return self._load_first()
@@ -0,0 +1,10 @@
+from ..keys import default_key
+from .source import DeltaSource, digest
+from .store import StateStore
+
+__all__ = [
+    "DeltaSource",
+    "StateStore",
+    "default_key",
+    "digest",
+]
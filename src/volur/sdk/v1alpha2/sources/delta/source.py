@@ -0,0 +1,202 @@
+"""A package that contains implementation of a delta source.
+
+Master data usually changes very little between uploads. A delta source
+remembers a digest of every uploaded record in a local state store and passes
+through only records that are new or changed since the last successful
+upload.
+"""
+
+import hashlib
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, TypeVar
+
+import anyio
+from loguru import logger
+
+from ...report import UploadListener, UploadReport
+from ..csv.base import Source
+from ..keys import default_key
+from .store import StateStore
+
+T = TypeVar("T")
+
+
+def digest(
+    message: Any,  # noqa: ANN401
+) -> bytes:
+    """Returns a digest of a deterministic serialization of a message."""
+    return hashlib.blake2b(
+        message.SerializeToString(deterministic=True),
+        digest_size=16,
+    ).digest()
+
+
+@dataclass
+class DeltaSource(Source[T]):
+    """A source passing through only new or changed records of another source.
+
+    Records are identified by a key and compared by a digest of their content
+    with the digest stored after the last upload. The store is updated only
+    after an upload has finished successfully and the Völur API has
+    acknowledged every sent record, so a failed upload is repeated entirely
+    next time. With `resume`, records acknowledged by the Völur API before an
+    upload failed are stored too, so the next upload resumes after them. Only
+    uploads using a single stream which had no record rejected can be resumed,
+    because otherwise it is not known which records were acknowledged.
+
+    Optionally, keys that were uploaded before but are missing from the source
+    are reported as deleted to `on_deleted` and removed from the store. With
+    `prune`, such keys are removed without being reported, which keeps the
+    store from growing when keys change with the content of records.
+
+    Arguments:
+        source: A source to read records from.
+        store: A state store or a path to its database file.
+        namespace: A name separating states of different uploads in a store.
+        key: A function returning a key of a record, see `default_key`.
+        on_deleted: A function called with keys of deleted records.
+        batch_size: A number of records looked up in the store at once.
+        resume: Whether to store acknowledged records of a failed upload.
+        prune: Whether to remove keys missing from the source from the store.
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = DeltaSource(
+            ProductsCSVFileSource(
+                "products.csv",
+                product_id_column=Column(
+                    "product_id",
+                ),
+            ),
+            store="state.sqlite",
+            namespace="products",
+        )
+        ```
+    """
+
+    source: Source[T]
+    store: StateStore | str | pathlib.Path
+    namespace: str
+    key: Callable[[T], str] = field(default=default_key)
+    on_deleted: Callable[[list[str]], None] | None = field(default=None)
+    batch_size: int = field(default=1000)
+    resume: bool = field(default=False)
+    prune: bool = field(default=False)
+    skipped: int = field(default=0, init=False)
+    _data: AsyncIterator[T] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self: "DeltaSource[T]") -> None:
+        if self.batch_size <= 0:
+            raise ValueError("batch size must be more than 0")
+        if not isinstance(self.store, StateStore):
+            self.store = StateStore(self.store)
+
+    @property
+    def _store(self: "DeltaSource[T]") -> StateStore:
+        assert isinstance(self.store, StateStore)
+        return self.store
+
+    @property
+    def _tracks_seen(self: "DeltaSource[T]") -> bool:
+        return self.prune or self.on_deleted is not None
+
+    def __aiter__(
+        self: "DeltaSource[T]",
+    ) -> AsyncIterator[T]:
+        self._data = self._load()
+        return self
+
+    async def __anext__(
+        self: "DeltaSource[T]",
+    ) -> T:
+        if self._data is None:
+            self._data = self._load()
+        data = await anext(self._data, None)
+        if data is None:
+            raise StopAsyncIteration()
+        return data
+
+    def upload_finished(
+        self: "DeltaSource[T]",
+        report: UploadReport,
+    ) -> None:
+        if isinstance(self.source, UploadListener):
+            self.source.upload_finished(report)
+        report.skipped += self.skipped
+        if report.ok and report.rejected == 0 and report.acknowledged == report.sent:
+            self._store.commit(self.namespace)
+            if self._tracks_seen:
+                deleted = self._store.unseen(self.namespace)
+                self._store.delete(self.namespace, deleted)
+                if self.on_deleted is not None:
+                    report.deleted += len(deleted)
+                    if deleted:
+                        self.on_deleted(deleted)
+        elif (
+            self.resume
+            and report.streams == 1
+            and report.rejected == 0
+            and report.acknowledged
+        ):
+            # a single stream is acknowledged in order, so without rejected
+            # records the acknowledged records are the first staged ones
+            acknowledged = self._store.commit(self.namespace, report.acknowledged)
+            logger.warning(
+                "upload has failed, state of acknowledged records is updated",
+                namespace=self.namespace,
+                acknowledged=acknowledged,
+            )
+        else:
+            logger.warning(
+                "upload has failed or records were rejected,"
+                " state of the delta source is not updated",
+                namespace=self.namespace,
+                sent=report.sent,
+                acknowledged=report.acknowledged,
+                rejected=report.rejected,
+            )
+        self._store.clear_seen(self.namespace)
+        self._store.clear_staged(self.namespace)
+
+    def _changed(
+        self: "DeltaSource[T]",
+        records: list[T],
+    ) -> list[T]:
+        keys = [self.key(_) for _ in records]
+        digests = [digest(_) for _ in records]
+        stored = self._store.digests(self.namespace, list(set(keys)))
+        if self._tracks_seen:
+            self._store.mark_seen(self.namespace, keys)
+        changed: list[T] = []
+        staged: list[tuple[str, bytes]] = []
+        for record, key, value in zip(records, keys, digests, strict=True):
+            if stored.get(key) == value:
+                continue
+            staged.append((key, value))
+            changed.append(record)
+        self._store.stage(self.namespace, staged)
+        self.skipped += len(records) - len(changed)
+        return changed
+
+    async def _load(
+        self: "DeltaSource[T]",
+    ) -> AsyncIterator[T]:
+        self.skipped = 0
+        self._store.clear_staged(self.namespace)
+        self._store.clear_seen(self.namespace)
+        records: list[T] = []
+        async for record in self.source:
+            records.append(record)
+            if len(records) < self.batch_size:
+                continue
+            for _ in await anyio.to_thread.run_sync(self._changed, records):
+                yield _
+            records = []
+        if records:
+            for _ in await anyio.to_thread.run_sync(self._changed, records):
+                yield _
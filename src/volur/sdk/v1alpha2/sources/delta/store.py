@@ -0,0 +1,197 @@
+"""A package that contains a state store of uploaded records."""
+
+import pathlib
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+_LOOKUP_SIZE = 500
+
+
+@dataclass
+class StateStore:
+    """A local store of digests of uploaded records.
+
+    The store is an SQLite database holding a digest of every uploaded record
+    by a namespace, for example an entity name, and a key of the record.
+    Digests of records of the current run are staged in a temporary table
+    until the upload finishes, so they are not kept in memory.
+
+    Arguments:
+        path: A path to the database file, `:memory:` keeps the state in
+            memory only.
+    """
+
+    path: str | pathlib.Path
+    _connection: sqlite3.Connection = field(init=False, repr=False)
+
+    def __post_init__(self: "StateStore") -> None:
+        self._connection = sqlite3.connect(
+            str(self.path),
+            check_same_thread=False,
+        )
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS state (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                digest BLOB NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID;
+            CREATE TEMPORARY TABLE IF NOT EXISTS staged (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                digest BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS temp.staged_namespace
+                ON staged (namespace);
+            CREATE TEMPORARY TABLE IF NOT EXISTS seen (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def close(self: "StateStore") -> None:
+        self._connection.close()
+
+    def digests(
+        self: "StateStore",
+        namespace: str,
+        keys: list[str],
+    ) -> dict[str, bytes]:
+        """Returns stored digests of the given keys."""
+        digests: dict[str, bytes] = {}
+        for offset in range(0, len(keys), _LOOKUP_SIZE):
+            chunk = keys[offset : offset + _LOOKUP_SIZE]
+            digests.update(
+                self._connection.execute(
+                    "SELECT key, digest FROM state"
+                    f" WHERE namespace = ? AND key IN ({','.join('?' * len(chunk))})",
+                    (namespace, *chunk),
+                )
+            )
+        return digests
+
+    def keys(
+        self: "StateStore",
+        namespace: str,
+    ) -> Iterator[str]:
+        """Returns all stored keys in a namespace."""
+        for (key,) in self._connection.execute(
+            "SELECT key FROM state WHERE namespace = ?",
+            (namespace,),
+        ):
+            yield key
+
+    def update(
+        self: "StateStore",
+        namespace: str,
+        digests: Iterable[tuple[str, bytes]],
+    ) -> None:
+        """Stores digests of the given keys."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO state (namespace, key, digest)"
+                " VALUES (?, ?, ?)",
+                ((namespace, key, digest) for key, digest in digests),
+            )
+
+    def stage(
+        self: "StateStore",
+        namespace: str,
+        digests: Iterable[tuple[str, bytes]],
+    ) -> None:
+        """Stages digests of the given keys until they are committed."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO staged (namespace, key, digest) VALUES (?, ?, ?)",
+                ((namespace, key, digest) for key, digest in digests),
+            )
+
+    def commit(
+        self: "StateStore",
+        namespace: str,
+        limit: int | None = None,
+    ) -> int:
+        """Stores staged digests in the order they were staged.
+
+        Arguments:
+            namespace: A namespace of the digests.
+            limit: A number of the first staged digests to store, all staged
+                digests by default.
+
+        Returns:
+            A number of stored digests.
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT OR REPLACE INTO state (namespace, key, digest)"
+                " SELECT namespace, key, digest FROM staged"
+                " WHERE namespace = ? ORDER BY rowid LIMIT ?",
+                (namespace, -1 if limit is None else limit),
+            )
+        return cursor.rowcount
+
+    def clear_staged(
+        self: "StateStore",
+        namespace: str,
+    ) -> None:
+        """Forgets staged digests which were not committed."""
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM staged WHERE namespace = ?",
+                (namespace,),
+            )
+
+    def delete(
+        self: "StateStore",
+        namespace: str,
+        keys: Iterable[str],
+    ) -> None:
+        """Removes the given keys from the store."""
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM state WHERE namespace = ? AND key = ?",
+                ((namespace, key) for key in keys),
+            )
+
+    def mark_seen(
+        self: "StateStore",
+        namespace: str,
+        keys: Iterable[str],
+    ) -> None:
+        """Remembers keys seen in the current run."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO seen (namespace, key) VALUES (?, ?)",
+                ((namespace, key) for key in keys),
+            )
+
+    def unseen(
+        self: "StateStore",
+        namespace: str,
+    ) -> list[str]:
+        """Returns stored keys that were not seen in the current run."""
+        return [
+            key
+            for (key,) in self._connection.execute(
+                "SELECT key FROM state WHERE namespace = ?"
+                " AND key NOT IN (SELECT key FROM seen WHERE namespace = ?)",
+                (namespace, namespace),
+            )
+        ]
+
+    def clear_seen(
+        self: "StateStore",
+        namespace: str,
+    ) -> None:
+        """Forgets keys seen in the current run."""
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM seen WHERE namespace = ?",
+                (namespace,),
+            )
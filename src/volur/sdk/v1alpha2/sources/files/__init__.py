@@ -0,0 +1,6 @@
+from .source import MultiFileSource, read_manifest
+
+__all__ = [
+    "MultiFileSource",
+    "read_manifest",
+]
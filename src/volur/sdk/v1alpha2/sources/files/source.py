@@ -0,0 +1,226 @@
+"""A package that contains implementation of a source reading many files.
+
+Large datasets are often split into many files, for example one file per day
+or per plant. This source reads such files concurrently with any other source
+and merges their records into a single stream.
+"""
+
+import asyncio
+import glob
+import pathlib
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Iterator, Sequence, TypeVar
+
+from loguru import logger
+
+from ...progress import find_measurable
+from ...report import FileReport, UploadReport
+from ..csv.base import Source
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+def read_manifest(
+    manifest: str | pathlib.Path,
+) -> list[pathlib.Path]:
+    """Reads a list of paths from a manifest file.
+
+    A manifest contains one path per line. Empty lines and lines starting with
+    `#` are ignored, relative paths are resolved against the directory of the
+    manifest.
+    """
+    manifest = pathlib.Path(manifest)
+    paths: list[pathlib.Path] = []
+    with open(manifest, "r") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            paths.append(manifest.parent / line)
+    return paths
+
+
+@dataclass
+class MultiFileSource(Source[T]):
+    """A source reading records from many files concurrently.
+
+    Every file is read by its own source created by the `source` factory. Up
+    to `concurrency` files are read at the same time and their records are
+    merged in the order they become available, so records from different
+    files are interleaved.
+
+    An error while reading a file does not stop the other files, instead it is
+    recorded in the report of the file. Reports of all files are available in
+    `files` and are added to the report of the upload.
+
+    Arguments:
+        paths: A glob pattern or a list of paths to read.
+        source: A factory creating a source for a given path.
+        concurrency: A maximum number of files read at the same time.
+        buffer_size: A maximum number of records read ahead of the upload.
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = MultiFileSource(
+            "materials/*.csv",
+            source=functools.partial(
+                MaterialsCSVFileSource,
+                material_id_column=Column(
+                    "material_id",
+                ),
+            ),
+        )
+        ```
+    """
+
+    paths: str | Sequence[str | pathlib.Path]
+    source: Callable[[pathlib.Path], Source[T]]
+    concurrency: int = field(default=4)
+    buffer_size: int = field(default=1024)
+    files: dict[str, FileReport] = field(
+        default_factory=dict,
+        init=False,
+    )
+    _data: AsyncIterator[T] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _sizes: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _total: int | None = field(default=None, init=False, repr=False)
+    _reading: list[Source[T]] = field(
+        default_factory=list,
+        init=False,
+        repr=False,
+    )
+    _consumed: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self: "MultiFileSource[T]") -> None:
+        if self.concurrency <= 0:
+            raise ValueError("concurrency must be more than 0")
+        if self.buffer_size <= 0:
+            raise ValueError("buffer size must be more than 0")
+
+    @classmethod
+    def from_manifest(
+        cls: type["MultiFileSource[T]"],
+        manifest: str | pathlib.Path,
+        source: Callable[[pathlib.Path], Source[T]],
+        concurrency: int = 4,
+        buffer_size: int = 1024,
+    ) -> "MultiFileSource[T]":
+        """Creates a source reading files listed in a manifest file.
+
+        See [read_manifest][volur.sdk.v1alpha2.sources.files.read_manifest]
+        for the format of the manifest.
+        """
+        return cls(
+            read_manifest(manifest),
+            source=source,
+            concurrency=concurrency,
+            buffer_size=buffer_size,
+        )
+
+    def __aiter__(
+        self: "MultiFileSource[T]",
+    ) -> AsyncIterator[T]:
+        self._data = self._load()
+        return self
+
+    async def __anext__(
+        self: "MultiFileSource[T]",
+    ) -> T:
+        if self._data is None:
+            self._data = self._load()
+        data = await anext(self._data, None)
+        if data is None:
+            raise StopAsyncIteration()
+        return data
+
+    @property
+    def bytes_consumed(self: "MultiFileSource[T]") -> int | None:
+        if self._total is None:
+            return None
+        consumed = self._consumed
+        for source in self._reading:
+            if (measurable := find_measurable(source)) is not None:
+                consumed += measurable.bytes_consumed or 0
+        return consumed
+
+    @property
+    def bytes_total(self: "MultiFileSource[T]") -> int | None:
+        return self._total
+
+    def upload_finished(
+        self: "MultiFileSource[T]",
+        report: UploadReport,
+    ) -> None:
+        report.files.update(self.files)
+        report.invalid += sum(_.invalid for _ in self.files.values())
+
+    def _paths(
+        self: "MultiFileSource[T]",
+    ) -> list[pathlib.Path]:
+        if isinstance(self.paths, str):
+            return [
+                pathlib.Path(_) for _ in sorted(glob.glob(self.paths, recursive=True))
+            ]
+        return [pathlib.Path(_) for _ in self.paths]
+
+    async def _read(
+        self: "MultiFileSource[T]",
+        paths: Iterator[pathlib.Path],
+        queue: "asyncio.Queue[object]",
+    ) -> None:
+        for path in paths:
+            report = self.files[str(path)]
+            source = self.source(path)
+            self._reading.append(source)
+            try:
+                async for record in source:
+                    await queue.put(record)
+                    report.records += 1
+            except Exception as error:
+                report.error = str(error) or type(error).__name__
+                logger.exception(f"error occurred while reading {path}")
+            finally:
+                report.invalid = getattr(source, "invalid", 0)
+                self._reading.remove(source)
+                self._consumed += self._sizes.get(str(path), 0)
+        await queue.put(_DONE)
+
+    async def _load(
+        self: "MultiFileSource[T]",
+    ) -> AsyncIterator[T]:
+        paths = self._paths()
+        self.files = {str(_): FileReport(path=str(_)) for _ in paths}
+        self._sizes = {str(_): _.stat().st_size for _ in paths if _.is_file()}
+        self._total = sum(self._sizes.get(str(_), 0) for _ in paths) or None
+        self._consumed = 0
+        if not paths:
+            return
+        queue: asyncio.Queue[object] = asyncio.Queue(maxsize=self.buffer_size)
+        pending = iter(paths)
+        readers = [
+            asyncio.create_task(self._read(pending, queue))
+            for _ in range(min(self.concurrency, len(paths)))
+        ]
+        try:
+            running = len(readers)
+            while running:
+                record = await queue.get()
+                if record is _DONE:
+                    running -= 1
+                    continue
+                yield record  # type: ignore[misc]
+        finally:
+            for reader in readers:
+                reader.cancel()
+            # readers clean up their sources when they are cancelled
+            for result in await asyncio.gather(*readers, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.opt(exception=result).error(
+                        "error occurred while stopping a reader"
+                    )
@@ -0,0 +1,13 @@
+from .source import (
+    DemandJSONLinesFileSource,
+    JSONLinesFileSource,
+    MaterialsJSONLinesFileSource,
+    ProductsJSONLinesFileSource,
+)
+
+__all__ = [
+    "DemandJSONLinesFileSource",
+    "JSONLinesFileSource",
+    "MaterialsJSONLinesFileSource",
+    "ProductsJSONLinesFileSource",
+]
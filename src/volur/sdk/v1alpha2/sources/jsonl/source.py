@@ -0,0 +1,212 @@
+"""A package that contains implementation of JSON Lines sources.
+
+Each line of a file is a JSON object. Columns reference fields of the object
+by name, nested fields are referenced by a dotted path, for example
+`customer.address.plant`. Elements of arrays are referenced by their index,
+for example `lines.0.product_id`.
+"""
+
+import contextlib
+import io
+import itertools
+import json
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generator, Iterable, TypeVar
+
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+
+from ...progress import FileProgress
+from ..core import RowSource
+from ..csv.base import DemandSource, MaterialsSource, ProductsSource
+from ..mapping import DemandMapping, MaterialsMapping, ProductsMapping
+
+T = TypeVar("T")
+
+
+def field_getter(key: str) -> Callable[[dict[str, Any]], Any]:
+    """Creates a function that returns a field of an object by a dotted path.
+
+    A key present in an object as is takes precedence over the dotted path, so
+    fields with dots in their names can be referenced too. Missing fields
+    return `None`.
+    """
+    parts = key.split(".")
+    if len(parts) == 1:
+        return lambda _: _.get(key, None)
+
+    def get(data: dict[str, Any]) -> Any:  # noqa: ANN401
+        if key in data:
+            return data[key]
+        value: Any = data
+        for part in parts:
+            if isinstance(value, dict):
+                value = value.get(part, None)
+            elif isinstance(value, list) and part.isdigit():
+                index = int(part)
+                value = value[index] if index < len(value) else None
+            else:
+                return None
+        return value
+
+    return get
+
+
+@dataclass
+class JSONLinesFileSource(FileProgress, RowSource[T]):
+    """Base class for JSON Lines sources.
+
+    Lines are read, decoded and converted in a worker thread in batches of
+    `batch_size` lines, so the event loop is not blocked and memory usage is
+    bounded by the batch size regardless of the size of the file.
+
+    Arguments:
+        path: A path to the JSON Lines file or a binary file object.
+        batch_size: A maximum number of lines decoded at once.
+    """
+
+    path: str | pathlib.Path | io.BufferedIOBase
+    batch_size: int = field(default=10_000)
+
+    def __post_init__(self: "JSONLinesFileSource[T]") -> None:
+        if self.batch_size <= 0:
+            raise ValueError("batch size must be more than 0")
+
+    def _read_lines(
+        self: "JSONLinesFileSource[T]",
+        source: Iterable[bytes],
+    ) -> Generator[list[dict[str | int, Any]], None, None]:
+        getters: list[tuple[str | int, Callable[[dict[str, Any]], Any]]] = []
+        for column_id in self.columns:
+            if not isinstance(column_id, str):
+                raise ValueError(
+                    f"column {column_id} must be referenced by name in a JSON Lines file"  # noqa: E501
+                )
+            getters.append((column_id, field_getter(column_id)))
+        number = 0
+        while lines := list(itertools.islice(source, self.batch_size)):
+            rows: list[dict[str | int, Any]] = []
+            for line in lines:
+                number += 1
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as error:
+                    raise ValueError(
+                        f"line {number} is not a valid JSON: {error.msg}"
+                    ) from error
+                if not isinstance(data, dict):
+                    raise ValueError(f"line {number} is not a JSON object")
+                rows.append({key: get(data) for key, get in getters})
+            yield rows
+
+    def _read_rows(
+        self: "JSONLinesFileSource[T]",
+    ) -> Generator[list[dict[str | int, Any]], None, None]:
+        with contextlib.ExitStack() as stack:
+            source = (
+                self.path
+                if isinstance(self.path, io.BufferedIOBase)
+                else stack.enter_context(open(self.path, mode="rb"))
+            )
+            self._track(source)
+            yield from self._read_lines(source)
+
+
+@dataclass
+class MaterialsJSONLinesFileSource(
+    MaterialsMapping,
+    JSONLinesFileSource[material_pb2.Material],
+    MaterialsSource,
+):
+    """A JSON Lines source for Materials.
+
+    Arguments:
+        path: A path to the JSON Lines file containing materials information.
+        batch_size: A maximum number of lines decoded at once
+        material_id_column: A column that is used to uniquely identify a material in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        quantity_column: A column that represent the quantity of material
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given material
+
+    Examples:
+        Given a file with lines like
+        `{"id": "m-1", "plant": {"code": "P1"}, "weight": {"kg": 101.5}}`
+
+        ```python title="example.py" linenums="1"
+        source = MaterialsJSONLinesFileSource(
+            "materials.jsonl",
+            material_id_column=Column(
+                "id",
+            ),
+            plant_id_column=Column(
+                "plant.code",
+            ),
+            quantity_column=QuantityColumn(
+                "weight.kg",
+                unit="kilogram",
+            ),
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class ProductsJSONLinesFileSource(
+    ProductsMapping,
+    JSONLinesFileSource[product_pb2.Product],
+    ProductsSource,
+):
+    """A JSON Lines source for Products.
+
+    Arguments:
+        path: A path to the JSON Lines file containing product information.
+        batch_size: A maximum number of lines decoded at once
+        product_id_column: A column that is used to uniquely identify a product in a dataset
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given product
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = ProductsJSONLinesFileSource(
+            "products.jsonl",
+            product_id_column=Column(
+                "product.id",
+            ),
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class DemandJSONLinesFileSource(
+    DemandMapping,
+    JSONLinesFileSource[demand_pb2.Demand],
+    DemandSource,
+):
+    """A JSON Lines source for Demand.
+
+    Arguments:
+        path: A path to the JSON Lines file containing demand information.
+        batch_size: A maximum number of lines decoded at once
+        product_id_column: A column that is used to identify a product in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        customer_id_column: A column that is used to reference a customer ordering the product
+        quantity_column: A column that represent the quantity of product
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given demand
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = DemandJSONLinesFileSource(
+            "demand.jsonl",
+            product_id_column=Column(
+                "order.product_id",
+            ),
+            customer_id_column=Column(
+                "order.customer.id",
+            ),
+        )
+        ```
+    """  # noqa: E501
@@ -0,0 +1,27 @@
+"""A package that contains natural keys of entities."""
+
+from typing import Any
+
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+
+
+def default_key(
+    message: Any,  # noqa: ANN401
+) -> str:
+    """Returns a key identifying an entity.
+
+    Products are identified by a product ID and materials by a plant and a
+    material ID. Other entities do not have a natural key, so a key function
+    must be provided for them.
+    """
+    if isinstance(message, product_pb2.Product):
+        return message.product_id
+    if isinstance(message, material_pb2.Material):
+        if message.plant:
+            return f"{message.plant}/{message.material_id}"
+        return message.material_id
+    raise ValueError(
+        f"key must be provided for {type(message).__name__}, "
+        "it does not have a natural key"
+    )
@@ -0,0 +1,438 @@
+"""A package that maps rows of any source to the Völur data model.
+
+Sources read rows as dictionaries keyed by column name or index. The mappings
+below describe which columns populate which fields of an entity and convert a
+row into the matching protobuf message.
+"""
+
+import abc
+import dataclasses
+from dataclasses import InitVar, dataclass, field
+from typing import Any, Generic, Iterable, TypeVar
+
+from volur.pork.bom.v1alpha1 import bom_pb2
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.product_inventory.v1alpha1 import product_inventory_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+
+from .csv.base import (
+    BatchColumn,
+    CharacteristicColumn,
+    Column,
+    EnumColumn,
+    QuantityColumn,
+    TimestampColumn,
+    WeightColumn,
+)
+
+T = TypeVar("T")
+
+
+def get_string(
+    column: Column,
+    data: dict[str | int, Any],
+) -> str | None:
+    """Returns a value of a column as a string or `None` if it is missing.
+
+    Typed sources can provide non-string values, for example integer
+    identifiers, which are converted to their string representation.
+    """
+    _ = data.get(column.column_id, None)
+    if _ is None or isinstance(_, str):
+        return _
+    return str(_)
+
+
+@dataclass
+class BatchValues:
+    """Values of columns converted for a whole batch of rows.
+
+    Columns implementing `BatchColumn` are converted once for all rows of a
+    batch, other columns are converted row by row when a value is requested.
+    A value which could not be converted raises its error when the value of
+    its row is requested, so invalid rows are handled as if they were
+    converted one by one.
+
+    Arguments:
+        rows: Rows of the batch.
+        columns: Columns converted for the whole batch.
+        index: An index of the row whose values are requested.
+    """
+
+    rows: InitVar[list[dict[str | int, Any]]]
+    columns: InitVar[Iterable[BatchColumn]]
+    index: int = field(default=0)
+    _values: dict[int, list[Any]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(
+        self: "BatchValues",
+        rows: list[dict[str | int, Any]],
+        columns: Iterable[BatchColumn],
+    ) -> None:
+        for column in columns:
+            if id(column) not in self._values:
+                self._values[id(column)] = column.get_values(rows)
+
+    def get(
+        self: "BatchValues",
+        column: Any,  # noqa: ANN401
+        data: dict[str | int, Any],
+    ) -> Any:  # noqa: ANN401
+        """Returns a value of a column of the current row."""
+        values = self._values.get(id(column), None)
+        if values is None:
+            return column.get_value(data)
+        if isinstance(_ := values[self.index], Exception):
+            raise _
+        return _
+
+
+class Mapping(Generic[T]):
+    """Base class for mappings of rows to entities."""
+
+    @property
+    @abc.abstractmethod
+    def columns(self: "Mapping[T]") -> list[str | int]:
+        """A list of all columns used by the mapping."""
+        ...
+
+    @property
+    def batch_columns(self: "Mapping[T]") -> list[BatchColumn]:
+        """A list of columns of the mapping converted per batch of rows."""
+        columns: list[BatchColumn] = []
+        for _ in dataclasses.fields(self):  # type: ignore[arg-type]
+            value = getattr(self, _.name)
+            for column in value if isinstance(value, list) else [value]:
+                if isinstance(column, BatchColumn):
+                    columns.append(column)
+        return columns
+
+    @abc.abstractmethod
+    def _create(
+        self: "Mapping[T]",
+        data: dict[str | int, Any],
+        values: BatchValues,
+    ) -> T:
+        """Creates an entity from a row and values of its batch."""
+        ...
+
+
+@dataclass(kw_only=True)
+class MaterialsMapping(Mapping[material_pb2.Material]):
+    """A mapping of rows to Materials.
+
+    Arguments:
+        material_id_column: A column that is used to uniquely identify a material in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        quantity_column: A column that represent the quantity of material
+        type_column: A column that represent the type of material, see `EnumColumn`
+        arrived_at_column: A column that represent when the material has arrived
+        expires_at_column: A column that represent when the material expires
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given material
+    """  # noqa: E501
+
+    material_id_column: Column | None = field(default=None)
+    plant_id_column: Column | None = field(default=None)
+    quantity_column: QuantityColumn | None = field(default=None)
+    type_column: EnumColumn | None = field(default=None)
+    arrived_at_column: TimestampColumn | None = field(default=None)
+    expires_at_column: TimestampColumn | None = field(default=None)
+    characteristics_columns: list[CharacteristicColumn] = field(
+        default_factory=list,
+    )
+
+    @property
+    def columns(
+        self: "MaterialsMapping",
+    ) -> list[str | int]:
+        _: list[str | int] = []
+        if self.material_id_column:
+            _.append(self.material_id_column.column_id)
+        if self.plant_id_column:
+            _.append(self.plant_id_column.column_id)
+        if self.quantity_column:
+            _.append(self.quantity_column.column_id)
+        if self.type_column:
+            _.append(self.type_column.column_id)
+        if self.arrived_at_column:
+            _.append(self.arrived_at_column.column_id)
+        if self.expires_at_column:
+            _.append(self.expires_at_column.column_id)
+        for characteristic in self.characteristics_columns:
+            _.extend(characteristic.column_ids)
+        return _
+
+    def _create(
+        self: "MaterialsMapping",
+        data: dict[str | int, Any],
+        values: BatchValues,
+    ) -> material_pb2.Material:
+        material = material_pb2.Material()
+        if self.material_id_column:
+            if (material_id := get_string(self.material_id_column, data)) is not None:
+                material.material_id = material_id
+        if self.plant_id_column:
+            if (plant := get_string(self.plant_id_column, data)) is not None:
+                material.plant = plant
+        if self.quantity_column:
+            material.quantity.CopyFrom(self.quantity_column.get_value(data))
+        if self.type_column:
+            if (material_type := self.type_column.get_value(data)) is not None:
+                material.type = material_type  # type: ignore[assignment]
+        if self.arrived_at_column:
+            if (timestamp := values.get(self.arrived_at_column, data)) is not None:
+                material.arrived_at.CopyFrom(timestamp)
+        if self.expires_at_column:
+            if (timestamp := values.get(self.expires_at_column, data)) is not None:
+                material.expires_at.CopyFrom(timestamp)
+        if self.characteristics_columns:
+            material.characteristics.extend(
+                [values.get(column, data) for column in self.characteristics_columns]
+            )
+        return material
+
+
+@dataclass(kw_only=True)
+class ProductsMapping(Mapping[product_pb2.Product]):
+    """A mapping of rows to Products.
+
+    Arguments:
+        product_id_column: A column that is used to uniquely identify a product in a dataset
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given product
+    """  # noqa: E501
+
+    product_id_column: Column | None = field(default=None)
+    characteristics_columns: list[CharacteristicColumn] = field(
+        default_factory=list,
+    )
+
+    @property
+    def columns(
+        self: "ProductsMapping",
+    ) -> list[str | int]:
+        _: list[str | int] = []
+        if self.product_id_column:
+            _.append(self.product_id_column.column_id)
+        for characteristic in self.characteristics_columns:
+            _.extend(characteristic.column_ids)
+        return _
+
+    def _create(
+        self: "ProductsMapping",
+        data: dict[str | int, Any],
+        values: BatchValues,
+    ) -> product_pb2.Product:
+        product = product_pb2.Product()
+        if self.product_id_column:
+            if (product_id := get_string(self.product_id_column, data)) is not None:
+                product.product_id = product_id
+        if self.characteristics_columns:
+            product.characteristics.extend(
+                [values.get(column, data) for column in self.characteristics_columns]
+            )
+        return product
+
+
+@dataclass(kw_only=True)
+class DemandMapping(Mapping[demand_pb2.Demand]):
+    """A mapping of rows to Demand.
+
+    Arguments:
+        product_id_column: A column that is used to identify a product in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        customer_id_column: A column that is used to reference a customer ordering the product
+        quantity_column: A column that represent the quantity of product
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given demand
+    """  # noqa: E501
+
+    product_id_column: Column | None = field(default=None)
+    plant_id_column: Column | None = field(default=None)
+    customer_id_column: Column | None = field(default=None)
+    quantity_column: QuantityColumn | None = field(default=None)
+    characteristics_columns: list[CharacteristicColumn] = field(
+        default_factory=list,
+    )
+
+    @property
+    def columns(
+        self: "DemandMapping",
+    ) -> list[str | int]:
+        _: list[str | int] = []
+        if self.product_id_column:
+            _.append(self.product_id_column.column_id)
+        if self.plant_id_column:
+            _.append(self.plant_id_column.column_id)
+        if self.customer_id_column:
+            _.append(self.customer_id_column.column_id)
+        if self.quantity_column:
+            _.append(self.quantity_column.column_id)
+        for characteristic in self.characteristics_columns:
+            _.extend(characteristic.column_ids)
+        return _
+
+    def _create(
+        self: "DemandMapping",
+        data: dict[str | int, Any],
+        values: BatchValues,
+    ) -> demand_pb2.Demand:
+        demand = demand_pb2.Demand()
+        if self.product_id_column:
+            if (product_id := get_string(self.product_id_column, data)) is not None:
+                demand.product.product_id = product_id
+        if self.plant_id_column:
+            if (plant := get_string(self.plant_id_column, data)) is not None:
+                demand.plant = plant
+        if self.customer_id_column:
+            if (customer_id := get_string(self.customer_id_column, data)) is not None:
+                demand.customer_id = customer_id
+        if self.quantity_column:
+            demand.quantity.CopyFrom(self.quantity_column.get_value(data))
+        if self.characteristics_columns:
+            demand.characteristics.extend(
+                [values.get(column, data) for column in self.characteristics_columns]
+            )
+        return demand
+
+
+@dataclass(kw_only=True)
+class ProductInventoryMapping(Mapping[product_inventory_pb2.ProductInventory]):
+    """A mapping of rows to Product Inventory.
+
+    Arguments:
+        product_id_column: A column that is used to identify a product in a dataset
+        plant_id_column: A column that is used to reference a plant where the inventory is located
+        quantity_column: A column that represent the available quantity of a product
+        weight_column: A column that represent the weight of the inventory
+        available_at_column: A column that represent when the inventory is available to use
+        expires_at_column: A column that represent when the inventory expires
+        characteristics_columns: Specifies a list of arbitrary characteristics of the inventory
+    """  # noqa: E501
+
+    product_id_column: Column | None = field(default=None)
+    plant_id_column: Column | None = field(default=None)
+    quantity_column: QuantityColumn | None = field(default=None)
+    weight_column: WeightColumn | None = field(default=None)
+    available_at_column: TimestampColumn | None = field(default=None)
+    expires_at_column: TimestampColumn | None = field(default=None)
+    characteristics_columns: list[CharacteristicColumn] = field(
+        default_factory=list,
+    )
+
+    @property
+    def columns(
+        self: "ProductInventoryMapping",
+    ) -> list[str | int]:
+        _: list[str | int] = []
+        if self.product_id_column:
+            _.append(self.product_id_column.column_id)
+        if self.plant_id_column:
+            _.append(self.plant_id_column.column_id)
+        if self.quantity_column:
+            _.append(self.quantity_column.column_id)
+        if self.weight_column:
+            _.extend(self.weight_column.column_ids)
+        if self.available_at_column:
+            _.append(self.available_at_column.column_id)
+        if self.expires_at_column:
+            _.append(self.expires_at_column.column_id)
+        for characteristic in self.characteristics_columns:
+            _.extend(characteristic.column_ids)
+        return _
+
+    def _create(
+        self: "ProductInventoryMapping",
+        data: dict[str | int, Any],
+        values: BatchValues,
+    ) -> product_inventory_pb2.ProductInventory:
+        product_inventory = product_inventory_pb2.ProductInventory()
+        if self.product_id_column:
+            if (product_id := get_string(self.product_id_column, data)) is not None:
+                product_inventory.product_id = product_id
+        if self.plant_id_column:
+            if (plant := get_string(self.plant_id_column, data)) is not None:
+                product_inventory.plant = plant
+        if self.quantity_column:
+            product_inventory.quantity.CopyFrom(self.quantity_column.get_value(data))
+        if self.weight_column:
+            if (weight := values.get(self.weight_column, data)) is not None:
+                product_inventory.weight.CopyFrom(weight)
+        if self.available_at_column:
+            if (timestamp := values.get(self.available_at_column, data)) is not None:
+                product_inventory.available_at.CopyFrom(timestamp)
+        if self.expires_at_column:
+            if (timestamp := values.get(self.expires_at_column, data)) is not None:
+                product_inventory.expires_at.CopyFrom(timestamp)
+        if self.characteristics_columns:
+            product_inventory.characteristics.extend(
+                [values.get(column, data) for column in self.characteristics_columns]
+            )
+        return product_inventory
+
+
+@dataclass(kw_only=True)
+class BomMapping(Mapping[bom_pb2.Bom]):
+    """A mapping of rows to Bill of Materials.
+
+    Arguments:
+        process_id_column: A column that is used to identify a process
+        plant_id_column: A column that is used to reference a plant where the process is located
+        machine_id_column: A column that is used to reference a machine used in the process
+        product_id_column: A column that is used to reference a product that is input or output of the process
+        quantity_percent_column: A column that represent the amount of a product in the process, given in percentage decimals
+    """  # noqa: E501
+
+    process_id_column: Column | None = field(default=None)
+    plant_id_column: Column | None = field(default=None)
+    machine_id_column: Column | None = field(default=None)
+    product_id_column: Column | None = field(default=None)
+    quantity_percent_column: Column | None = field(default=None)
+
+    @property
+    def columns(
+        self: "BomMapping",
+    ) -> list[str | int]:
+        _: list[str | int] = []
+        for column in (
+            self.process_id_column,
+            self.plant_id_column,
+            self.machine_id_column,
+            self.product_id_column,
+            self.quantity_percent_column,
+        ):
+            if column:
+                _.append(column.column_id)
+        return _
+
+    def _create(
+        self: "BomMapping",
+        data: dict[str | int, Any],
+        values: BatchValues,
+    ) -> bom_pb2.Bom:
+        bom = bom_pb2.Bom()
+        if self.process_id_column:
+            if (process_id := get_string(self.process_id_column, data)) is not None:
+                bom.process_id = process_id
+        if self.plant_id_column:
+            if (plant := get_string(self.plant_id_column, data)) is not None:
+                bom.plant = plant
+        if self.machine_id_column:
+            if (machine_id := get_string(self.machine_id_column, data)) is not None:
+                bom.machine_id = machine_id
+        if self.product_id_column:
+            if (product_id := get_string(self.product_id_column, data)) is not None:
+                bom.product_id = product_id
+        if self.quantity_percent_column:
+            _ = data.get(self.quantity_percent_column.column_id, None)
+            if _ is not None and _ != "":
+                try:
+                    bom.quantity_percent = float(_)
+                except ValueError as error:
+                    raise ValueError(
+                        f"provided value {_} in column {self.quantity_percent_column.column_id} can not be interpreted as quantity percent"  # noqa: E501
+                    ) from error
+        return bom
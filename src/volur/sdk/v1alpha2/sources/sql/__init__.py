@@ -0,0 +1,17 @@
+from .source import (
+    Connection,
+    Cursor,
+    DemandSQLSource,
+    MaterialsSQLSource,
+    ProductsSQLSource,
+    SQLSource,
+)
+
+__all__ = [
+    "Connection",
+    "Cursor",
+    "DemandSQLSource",
+    "MaterialsSQLSource",
+    "ProductsSQLSource",
+    "SQLSource",
+]
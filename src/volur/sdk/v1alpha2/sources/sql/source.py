@@ -0,0 +1,221 @@
+"""A package that contains implementation of SQL sources.
+
+These sources run a query using any [DB-API 2.0](https://peps.python.org/pep-0249/)
+compatible connection and fetch the result in batches, so tables of any size
+are uploaded with constant memory and without an intermediate dump.
+"""
+
+import operator
+from dataclasses import dataclass, field
+from typing import Any, Generator, Protocol, Sequence, TypeVar
+
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+
+from ..core import RowSource
+from ..csv.base import DemandSource, MaterialsSource, ProductsSource
+from ..mapping import DemandMapping, MaterialsMapping, ProductsMapping
+
+T = TypeVar("T")
+
+
+class Cursor(Protocol):
+    """A DB-API 2.0 cursor."""
+
+    @property
+    def description(self: "Cursor") -> Sequence[Sequence[Any]] | None: ...
+
+    def execute(
+        self: "Cursor",
+        operation: str,
+        parameters: Any = ...,  # noqa: ANN401
+        /,
+    ) -> object: ...
+
+    def fetchmany(self: "Cursor", size: int = ..., /) -> Sequence[Sequence[Any]]: ...
+
+    def close(self: "Cursor") -> object: ...
+
+
+class Connection(Protocol):
+    """A DB-API 2.0 connection."""
+
+    def cursor(self: "Connection") -> Cursor: ...
+
+
+@dataclass
+class SQLSource(RowSource[T]):
+    """Base class for SQL sources.
+
+    The query is executed and the result is fetched with `fetchmany` in a
+    worker thread, `batch_size` rows at a time. Columns are referenced by the
+    names of the result columns or by their positions.
+
+    Note:
+        A connection is used from worker threads, make sure your driver allows
+        this. For example, SQLite connections must be created with
+        `check_same_thread=False`.
+
+    Arguments:
+        connection: A DB-API 2.0 connection.
+        query: A query returning the rows to upload.
+        parameters: Parameters of the query in the style of the driver.
+        batch_size: A number of rows fetched at once.
+    """
+
+    connection: Connection
+    query: str
+    parameters: Sequence[Any] | dict[str, Any] = field(default=())
+    batch_size: int = field(default=10_000)
+
+    def __post_init__(self: "SQLSource[T]") -> None:
+        if not self.query:
+            raise ValueError("query can not be empty string")
+        if self.batch_size <= 0:
+            raise ValueError("batch size must be more than 0")
+
+    def _read_rows(
+        self: "SQLSource[T]",
+    ) -> Generator[list[dict[str | int, Any]], None, None]:
+        cursor = self.connection.cursor()
+        try:
+            yield from self._fetch_rows(cursor)
+        finally:
+            cursor.close()
+
+    def _fetch_rows(
+        self: "SQLSource[T]",
+        cursor: Cursor,
+    ) -> Generator[list[dict[str | int, Any]], None, None]:
+        if self.parameters:
+            cursor.execute(self.query, self.parameters)
+        else:
+            cursor.execute(self.query)
+        if cursor.description is None:
+            raise ValueError("query does not return any rows")
+        names = [_[0] for _ in cursor.description]
+        keys: list[str | int] = []
+        positions: list[int] = []
+        for column_id in self.columns:
+            if column_id in keys:
+                continue
+            if isinstance(column_id, int):
+                if column_id >= len(names):
+                    raise ValueError(
+                        f"column index {column_id} is out of range of the result"
+                    )
+                positions.append(column_id)
+            elif column_id in names:
+                positions.append(names.index(column_id))
+            else:
+                raise ValueError(f"column {column_id} is not present in the result")
+            keys.append(column_id)
+        getter = operator.itemgetter(*positions) if positions else None
+        while rows := cursor.fetchmany(self.batch_size):
+            if getter is None:
+                yield [{} for _ in rows]
+            elif len(positions) == 1:
+                yield [{keys[0]: getter(_)} for _ in rows]
+            else:
+                yield [dict(zip(keys, getter(_), strict=True)) for _ in rows]
+
+
+@dataclass
+class MaterialsSQLSource(
+    MaterialsMapping,
+    SQLSource[material_pb2.Material],
+    MaterialsSource,
+):
+    """A SQL source for Materials.
+
+    Arguments:
+        connection: A DB-API 2.0 connection.
+        query: A query returning materials information.
+        parameters: Parameters of the query in the style of the driver.
+        batch_size: A number of rows fetched at once
+        material_id_column: A column that is used to uniquely identify a material in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        quantity_column: A column that represent the quantity of material
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given material
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = MaterialsSQLSource(
+            sqlite3.connect("erp.db", check_same_thread=False),
+            "SELECT material_id, plant, weight FROM materials WHERE plant = ?",
+            parameters=("P1",),
+            material_id_column=Column(
+                "material_id",
+            ),
+            quantity_column=QuantityColumn(
+                "weight",
+                unit="kilogram",
+            ),
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class ProductsSQLSource(
+    ProductsMapping,
+    SQLSource[product_pb2.Product],
+    ProductsSource,
+):
+    """A SQL source for Products.
+
+    Arguments:
+        connection: A DB-API 2.0 connection.
+        query: A query returning product information.
+        parameters: Parameters of the query in the style of the driver.
+        batch_size: A number of rows fetched at once
+        product_id_column: A column that is used to uniquely identify a product in a dataset
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given product
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = ProductsSQLSource(
+            sqlite3.connect("erp.db", check_same_thread=False),
+            "SELECT product_id, description FROM products",
+            product_id_column=Column(
+                "product_id",
+            ),
+        )
+        ```
+    """  # noqa: E501
+
+
+@dataclass
+class DemandSQLSource(
+    DemandMapping,
+    SQLSource[demand_pb2.Demand],
+    DemandSource,
+):
+    """A SQL source for Demand.
+
+    Arguments:
+        connection: A DB-API 2.0 connection.
+        query: A query returning demand information.
+        parameters: Parameters of the query in the style of the driver.
+        batch_size: A number of rows fetched at once
+        product_id_column: A column that is used to identify a product in a dataset
+        plant_id_column: A column that is used to reference a production plant where material is used
+        customer_id_column: A column that is used to reference a customer ordering the product
+        quantity_column: A column that represent the quantity of product
+        characteristics_columns: Specifies a list of arbitrary characteristics of a given demand
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        source = DemandSQLSource(
+            sqlite3.connect("erp.db", check_same_thread=False),
+            "SELECT product_id, customer_id, quantity FROM orders",
+            product_id_column=Column(
+                "product_id",
+            ),
+            customer_id_column=Column(
+                "customer_id",
+            ),
+        )
+        ```
+    """  # noqa: E501
@@ -0,0 +1,22 @@
+from .lookup import Enrich, LookupTable
+from .source import (
+    Filter,
+    FlatMap,
+    Map,
+    Stage,
+    StatefulStage,
+    TransformSource,
+    apply_stages,
+)
+
+__all__ = [
+    "Enrich",
+    "Filter",
+    "FlatMap",
+    "LookupTable",
+    "Map",
+    "Stage",
+    "StatefulStage",
+    "TransformSource",
+    "apply_stages",
+]
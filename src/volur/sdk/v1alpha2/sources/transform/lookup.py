@@ -0,0 +1,267 @@
+"""A package that contains enrichment of records from lookup tables.
+
+Records often carry only a code of another entity, for example a customer,
+while the information to upload, for example a plant, is in a separate
+master file. A lookup table indexes such a file once and an enrichment stage
+copies values of the table to records while they are uploaded.
+"""
+
+import csv
+import mmap
+import pathlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Literal, Sequence, TypeVar
+
+from loguru import logger
+
+from volur.pork.shared.v1alpha1 import characteristic_pb2
+
+from ...report import UploadReport
+from ..dedup.keyset import KeyTable, hash_key
+
+T = TypeVar("T")
+
+
+@dataclass
+class LookupTable:
+    """A CSV file with a header indexed by a key column.
+
+    The file is memory mapped and only a compact index of 64-bit hashes of
+    keys and offsets of rows is kept in memory, see `KeyTable`. A row is
+    parsed when it is looked up and rows of up to `cache_size` keys are kept
+    parsed, as records usually share few keys. Offsets of rows of keys whose
+    hash collides with a hash of another key are kept by the key itself. The
+    first row of a key wins and rows can not span more than one line.
+
+    Arguments:
+        path: A path to the CSV file.
+        key_column: A name of the column with keys.
+        columns: Names of the columns returned by lookups, all columns by
+            default.
+        delimiter: A delimiter used in the CSV file.
+        encoding: An encoding of the CSV file.
+        cache_size: A maximum number of parsed rows kept in memory.
+    """
+
+    path: str | pathlib.Path
+    key_column: str
+    columns: Sequence[str] | None = field(default=None)
+    delimiter: str = field(default=",")
+    encoding: str = field(default="utf-8")
+    cache_size: int = field(default=65_536)
+    size: int = field(default=0, init=False)
+    _index: KeyTable = field(init=False, repr=False)
+    _data: mmap.mmap = field(init=False, repr=False)
+    _key: int = field(init=False, repr=False)
+    _picks: list[tuple[str, int]] = field(init=False, repr=False)
+    _collisions: dict[str, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+    _cache: dict[str, dict[str, str] | None] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    def __post_init__(self: "LookupTable") -> None:
+        if self.cache_size < 0:
+            raise ValueError("cache size must be equal or more than 0")
+        with open(self.path, "rb") as file:
+            # an empty file can not be memory mapped
+            if file.seek(0, 2) == 0:
+                raise ValueError(f"lookup table {self.path} is empty")
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        end = self._line_end(0)
+        header = self._parse(0, end)
+        if header:
+            header[0] = header[0].removeprefix("\ufeff")
+        if self.key_column not in header:
+            raise ValueError(
+                f"column {self.key_column} is not present in the header"
+                f" of lookup table {self.path}"
+            )
+        self._key = header.index(self.key_column)
+        self._picks = []
+        for column in header if self.columns is None else self.columns:
+            if column not in header:
+                raise ValueError(
+                    f"column {column} is not present in the header"
+                    f" of lookup table {self.path}"
+                )
+            self._picks.append((column, header.index(column)))
+        self._index = KeyTable(1 << 62, values=True)
+        self._load(end + 1)
+
+    @property
+    def names(self: "LookupTable") -> list[str]:
+        """Returns names of the columns returned by lookups."""
+        return [_ for _, __ in self._picks]
+
+    def close(self: "LookupTable") -> None:
+        """Closes the memory mapped file."""
+        self._data.close()
+
+    def _line_end(self: "LookupTable", offset: int) -> int:
+        end = self._data.find(b"\n", offset)
+        return len(self._data) if end == -1 else end
+
+    def _parse(self: "LookupTable", start: int, end: int) -> list[str]:
+        line = self._data[start:end].decode(self.encoding).rstrip("\r")
+        return next(csv.reader([line], delimiter=self.delimiter, strict=True), [])
+
+    def _load(self: "LookupTable", offset: int) -> None:
+        size = len(self._data)
+        while offset < size:
+            end = self._line_end(offset)
+            row = self._parse(offset, end)
+            if len(row) > self._key:
+                key = row[self._key]
+                hashed = hash_key(key)
+                indexed = self._index.get(hashed)
+                if indexed is None:
+                    self._index.put(hashed, offset)
+                    self.size += 1
+                elif key not in self._collisions and self._key_at(indexed) != key:
+                    self._collisions[key] = offset
+                    self.size += 1
+            offset = end + 1
+
+    def _key_at(self: "LookupTable", offset: int) -> str:
+        return self._parse(offset, self._line_end(offset))[self._key]
+
+    def get(
+        self: "LookupTable",
+        key: str,
+    ) -> dict[str, str] | None:
+        """Returns values of the columns of a row with a key.
+
+        Returns:
+            Values of the columns by their names, or `None` if there is no
+            row with the key.
+        """
+        if (cached := self._cache.get(key, False)) is not False:
+            return cached  # type: ignore[return-value]
+        values: dict[str, str] | None = None
+        offset = self._collisions.get(key)
+        if offset is None:
+            offset = self._index.get(hash_key(key))
+        if offset is not None:
+            row = self._parse(offset, self._line_end(offset))
+            # the indexed row can be a row of another key with the same hash
+            if row[self._key] == key:
+                values = {
+                    name: row[index] if index < len(row) else ""
+                    for name, index in self._picks
+                }
+        if len(self._cache) < self.cache_size:
+            self._cache[key] = values
+        return values
+
+
+@dataclass
+class Enrich(Generic[T]):
+    """A stage copying values of a lookup table to records.
+
+    A record is joined with the row of the table with the key of the record.
+    Values of the row are copied to fields of the record and added as string
+    characteristics. Empty values are not copied. Numbers of records found
+    and not found in the table during an upload are counted in `hits` and
+    `misses`, which are added to the report of the upload and logged when it
+    finishes.
+
+    The stage keeps the table memory mapped and counts records in place, so
+    it can run in the event loop or in threads, but not in processes.
+
+    Arguments:
+        table: A lookup table.
+        key: A function returning a key of a record.
+        fields: Names of fields of records set from columns of the table, by
+            names of the columns.
+        characteristics: Names of characteristics added from columns of the
+            table, by names of the columns.
+        on_missing: A handling of records which key is not in the table,
+            `keep` passes the record unchanged, `drop` drops it and `raise`
+            stops the upload.
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        customers = LookupTable("customers.csv", key_column="CUSTOMER")
+        source = TransformSource(
+            DemandCSVFileSource(
+                "demand.csv",
+                product_id_column=Column("product"),
+                customer_id_column=Column("customer"),
+            ),
+            stages=[
+                Enrich(customers, key=lambda _: _.customer_id, fields={"PLANT": "plant"}),
+            ],
+        )
+        ```
+    """  # noqa: E501
+
+    table: LookupTable
+    key: Callable[[T], str]
+    fields: dict[str, str] = field(default_factory=dict)
+    characteristics: dict[str, str] = field(default_factory=dict)
+    on_missing: Literal["keep", "drop", "raise"] = field(default="keep")
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self: "Enrich[T]") -> None:
+        if self.on_missing not in ("keep", "drop", "raise"):
+            raise ValueError(
+                f"on missing must be either keep, drop or raise, got {self.on_missing}"
+            )
+        for column in (*self.fields, *self.characteristics):
+            if column not in self.table.names:
+                raise ValueError(f"column {column} is not a column of the lookup table")
+
+    def __call__(self: "Enrich[T]", batch: list[T]) -> list[T]:
+        records: list[T] = []
+        for record in batch:
+            key = self.key(record)
+            values = self.table.get(key)
+            if values is None:
+                self.misses += 1
+                if self.on_missing == "raise":
+                    raise ValueError(f"key {key} is not present in the lookup table")
+                if self.on_missing == "keep":
+                    records.append(record)
+                continue
+            self.hits += 1
+            self._copy(record, values)
+            records.append(record)
+        return records
+
+    def _copy(self: "Enrich[T]", record: Any, values: dict[str, str]) -> None:  # noqa: ANN401
+        for column, name in self.fields.items():
+            if value := values[column]:
+                setattr(record, name, value)
+        for column, name in self.characteristics.items():
+            if value := values[column]:
+                record.characteristics.append(
+                    characteristic_pb2.Characteristic(
+                        name=name,
+                        value=characteristic_pb2.CharacteristicValue(
+                            value_string=value,
+                        ),
+                    )
+                )
+
+    def reset(self: "Enrich[T]") -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def upload_finished(
+        self: "Enrich[T]",
+        report: UploadReport,
+    ) -> None:
+        report.lookup_hits += self.hits
+        report.lookup_misses += self.misses
+        logger.info(
+            f"enriched records from lookup table {self.table.path}",
+            hits=self.hits,
+            misses=self.misses,
+        )
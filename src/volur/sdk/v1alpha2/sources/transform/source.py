@@ -0,0 +1,223 @@
+"""A package that contains implementation of a transforming source.
+
+Data often needs small fixes before it is uploaded, for example normalized
+identifiers, remapped categories or derived characteristics. A transforming
+source applies such fixes to batches of records of another source while they
+are uploaded, so the data does not have to be read and written once more.
+"""
+
+import asyncio
+import collections
+import functools
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    Callable,
+    Generic,
+    Iterable,
+    Literal,
+    Protocol,
+    Sequence,
+    TypeVar,
+    runtime_checkable,
+)
+
+import anyio
+
+from ...report import UploadListener, UploadReport
+from ..core import BatchBuffer, worker_limiter
+from ..csv.base import Source
+
+T = TypeVar("T")
+
+Stage = Callable[[list[T]], list[T]]
+
+Executor = Literal["inline", "thread", "process"]
+
+
+@runtime_checkable
+class StatefulStage(Protocol):
+    """A stage collecting state while it transforms records, like counters.
+
+    The state is reset every time a transforming source starts reading its
+    source, so it covers a single upload.
+    """
+
+    def reset(self: "StatefulStage") -> None: ...
+
+
+@dataclass(frozen=True)
+class Map(Generic[T]):
+    """A stage replacing every record with a result of a function.
+
+    The function may modify the record in place and return it.
+    """
+
+    function: Callable[[T], T]
+
+    def __call__(self: "Map[T]", batch: list[T]) -> list[T]:
+        return [self.function(_) for _ in batch]
+
+
+@dataclass(frozen=True)
+class Filter(Generic[T]):
+    """A stage keeping only records for which a predicate is true."""
+
+    predicate: Callable[[T], bool]
+
+    def __call__(self: "Filter[T]", batch: list[T]) -> list[T]:
+        return [_ for _ in batch if self.predicate(_)]
+
+
+@dataclass(frozen=True)
+class FlatMap(Generic[T]):
+    """A stage replacing every record with any number of records."""
+
+    function: Callable[[T], Iterable[T]]
+
+    def __call__(self: "FlatMap[T]", batch: list[T]) -> list[T]:
+        return [_ for record in batch for _ in self.function(record)]
+
+
+def apply_stages(stages: Sequence[Stage[T]], batch: list[T]) -> list[T]:
+    """Applies stages to a batch of records one after another."""
+    for stage in stages:
+        if not batch:
+            break
+        batch = stage(batch)
+    return batch
+
+
+@dataclass
+class TransformSource(BatchBuffer[T], Source[T]):
+    """A source transforming batches of records of another source.
+
+    Stages are functions receiving a batch of records and returning a new
+    batch, `Map`, `Filter` and `FlatMap` create stages from functions of a
+    single record. All stages are applied to a batch at once, by default in
+    the event loop. Expensive stages can run in up to `workers` worker
+    threads or processes, which transform batches concurrently. Stages
+    running in processes, and the records, must be picklable, so functions
+    of the stages must be defined at the top level of a module. Stages
+    implementing `UploadListener` are notified when the upload finishes, so
+    they can not run in processes, and stages implementing `StatefulStage`
+    are reset when the upload starts.
+
+    Arguments:
+        source: A source to read records from.
+        stages: Stages applied to every batch in order.
+        executor: Where stages are applied, `inline` in the event loop,
+            `thread` in worker threads or `process` in worker processes.
+        workers: A maximum number of batches transformed at the same time.
+        ordered: Whether batches keep the order of the source, otherwise
+            they are passed on as soon as they are transformed.
+        batch_size: A maximum number of records transformed at once.
+
+    Examples:
+        ```python title="example.py" linenums="1"
+        def normalize(material: material_pb2.Material) -> material_pb2.Material:
+            material.material_id = material.material_id.strip().upper()
+            return material
+
+
+        source = TransformSource(
+            MaterialsCSVFileSource(
+                "materials.csv",
+                material_id_column=Column(
+                    "material_id",
+                ),
+            ),
+            stages=[
+                Filter(lambda _: _.material_id != ""),
+                Map(normalize),
+            ],
+        )
+        ```
+    """
+
+    source: Source[T]
+    stages: Sequence[Stage[T]]
+    executor: Executor = field(default="inline")
+    workers: int = field(default=4)
+    ordered: bool = field(default=True)
+    batch_size: int = field(default=1024)
+
+    def __post_init__(self: "TransformSource[T]") -> None:
+        if self.executor not in ("inline", "thread", "process"):
+            raise ValueError(
+                "executor must be either inline, thread or process,"
+                f" got {self.executor}"
+            )
+        if self.workers <= 0:
+            raise ValueError("number of workers must be more than 0")
+        if self.batch_size <= 0:
+            raise ValueError("batch size must be more than 0")
+        if self.executor == "process" and any(
+            isinstance(_, UploadListener) for _ in self.stages
+        ):
+            # such stages collect their state in the worker processes, which
+            # is not seen when the upload finishes
+            raise ValueError("stages notified of the upload can not run in processes")
+
+    def upload_finished(
+        self: "TransformSource[T]",
+        report: UploadReport,
+    ) -> None:
+        if isinstance(self.source, UploadListener):
+            self.source.upload_finished(report)
+        for stage in self.stages:
+            if isinstance(stage, UploadListener):
+                stage.upload_finished(report)
+
+    async def _load(
+        self: "TransformSource[T]",
+    ) -> AsyncIterator[list[T]]:
+        for stage in self.stages:
+            if isinstance(stage, StatefulStage):
+                stage.reset()
+        transform = functools.partial(apply_stages, self.stages)
+        batches = self.source.aiter_batches(self.batch_size)
+        if self.executor == "inline":
+            async for batch in batches:
+                if batch := transform(batch):
+                    yield batch
+            return
+        limiter = (
+            worker_limiter()
+            if self.executor == "thread"
+            else anyio.to_process.current_default_process_limiter()
+        )
+
+        async def run(batch: list[T]) -> list[T]:
+            if self.executor == "thread":
+                return await anyio.to_thread.run_sync(
+                    transform,
+                    batch,
+                    limiter=limiter,
+                )
+            return await anyio.to_process.run_sync(transform, batch, limiter=limiter)
+
+        pending: collections.deque[asyncio.Task[list[T]]] = collections.deque()
+        try:
+            async for batch in batches:
+                pending.append(asyncio.create_task(run(batch)))
+                while len(pending) >= self.workers:
+                    if batch := await self._next_done(pending):
+                        yield batch
+            while pending:
+                if batch := await self._next_done(pending):
+                    yield batch
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _next_done(
+        self: "TransformSource[T]",
+        pending: "collections.deque[asyncio.Task[list[T]]]",
+    ) -> list[T]:
+        if self.ordered:
+            return await pending.popleft()
+        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        task = done.pop()
+        pending.remove(task)
+        return task.result()
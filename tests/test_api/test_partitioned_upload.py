@@ -0,0 +1,205 @@
+import asyncio
+from typing import Any, AsyncIterator
+
+import grpc
+import pytest
+from google.rpc.status_pb2 import Status
+
+from volur.api import (
+    BatchIterable,
+    UploadStatistics,
+    VolurApiAsyncClient,
+    VolurApiSettings,
+)
+from volur.api.v1alpha1 import client as client_module
+from volur.pork.bom.v1alpha1 import bom_pb2
+
+
+class FakeStream:
+    def __init__(
+        self: "FakeStream",
+        requests: AsyncIterator[Any],
+        received: list[Any],
+    ) -> None:
+        self.requests = aiter(requests)
+        self.received = received
+
+    async def read(self: "FakeStream") -> Any:  # noqa: ANN401
+        request = await anext(self.requests, None)
+        if request is None:
+            return grpc.aio.EOF  # type: ignore[attr-defined]
+        self.received.append(request.bom)
+        await asyncio.sleep(0)
+        # boms without a process are rejected like by the Völur API
+        code = 0 if request.bom.process_id else 3
+        return bom_pb2.UploadBomInformationResponse(status=Status(code=code))
+
+
+class FakeChannel:
+    def __init__(self: "FakeChannel") -> None:
+        self.streams: list[list[bom_pb2.Bom]] = []
+
+    async def __aenter__(self: "FakeChannel") -> "FakeChannel":
+        return self
+
+    async def __aexit__(self: "FakeChannel", *_: object) -> None:
+        pass
+
+    def stream_stream(self: "FakeChannel", *_: object, **__: object) -> Any:  # noqa: ANN401
+        return self.call
+
+    def call(
+        self: "FakeChannel",
+        requests: AsyncIterator[Any],
+        **_: object,
+    ) -> FakeStream:
+        self.streams.append([])
+        return FakeStream(requests, self.streams[-1])
+
+
+@pytest.fixture
+def channel(monkeypatch: pytest.MonkeyPatch) -> FakeChannel:
+    channel = FakeChannel()
+    monkeypatch.setattr(grpc.aio, "secure_channel", lambda *_, **__: channel)
+    return channel
+
+
+async def generate_bom() -> AsyncIterator[bom_pb2.Bom]:
+    for index in range(100):
+        yield bom_pb2.Bom(
+            process_id=f"process-{index}",
+            plant=f"plant-{index % 7}",
+        )
+
+
+@pytest.mark.parametrize("streams", [1, 3])
+@pytest.mark.asyncio
+async def test_partition_bom_by_plant(channel: FakeChannel, streams: int) -> None:
+    client = VolurApiAsyncClient(
+        settings=VolurApiSettings(address="fake-address", token="fake-token"),
+    )
+    statistics = UploadStatistics()
+    status = await client.upload_bom_information(
+        generate_bom(),
+        streams=streams,
+        statistics=statistics,
+    )
+    assert status.code == 0
+    assert statistics.sent == statistics.acknowledged == 100
+    assert len(channel.streams) == streams
+    expected = [_ async for _ in generate_bom()]
+    plants: dict[str, int] = {}
+    for index, received in enumerate(channel.streams):
+        for bom in received:
+            assert plants.setdefault(bom.plant, index) == index
+        # entries of every plant are sent in the order of the source
+        partition = {bom.plant for bom in received}
+        assert received == [bom for bom in expected if bom.plant in partition]
+    assert len(plants) == 7
+
+
+class BatchedBom:
+    def __init__(self: "BatchedBom") -> None:
+        self.sizes: list[int] = []
+
+    def __aiter__(self: "BatchedBom") -> AsyncIterator[bom_pb2.Bom]:
+        return generate_bom()
+
+    async def aiter_batches(
+        self: "BatchedBom",
+        size: int,
+    ) -> AsyncIterator[list[bom_pb2.Bom]]:
+        boms = [_ async for _ in generate_bom()]
+        for offset in range(0, len(boms), 30):
+            self.sizes.append(size)
+            yield boms[offset : offset + 30]
+
+
+@pytest.mark.parametrize("streams", [1, 3])
+@pytest.mark.asyncio
+async def test_read_batches(channel: FakeChannel, streams: int) -> None:
+    client = VolurApiAsyncClient(
+        settings=VolurApiSettings(address="fake-address", token="fake-token"),
+    )
+    source = BatchedBom()
+    assert isinstance(source, BatchIterable)
+    statistics = UploadStatistics()
+    status = await client.upload_bom_information(
+        source,  # type: ignore[arg-type]
+        streams=streams,
+        statistics=statistics,
+    )
+    assert status.code == 0
+    assert statistics.read == statistics.sent == statistics.acknowledged == 100
+    assert len(source.sizes) == 4
+    received = sorted(
+        (_ for stream in channel.streams for _ in stream),
+        key=lambda _: int(_.process_id.removeprefix("process-")),
+    )
+    assert received == [_ async for _ in generate_bom()]
+
+
+@pytest.mark.asyncio
+async def test_count_rejected_records(channel: FakeChannel) -> None:
+    async def generate() -> AsyncIterator[bom_pb2.Bom]:
+        async for bom in generate_bom():
+            yield (
+                bom
+                if int(bom.process_id.removeprefix("process-")) % 10
+                else bom_pb2.Bom()
+            )
+
+    client = VolurApiAsyncClient(
+        settings=VolurApiSettings(address="fake-address", token="fake-token"),
+    )
+    statistics = UploadStatistics()
+    status = await client.upload_bom_information(generate(), statistics=statistics)
+    assert status.code == 0
+    assert statistics.sent == 100
+    assert statistics.acknowledged == 90
+    assert statistics.rejected == 10
+
+
+class ClosingStream(FakeStream):
+    async def read(self: "ClosingStream") -> Any:  # noqa: ANN401
+        # the server closes the stream after the first record
+        if self.received:
+            return grpc.aio.EOF  # type: ignore[attr-defined]
+        return await super().read()
+
+
+class ClosingChannel(FakeChannel):
+    def call(
+        self: "ClosingChannel",
+        requests: AsyncIterator[Any],
+        **_: object,
+    ) -> FakeStream:
+        if self.streams:
+            return super().call(requests)
+        self.streams.append([])
+        return ClosingStream(requests, self.streams[-1])
+
+
+@pytest.mark.asyncio
+async def test_abort_when_stream_closes_early(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    closing = ClosingChannel()
+    monkeypatch.setattr(grpc.aio, "secure_channel", lambda *_, **__: closing)
+    monkeypatch.setattr(client_module, "_PARTITION_BUFFER_SIZE", 2)
+    client = VolurApiAsyncClient(
+        settings=VolurApiSettings(address="fake-address", token="fake-token"),
+    )
+    statistics = UploadStatistics()
+    status = await asyncio.wait_for(
+        client.upload_bom_information(
+            generate_bom(),
+            streams=3,
+            statistics=statistics,
+        ),
+        timeout=5,
+    )
+    assert status.code == grpc.StatusCode.ABORTED.value[0]
+    assert "stream 0 has closed" in status.message
+    # records pulled from the source are counted even if they are never sent
+    assert statistics.read > statistics.sent
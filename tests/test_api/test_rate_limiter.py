@@ -0,0 +1,20 @@
+import time
+
+import pytest
+
+from volur.api.v1alpha1.client import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_limit_rate() -> None:
+    limiter = RateLimiter(rate=100, burst=10)
+    started = time.monotonic()
+    for _ in range(30):
+        await limiter.acquire()
+    elapsed = time.monotonic() - started
+    assert 0.15 <= elapsed < 0.5
+
+
+def test_raise_exception_for_invalid_rate() -> None:
+    with pytest.raises(ValueError, match="rate must be more than 0"):
+        RateLimiter(rate=0)
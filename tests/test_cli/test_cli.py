@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import pytest
+
+from volur.sdk.v1alpha2.cli import build_parser, main
+
+CONFIG = """
+entity = "products"
+path = "products-0.csv"
+
+[columns]
+product_id = "product_id"
+"""
+
+
+@pytest.fixture
+def directory(tmpdir: Path) -> Path:
+    directory = Path(tmpdir)
+    (directory / "config.toml").write_text(CONFIG)
+    for index in range(3):
+        (directory / f"products-{index}.csv").write_text(
+            "product_id\n" + "".join(f"p-{index}-{_}\n" for _ in range(10))
+        )
+    return directory
+
+
+def test_dry_run_config(directory: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["upload", str(directory / "config.toml"), "--dry-run"]) == 0
+    assert capsys.readouterr().out.startswith("converted 10 records in ")
+
+
+def test_dry_run_many_inputs(
+    directory: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    status = main(
+        [
+            "upload",
+            str(directory / "config.toml"),
+            str(directory / "products-*.csv"),
+            "--parse-workers",
+            "2",
+            "--dry-run",
+        ]
+    )
+    assert status == 0
+    assert capsys.readouterr().out.startswith("converted 30 records in ")
+
+
+def test_dry_run_fails_preflight(
+    directory: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    (directory / "config.toml").write_text(CONFIG.replace('= "product_id"', '= "id"'))
+    assert main(["upload", str(directory / "config.toml"), "--dry-run"]) == 2
+    assert "columns id are not present in the file" in capsys.readouterr().err
+
+
+def test_report_missing_config(
+    directory: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    assert main(["upload", str(directory / "missing.toml"), "--dry-run"]) == 2
+    assert "missing.toml" in capsys.readouterr().err
+
+
+def test_dry_run_with_batch_size(
+    directory: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    status = main(
+        ["upload", str(directory / "config.toml"), "--batch-size", "3", "--dry-run"]
+    )
+    assert status == 0
+    assert capsys.readouterr().out.startswith("converted 10 records in ")
+
+
+def test_parse_performance_options() -> None:
+    arguments = build_parser().parse_args(
+        [
+            "upload",
+            "config.toml",
+            "--streams",
+            "4",
+            "--compression",
+            "gzip",
+            "--rate-limit",
+            "1000",
+            "--resume",
+            "state.sqlite",
+        ]
+    )
+    assert arguments.streams == 4
+    assert arguments.compression == "gzip"
+    assert arguments.rate_limit == 1000.0
+    assert arguments.resume == Path("state.sqlite")
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["upload", "config.toml", "--streams", "0"])
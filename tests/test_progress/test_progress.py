@@ -0,0 +1,94 @@
+import asyncio
+import io
+import time
+from pathlib import Path
+
+import pytest
+
+from volur.api.v1alpha1.client import UploadStatistics
+from volur.sdk.v1alpha2.progress import Progress, ProgressBar, ProgressTracker
+from volur.sdk.v1alpha2.sources.csv import Column, ProductsCSVFileSource
+from volur.sdk.v1alpha2.sources.dedup import DeduplicateSource
+from volur.sdk.v1alpha2.sources.files import MultiFileSource
+
+
+@pytest.fixture
+def products_file(tmpdir: Path) -> Path:
+    path = Path(tmpdir / "products.csv")
+    path.write_text("product_id\n" + "".join(f"p-{_}\n" for _ in range(10_000)))
+    return path
+
+
+def create_source(path: Path) -> ProductsCSVFileSource:
+    return ProductsCSVFileSource(
+        str(path),
+        product_id_column=Column(column_name="product_id"),
+    )
+
+
+def test_estimate_remaining_time() -> None:
+    progress = Progress(sent=100, bytes_consumed=250, bytes_total=1000, elapsed=10)
+    assert progress.fraction == 0.25
+    assert progress.eta == 30
+    assert progress.throughput == 10
+    assert Progress(elapsed=10).eta is None
+
+
+@pytest.mark.asyncio
+async def test_measure_bytes_of_csv_file(products_file: Path) -> None:
+    source = create_source(products_file)
+    assert source.bytes_consumed is None
+    iterator = aiter(source)
+    await anext(iterator)
+    assert source.bytes_total == products_file.stat().st_size
+    assert 0 < (source.bytes_consumed or 0) <= products_file.stat().st_size
+    _ = [_ async for _ in iterator]
+    assert source.bytes_consumed == source.bytes_total
+
+
+@pytest.mark.asyncio
+async def test_measure_bytes_of_buffer() -> None:
+    stream = io.BytesIO(b"product_id\np-1\np-2\n")
+    source = ProductsCSVFileSource(
+        stream,
+        product_id_column=Column(column_name="product_id"),
+    )
+    _ = [_ async for _ in source]
+    assert source.bytes_total == source.bytes_consumed == len(stream.getvalue())
+
+
+@pytest.mark.asyncio
+async def test_sample_wrapped_and_many_files(products_file: Path) -> None:
+    source = DeduplicateSource(
+        MultiFileSource([products_file, products_file], source=create_source),
+        keep="first",
+    )
+    tracker = ProgressTracker(sinks=[])
+    statistics = UploadStatistics()
+    async for _ in source:
+        statistics.read += 1
+    progress = tracker.sample(source, statistics, time.perf_counter())
+    assert progress.read == 10_000
+    assert progress.bytes_total == 2 * products_file.stat().st_size
+    assert progress.fraction == 1.0
+
+
+@pytest.mark.asyncio
+async def test_emit_progress_at_interval() -> None:
+    emitted: list[Progress] = []
+    tracker = ProgressTracker(sinks=[emitted.append], interval=0.01)
+    task = asyncio.create_task(
+        tracker.track(None, UploadStatistics(), time.perf_counter()),
+    )
+    await asyncio.sleep(0.1)
+    task.cancel()
+    assert 3 <= len(emitted) <= 11
+
+
+def test_draw_progress_bar() -> None:
+    stream = io.StringIO()
+    bar = ProgressBar(stream=stream, width=10)
+    bar(Progress(sent=50, bytes_consumed=50, bytes_total=100, elapsed=5))
+    assert stream.getvalue() == "\r[#####-----]  50.0% 50 records 10/s ETA 00:00:05"
+    bar(Progress(sent=100, elapsed=10, finished=True))
+    assert stream.getvalue().endswith("100.0% 100 records 10/s ETA 00:00:00\n")
@@ -0,0 +1,80 @@
+import io
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.shared.v1alpha1.quantity_pb2 import Quantity, QuantityValue
+from volur.sdk.v1alpha2.sources.csv import Column, QuantityColumn
+
+pa = pytest.importorskip("pyarrow")
+
+from volur.sdk.v1alpha2.sources.arrow import MaterialsArrowFileSource  # noqa: E402
+
+
+@pytest.fixture
+def table() -> Any:  # noqa: ANN401
+    return pa.table(
+        {
+            "id": ["material-id-1", "material-id-2", "material-id-3"],
+            "quantity": [1, 2, 3],
+        }
+    )
+
+
+@pytest.fixture
+def expected_materials() -> list[material_pb2.Material]:
+    return [
+        material_pb2.Material(
+            material_id=f"material-id-{_}",
+            quantity=Quantity(value=QuantityValue(piece=_)),
+        )
+        for _ in range(1, 4)
+    ]
+
+
+@pytest.fixture
+def arrow_file(tmpdir: Path, table: Any) -> str:  # noqa: ANN401
+    path = Path(tmpdir / "test.arrow")
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=2)
+    return str(path)
+
+
+@pytest.fixture
+def arrow_stream(table: Any) -> io.BufferedIOBase:  # noqa: ANN401
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=2)
+    return io.BytesIO(sink.getvalue().to_pybytes())
+
+
+@pytest.mark.asyncio
+async def test_load_file(
+    arrow_file: str,
+    expected_materials: list[material_pb2.Material],
+) -> None:
+    source = MaterialsArrowFileSource(
+        arrow_file,
+        batch_size=1,
+        material_id_column=Column(column_name="id"),
+        quantity_column=QuantityColumn(column_name="quantity", unit="piece"),
+    )
+    actual_materials = [_ async for _ in source]
+    assert actual_materials == expected_materials
+
+
+@pytest.mark.asyncio
+async def test_load_stream(
+    arrow_stream: io.BufferedIOBase,
+    expected_materials: list[material_pb2.Material],
+) -> None:
+    source = MaterialsArrowFileSource(
+        arrow_stream,
+        material_id_column=Column(column_name=0),
+        quantity_column=QuantityColumn(column_name=1, unit="piece"),
+    )
+    actual_materials = [_ async for _ in source]
+    assert actual_materials == expected_materials
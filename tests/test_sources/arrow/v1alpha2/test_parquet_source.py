@@ -0,0 +1,234 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+from google.type.date_pb2 import Date
+
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+from volur.pork.shared.v1alpha1.characteristic_pb2 import (
+    Characteristic,
+    CharacteristicValue,
+)
+from volur.pork.shared.v1alpha1.quantity_pb2 import Quantity, QuantityValue
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnBool,
+    CharacteristicColumnDate,
+    CharacteristicColumnFloat,
+    CharacteristicColumnInteger,
+    CharacteristicColumnString,
+    Column,
+    QuantityColumn,
+)
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from volur.sdk.v1alpha2.sources.arrow import (  # noqa: E402
+    DemandParquetFileSource,
+    MaterialsParquetFileSource,
+    ProductsParquetFileSource,
+)
+
+
+@pytest.fixture
+def parquet_file(tmpdir: Path) -> str:
+    path = Path(tmpdir / "test.parquet")
+    pq.write_table(
+        pa.table(
+            {
+                "id": [1, 2, 3],
+                "plant": ["Plant1", "Plant1", None],
+                "quantity": [100.0, 50.5, None],
+                "float_column": [1.0, None, 2.5],
+                "integer_column": [1, 2, None],
+                "string_column": ["string-value", None, "string-value"],
+                "bool_column": [True, False, None],
+                "date_column": [date(2024, 1, 2), None, date(2024, 3, 4)],
+                "unused_column": ["a", "b", "c"],
+            }
+        ),
+        path,
+    )
+    return str(path)
+
+
+@pytest.fixture
+def expected_materials() -> list[material_pb2.Material]:
+    return [
+        material_pb2.Material(
+            material_id="1",
+            plant="Plant1",
+            quantity=Quantity(value=QuantityValue(kilogram=100.0)),
+            characteristics=[
+                Characteristic(
+                    name="float-characteristic",
+                    value=CharacteristicValue(value_float=1.0),
+                ),
+                Characteristic(
+                    name="integer-characteristic",
+                    value=CharacteristicValue(value_integer=1),
+                ),
+                Characteristic(
+                    name="string-characteristic",
+                    value=CharacteristicValue(value_string="string-value"),
+                ),
+                Characteristic(
+                    name="bool-characteristic",
+                    value=CharacteristicValue(value_bool=True),
+                ),
+                Characteristic(
+                    name="date-characteristic",
+                    value=CharacteristicValue(
+                        value_date=Date(year=2024, month=1, day=2),
+                    ),
+                ),
+            ],
+        ),
+        material_pb2.Material(
+            material_id="2",
+            plant="Plant1",
+            quantity=Quantity(value=QuantityValue(kilogram=50.5)),
+            characteristics=[
+                Characteristic(
+                    name="float-characteristic",
+                    value=CharacteristicValue(),
+                ),
+                Characteristic(
+                    name="integer-characteristic",
+                    value=CharacteristicValue(value_integer=2),
+                ),
+                Characteristic(
+                    name="string-characteristic",
+                    value=CharacteristicValue(),
+                ),
+                Characteristic(
+                    name="bool-characteristic",
+                    value=CharacteristicValue(value_bool=False),
+                ),
+                Characteristic(
+                    name="date-characteristic",
+                    value=CharacteristicValue(),
+                ),
+            ],
+        ),
+        material_pb2.Material(
+            material_id="3",
+            quantity=Quantity(value=QuantityValue()),
+            characteristics=[
+                Characteristic(
+                    name="float-characteristic",
+                    value=CharacteristicValue(value_float=2.5),
+                ),
+                Characteristic(
+                    name="integer-characteristic",
+                    value=CharacteristicValue(),
+                ),
+                Characteristic(
+                    name="string-characteristic",
+                    value=CharacteristicValue(value_string="string-value"),
+                ),
+                Characteristic(
+                    name="bool-characteristic",
+                    value=CharacteristicValue(),
+                ),
+                Characteristic(
+                    name="date-characteristic",
+                    value=CharacteristicValue(
+                        value_date=Date(year=2024, month=3, day=4),
+                    ),
+                ),
+            ],
+        ),
+    ]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1024])
+@pytest.mark.asyncio
+async def test_load_materials(
+    parquet_file: str,
+    expected_materials: list[material_pb2.Material],
+    batch_size: int,
+) -> None:
+    source = MaterialsParquetFileSource(
+        parquet_file,
+        batch_size=batch_size,
+        material_id_column=Column(column_name="id"),
+        plant_id_column=Column(column_name=1),
+        quantity_column=QuantityColumn(column_name="quantity", unit="kilogram"),
+        characteristics_columns=[
+            CharacteristicColumnFloat(
+                column_name="float_column",
+                characteristic_name="float-characteristic",
+            ),
+            CharacteristicColumnInteger(
+                column_name="integer_column",
+                characteristic_name="integer-characteristic",
+            ),
+            CharacteristicColumnString(
+                column_name="string_column",
+                characteristic_name="string-characteristic",
+            ),
+            CharacteristicColumnBool(
+                column_name="bool_column",
+                characteristic_name="bool-characteristic",
+            ),
+            CharacteristicColumnDate(
+                column_name="date_column",
+                characteristic_name="date-characteristic",
+            ),
+        ],
+    )
+    actual_materials = [_ async for _ in source]
+    assert actual_materials == expected_materials
+
+
+@pytest.mark.asyncio
+async def test_load_products(parquet_file: str) -> None:
+    source = ProductsParquetFileSource(
+        parquet_file,
+        product_id_column=Column(column_name="id"),
+    )
+    actual_products = [_ async for _ in source]
+    assert actual_products == [
+        product_pb2.Product(product_id="1"),
+        product_pb2.Product(product_id="2"),
+        product_pb2.Product(product_id="3"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_load_demand(parquet_file: str) -> None:
+    source = DemandParquetFileSource(
+        parquet_file,
+        product_id_column=Column(column_name="id"),
+        plant_id_column=Column(column_name="plant"),
+        customer_id_column=Column(column_name="string_column"),
+    )
+    actual_demand = [_ async for _ in source]
+    assert actual_demand == [
+        demand_pb2.Demand(
+            product=product_pb2.Product(product_id="1"),
+            plant="Plant1",
+            customer_id="string-value",
+        ),
+        demand_pb2.Demand(
+            product=product_pb2.Product(product_id="2"),
+            plant="Plant1",
+        ),
+        demand_pb2.Demand(
+            product=product_pb2.Product(product_id="3"),
+            customer_id="string-value",
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_raise_exception_for_missing_column(parquet_file: str) -> None:
+    source = ProductsParquetFileSource(
+        parquet_file,
+        product_id_column=Column(column_name="missing_column"),
+    )
+    with pytest.raises(ValueError, match="column missing_column is not present"):
+        _ = [_ async for _ in source]
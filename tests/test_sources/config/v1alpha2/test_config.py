@@ -0,0 +1,201 @@
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.shared.v1alpha1.characteristic_pb2 import (
+    Characteristic,
+    CharacteristicValue,
+)
+from volur.pork.shared.v1alpha1.quantity_pb2 import Quantity, QuantityValue
+from volur.sdk.v1alpha2.sources.config import load_config, load_source
+from volur.sdk.v1alpha2.sources.csv import MaterialsCSVFileSource
+
+TOML_CONFIG = """
+entity = "materials"
+path = "materials.csv"
+
+[options]
+delimiter = ";"
+limit = 1
+
+[columns]
+material_id = "MATERIAL_ID"
+quantity = { column = "WEIGHT", unit = "kilogram" }
+
+[[characteristics]]
+column = "FROZEN"
+name = "is_frozen"
+type = "bool"
+extra_values_true = ["ja"]
+"""
+
+YAML_CONFIG = """
+entity: materials
+path: materials.csv
+options:
+  delimiter: ";"
+  limit: 1
+columns:
+  material_id: MATERIAL_ID
+  quantity:
+    column: WEIGHT
+    unit: kilogram
+characteristics:
+  - column: FROZEN
+    name: is_frozen
+    type: bool
+    extra_values_true: ["ja"]
+"""
+
+EXPECTED = [
+    material_pb2.Material(
+        material_id="m-1",
+        quantity=Quantity(value=QuantityValue(kilogram=10.5)),
+        characteristics=[
+            Characteristic(
+                name="is_frozen",
+                value=CharacteristicValue(value_bool=True),
+            ),
+        ],
+    ),
+]
+
+
+@pytest.fixture
+def directory(tmpdir: Path) -> Path:
+    directory = Path(tmpdir)
+    (directory / "materials.csv").write_text(
+        "MATERIAL_ID;WEIGHT;FROZEN\nm-1;10.5;ja\nm-2;1;false\n"
+    )
+    return directory
+
+
+@pytest.mark.parametrize(
+    ("name", "content"),
+    [("config.toml", TOML_CONFIG), ("config.yaml", YAML_CONFIG)],
+)
+@pytest.mark.asyncio
+async def test_compile_source(directory: Path, name: str, content: str) -> None:
+    if name.endswith(".yaml"):
+        pytest.importorskip("yaml")
+    (directory / name).write_text(content)
+    source = load_source(directory / name)
+    assert isinstance(source, MaterialsCSVFileSource)
+    assert [_ async for _ in source] == EXPECTED
+
+
+@pytest.mark.asyncio
+async def test_use_cached_config(directory: Path) -> None:
+    (directory / "config.toml").write_text(TOML_CONFIG)
+    cache = directory / "cache"
+    first = load_config(directory / "config.toml", cache)
+    assert len(list(cache.iterdir())) == 1
+    second = load_config(directory / "config.toml", cache)
+    assert first == second
+    assert [_ async for _ in second.compile()] == EXPECTED
+
+
+@pytest.mark.parametrize(
+    ("content", "message"),
+    [
+        (
+            'entity = "products"\npath = "a.csv"\n[columns]\nplant_id = "PLANT"\n',
+            "column plant_id is not supported by products sources",
+        ),
+        (
+            'entity = "materials"\npath = "a.csv"\n[columns]\nquantity = "WEIGHT"\n',
+            "unit must be set for the quantity column",
+        ),
+        (
+            'entity = "materials"\npath = "a.csv"\n[options]\nbatch = 10\n',
+            "option batch is not supported by csv sources",
+        ),
+        (
+            'entity = "materials"\npath = "a.csv"\n'
+            '[[characteristics]]\ncolumn = "A"\nname = "a"\n'
+            'extra_date_formats = ["%Y"]\n',
+            "extra date formats can be set only for date characteristics",
+        ),
+        (
+            'entity = "product_inventory"\npath = "a.csv"\n'
+            '[columns]\nweight = { column = "W", unit = "box" }\n',
+            "unit box is not a weight unit",
+        ),
+        (
+            'entity = "materials"\npath = "a.csv"\n'
+            '[[characteristics]]\ncolumn = "A"\nname = "a"\ncurrency = "EUR"\n',
+            "currency and unit can be set only for price per unit characteristics",
+        ),
+        (
+            'entity = "materials"\npath = "a.csv"\n'
+            '[[characteristics]]\ncolumn = "A"\nname = "a"\nresult = "float"\n',
+            "result can be set only for expression characteristics",
+        ),
+        (
+            'entity = "materials"\npath = "a.csv"\n'
+            '[columns]\nplant_id = { column = "P", aliases = { a = "b" } }\n',
+            "aliases can not be set for the plant_id column",
+        ),
+        (
+            'entity = "orders"\npath = "a.csv"\n',
+            "entity",
+        ),
+        (
+            'entity = "product_inventory"\nformat = "jsonl"\npath = "a.jsonl"\n',
+            "product_inventory can not be read from jsonl files",
+        ),
+    ],
+)
+def test_raise_exception_for_invalid_config(
+    directory: Path,
+    content: str,
+    message: str,
+) -> None:
+    (directory / "config.toml").write_text(content)
+    with pytest.raises(ValidationError, match=message):
+        load_config(directory / "config.toml")
+
+
+@pytest.mark.asyncio
+async def test_compile_weight_and_price_columns(directory: Path) -> None:
+    (directory / "inventory.csv").write_text(
+        "PRODUCT;WEIGHT;UNIT;PRICE\np-1;2;lb;1.5\n"
+    )
+    (directory / "config.toml").write_text(
+        'entity = "product_inventory"\npath = "inventory.csv"\n'
+        '[options]\ndelimiter = ";"\n'
+        '[columns]\nproduct_id = "PRODUCT"\n'
+        'weight = { column = "WEIGHT", unit_column = "UNIT", normalize = true }\n'
+        '[[characteristics]]\ncolumn = "PRICE"\nname = "price"\n'
+        'type = "price_per_unit"\ncurrency = "USD"\nunit_column = "UNIT"\n'
+    )
+    [inventory] = [_ async for _ in load_source(directory / "config.toml")]
+    assert inventory.weight.value.kilogram == pytest.approx(0.90718474)
+    assert inventory.characteristics[0].value.value_price_per_unit.unit == "pound"
+
+
+@pytest.mark.asyncio
+async def test_compile_enum_column(directory: Path) -> None:
+    (directory / "types.csv").write_text("ID,TYPE\nm-1,slakt\n")
+    (directory / "config.toml").write_text(
+        'entity = "materials"\npath = "types.csv"\n'
+        '[columns]\nmaterial_id = "ID"\n'
+        'type = { column = "TYPE", aliases = { slakt = "carcass" } }\n'
+    )
+    [material] = [_ async for _ in load_source(directory / "config.toml")]
+    assert material.type == material_pb2.MATERIAL_TYPE_CARCASS
+
+
+@pytest.mark.asyncio
+async def test_compile_expression_column(directory: Path) -> None:
+    (directory / "materials.csv").write_text("ID,LEAN,WEIGHT\nm-1,30,120\n")
+    (directory / "config.toml").write_text(
+        'entity = "materials"\npath = "materials.csv"\n'
+        '[columns]\nmaterial_id = "ID"\n'
+        '[[characteristics]]\ncolumn = "LEAN / WEIGHT * 100"\nname = "lean"\n'
+        'type = "expression"\n'
+    )
+    [material] = [_ async for _ in load_source(directory / "config.toml")]
+    assert material.characteristics[0].value.value_float == 25
@@ -0,0 +1,157 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+import anyio
+import pytest
+
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+from volur.pork.shared.v1alpha1.quantity_pb2 import Quantity, QuantityValue
+from volur.sdk.v1alpha2.report import UploadReport
+from volur.sdk.v1alpha2.sources.core import WORKER_THREADS, OnError, worker_limiter
+from volur.sdk.v1alpha2.sources.csv import (
+    Column,
+    DemandCSVFileSource,
+    MaterialsCSVFileSource,
+    QuantityColumn,
+)
+from volur.sdk.v1alpha2.sources.dedup import DeduplicateSource
+from volur.sdk.v1alpha2.sources.sql import MaterialsSQLSource
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path = tmp_path / "materials.csv"
+    path.write_text("id,weight\nm-1,1\nm-2,heavy\nm-3,3\n")
+    return path
+
+
+def create_source(path: Path, on_error: OnError) -> MaterialsCSVFileSource:
+    return MaterialsCSVFileSource(
+        path,
+        material_id_column=Column("id"),
+        quantity_column=QuantityColumn("weight", unit="kilogram"),
+        on_error=on_error,
+        batch_size=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_raise_on_invalid_row(path: Path) -> None:
+    with pytest.raises(ValueError, match="heavy in column weight"):
+        _ = [_ async for _ in create_source(path, "raise")]
+
+
+@pytest.mark.parametrize("on_error", ["skip", "log"])
+@pytest.mark.asyncio
+async def test_drop_invalid_rows(path: Path, on_error: OnError) -> None:
+    source = create_source(path, on_error)
+    materials = [_ async for _ in source]
+    assert [_.material_id for _ in materials] == ["m-1", "m-3"]
+    assert source.invalid == 1
+    report = UploadReport()
+    source.upload_finished(report)
+    assert report.invalid == 1
+    # counters are reset when the source is read again
+    assert len([_ async for _ in source]) == 2
+    assert source.invalid == 1
+
+
+@pytest.mark.asyncio
+async def test_read_batches(tmp_path: Path) -> None:
+    path = tmp_path / "materials.csv"
+    path.write_text("id\n" + "".join(f"m-{_}\n" for _ in range(7)))
+    source = MaterialsCSVFileSource(
+        path,
+        material_id_column=Column("id"),
+        batch_size=5,
+    )
+    batches = [_ async for _ in source.aiter_batches(3)]
+    assert [len(_) for _ in batches] == [3, 2, 2]
+    assert [_.material_id for _ in batches[0]] == ["m-0", "m-1", "m-2"]
+    assert [len(_) async for _ in source.aiter_batches()] == [5, 2]
+    assert len([_ async for _ in source]) == 7
+
+
+@pytest.mark.asyncio
+async def test_read_batches_of_source(path: Path) -> None:
+    source = DeduplicateSource(create_source(path, "skip"))
+    assert [len(_) async for _ in source.aiter_batches(1)] == [1, 1]
+    with pytest.raises(ValueError, match="batch size must be more than 0"):
+        _ = [_ async for _ in source.aiter_batches(0)]
+
+
+@pytest.mark.asyncio
+async def test_share_worker_limiter() -> None:
+    limiter = worker_limiter()
+    assert limiter is worker_limiter()
+    assert limiter is not anyio.to_thread.current_default_thread_limiter()
+    assert limiter.total_tokens == WORKER_THREADS
+
+
+@pytest.mark.asyncio
+async def test_read_with_limiter(path: Path) -> None:
+    limiter = anyio.CapacityLimiter(1)
+    source = create_source(path, "skip")
+    source.limiter = limiter
+    threads: set[int] = set()
+    convert = source._convert
+
+    def track(rows: list[dict[str | int, object]]) -> list[material_pb2.Material]:
+        assert limiter.borrowed_tokens == 1
+        threads.add(threading.get_ident())
+        return convert(rows)
+
+    source._convert = track  # type: ignore[method-assign]
+    assert len([_ async for _ in source]) == 2
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+async def test_drop_invalid_rows_of_sql_source() -> None:
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    connection.execute("CREATE TABLE materials (id TEXT, weight TEXT)")
+    connection.executemany(
+        "INSERT INTO materials VALUES (?, ?)",
+        [("m-1", "1"), ("m-2", "heavy")],
+    )
+    source = MaterialsSQLSource(
+        connection,
+        "SELECT id, weight FROM materials",
+        material_id_column=Column("id"),
+        quantity_column=QuantityColumn("weight", unit="kilogram"),
+        on_error="skip",
+    )
+    assert [_ async for _ in source] == [
+        material_pb2.Material(
+            material_id="m-1",
+            quantity=Quantity(value=QuantityValue(kilogram=1)),
+        ),
+    ]
+    assert source.invalid == 1
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_read_all_demand_columns(tmp_path: Path) -> None:
+    path = tmp_path / "demand.csv"
+    path.write_text("product,plant,customer,pieces\np-1,P1,c-1,5\n")
+    source = DemandCSVFileSource(
+        path,
+        has_header=True,
+        product_id_column=Column("product"),
+        plant_id_column=Column("plant"),
+        customer_id_column=Column("customer"),
+        quantity_column=QuantityColumn("pieces", unit="piece"),
+    )
+    assert source.columns == ["product", "plant", "customer", "pieces"]
+    assert [_ async for _ in source] == [
+        demand_pb2.Demand(
+            product=product_pb2.Product(product_id="p-1"),
+            plant="P1",
+            customer_id="c-1",
+            quantity=Quantity(value=QuantityValue(piece=5)),
+        ),
+    ]
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+
+from volur.pork.bom.v1alpha1 import bom_pb2
+from volur.sdk.v1alpha2.sources.csv import BomCSVFileSource, Column
+
+
+@pytest.fixture
+def csv_file(tmpdir: Path) -> str:
+    path = Path(tmpdir / "bom.csv")
+    path.write_text(
+        "process,plant,machine,product,share\n"
+        "cutting,plant-1,saw-1,carcass,1\n"
+        "cutting,plant-1,saw-1,loin,0.25\n"
+        "cutting,plant-2,,belly,\n"
+    )
+    return str(path)
+
+
+def create_source(path: str) -> BomCSVFileSource:
+    return BomCSVFileSource(
+        path,
+        process_id_column=Column(column_name="process"),
+        plant_id_column=Column(column_name="plant"),
+        machine_id_column=Column(column_name="machine"),
+        product_id_column=Column(column_name="product"),
+        quantity_percent_column=Column(column_name="share"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_bom_from_a_file(csv_file: str) -> None:
+    assert [_ async for _ in create_source(csv_file)] == [
+        bom_pb2.Bom(
+            process_id="cutting",
+            plant="plant-1",
+            machine_id="saw-1",
+            product_id="carcass",
+            quantity_percent=1,
+        ),
+        bom_pb2.Bom(
+            process_id="cutting",
+            plant="plant-1",
+            machine_id="saw-1",
+            product_id="loin",
+            quantity_percent=0.25,
+        ),
+        bom_pb2.Bom(
+            process_id="cutting",
+            plant="plant-2",
+            product_id="belly",
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_raise_exception_for_invalid_quantity_percent(tmpdir: Path) -> None:
+    path = Path(tmpdir / "bom.csv")
+    path.write_text("process,share\ncutting,quarter\n")
+    source = BomCSVFileSource(
+        str(path),
+        process_id_column=Column(column_name="process"),
+        quantity_percent_column=Column(column_name="share"),
+    )
+    with pytest.raises(ValueError, match="value quarter in column share"):
+        _ = [_ async for _ in source]
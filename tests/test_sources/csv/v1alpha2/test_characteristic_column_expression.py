@@ -0,0 +1,170 @@
+from typing import Any, Literal
+
+import pytest
+
+from volur.pork.shared.v1alpha1.characteristic_pb2 import (
+    Characteristic,
+    CharacteristicValue,
+)
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnExpression,
+    compile_expression,
+)
+
+
+@pytest.mark.parametrize(
+    ("expression", "result", "data", "expected"),
+    [
+        (
+            "lean_weight / weight * 100",
+            "float",
+            {"lean_weight": "20", "weight": "80"},
+            CharacteristicValue(value_float=25),
+        ),
+        (
+            "lean_weight / weight * 100",
+            "float",
+            {"lean_weight": 20, "weight": ""},
+            CharacteristicValue(),
+        ),
+        (
+            'plant & "-" & col("MATERIAL ID")',
+            "string",
+            {"plant": 12, "MATERIAL ID": "m-1"},
+            CharacteristicValue(value_string="12-m-1"),
+        ),
+        (
+            "round(col(0) * 2)",
+            "integer",
+            {0: "1.6"},
+            CharacteristicValue(value_integer=3),
+        ),
+        (
+            'upper(strip(grade)) == "A" and weight >= 10',
+            "bool",
+            {"grade": " a ", "weight": "10"},
+            CharacteristicValue(value_bool=True),
+        ),
+        (
+            '"heavy" if max(a, b) > 10 else "light"',
+            "string",
+            {"a": "3", "b": 4.5},
+            CharacteristicValue(value_string="light"),
+        ),
+    ],
+)
+def test_get_value(
+    expression: str,
+    result: Literal["float", "integer", "string", "bool"],
+    data: dict[str | int, Any],
+    expected: CharacteristicValue,
+) -> None:
+    column = CharacteristicColumnExpression(expression, "computed", result=result)
+    assert column.get_value(data) == Characteristic(name="computed", value=expected)
+
+
+def test_column_ids() -> None:
+    column = CharacteristicColumnExpression(
+        'a / b + a & col("C D") & col(2)',
+        "computed",
+        result="string",
+    )
+    assert column.column_ids == ["a", "b", "C D", 2]
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        ({"a": "1", "b": "0"}, "can not be evaluated: .*division by zero"),
+        ({"a": "one", "b": "1"}, "'one' can not be interpreted as a number"),
+    ],
+)
+def test_raise_exception_for_invalid_value(
+    data: dict[str | int, Any],
+    message: str,
+) -> None:
+    column = CharacteristicColumnExpression("a / b", "computed")
+    with pytest.raises(ValueError, match=message):
+        column.get_value(data)
+
+
+def test_get_values_of_a_batch() -> None:
+    column = CharacteristicColumnExpression("a / b * 100", "computed")
+    rows: list[dict[str | int, Any]] = [
+        {"a": "1", "b": "4"},
+        {"a": "", "b": "4"},
+        {"a": 3, "b": 4},
+    ]
+
+    def evaluate(data: dict[str | int, Any]) -> Any:  # noqa: ANN401
+        raise AssertionError("complete rows are evaluated for the whole batch")
+
+    # only the row with a missing value is evaluated on its own
+    column.expression.evaluate = evaluate  # type: ignore[method-assign]
+    with pytest.raises(AssertionError):
+        column.get_values(rows)
+    assert column.get_values([rows[0], rows[2]]) == [
+        Characteristic(name="computed", value=CharacteristicValue(value_float=25)),
+        Characteristic(name="computed", value=CharacteristicValue(value_float=75)),
+    ]
+
+
+def test_get_values_of_a_batch_with_invalid_rows() -> None:
+    column = CharacteristicColumnExpression("a / b", "computed", result="integer")
+    values = column.get_values(
+        [
+            {"a": "4", "b": "2"},
+            {"a": "1", "b": "0"},
+            {"a": "1", "b": ""},
+            {"a": "1", "b": "2"},
+        ]
+    )
+    assert values[0] == Characteristic(
+        name="computed",
+        value=CharacteristicValue(value_integer=2),
+    )
+    assert isinstance(values[1], ValueError)
+    assert values[2] == Characteristic(name="computed", value=CharacteristicValue())
+    assert isinstance(values[3], ValueError)
+
+
+@pytest.mark.parametrize("expression", ["9 ** 9 ** 9", "a ** b ** b"])
+def test_compute_powers_with_floats(expression: str) -> None:
+    column = CharacteristicColumnExpression(expression, "computed")
+    with pytest.raises(ValueError, match="can not be evaluated"):
+        column.get_value({"a": "9", "b": "9"})
+    assert isinstance(column.get_values([{"a": "9", "b": "9"}])[0], ValueError)
+    column = CharacteristicColumnExpression("a ** 2", "computed", result="integer")
+    assert column.get_value({"a": "3"}) == Characteristic(
+        name="computed",
+        value=CharacteristicValue(value_integer=9),
+    )
+
+
+def test_raise_exception_for_invalid_result() -> None:
+    column = CharacteristicColumnExpression("a / b", "computed", result="integer")
+    with pytest.raises(ValueError, match="can not be interpreted as integer"):
+        column.get_value({"a": "1", "b": "2"})
+
+
+@pytest.mark.parametrize(
+    ("expression", "message"),
+    [
+        ("a +", "is not valid"),
+        ("__import__('os')", "function __import__ is not supported"),
+        ("a.real", "Attribute is not supported"),
+        ("a[0]", "Subscript is not supported"),
+        ("(lambda: 1)()", "only functions can be called"),
+        ("a | b", "operator BitOr is not supported"),
+        ("a in b", "operator In is not supported"),
+        ("col(a)", "col accepts a single name or index of a column"),
+        ("round(a, ndigits=1)", "accepts only positional arguments"),
+        ("abs(a, b)", "wrong number of arguments of function abs"),
+    ],
+)
+def test_raise_exception_for_invalid_expression(
+    expression: str,
+    message: str,
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        compile_expression(expression)
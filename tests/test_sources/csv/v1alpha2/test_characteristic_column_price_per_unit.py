@@ -0,0 +1,124 @@
+import pytest
+from google.type.money_pb2 import Money
+
+from volur.pork.shared.v1alpha1.characteristic_pb2 import (
+    Characteristic,
+    CharacteristicValue,
+)
+from volur.pork.shared.v1alpha1.price_per_unit_pb2 import PricePerUnit
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnPricePerUnit,
+    Column,
+)
+
+
+def price(currency: str, units: int, nanos: int, unit: str) -> Characteristic:
+    return Characteristic(
+        name="price",
+        value=CharacteristicValue(
+            value_price_per_unit=PricePerUnit(
+                value=Money(currency_code=currency, units=units, nanos=nanos),
+                unit=unit,
+            ),
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    ("data", "normalize", "expected"),
+    [
+        (
+            {"price": "12.25", "currency": "nok", "unit": "kg"},
+            False,
+            price("NOK", 12, 250_000_000, "kilogram"),
+        ),
+        (
+            {"price": "-0.5", "currency": "USD", "unit": "box"},
+            False,
+            price("USD", 0, -500_000_000, "box"),
+        ),
+        (
+            {"price": "4.5359237", "currency": "USD", "unit": "lb"},
+            False,
+            price("USD", 4, 535_923_700, "pound"),
+        ),
+        (
+            {"price": "4.5359237", "currency": "USD", "unit": "lb"},
+            True,
+            price("USD", 10, 0, "kilogram"),
+        ),
+        (
+            {"price": "", "currency": "USD", "unit": "lb"},
+            False,
+            Characteristic(name="price", value=CharacteristicValue()),
+        ),
+    ],
+)
+def test_get_price_per_unit_value(
+    data: dict[str | int, object],
+    normalize: bool,
+    expected: Characteristic,
+) -> None:
+    column = CharacteristicColumnPricePerUnit(
+        column_name="price",
+        characteristic_name="price",
+        currency_column=Column("currency"),
+        unit_column=Column("unit"),
+        normalize=normalize,
+    )
+    assert column.column_ids == ["price", "currency", "unit"]
+    assert column.get_value(data) == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        ({"price": "cheap"}, "can not be interpreted as price per unit"),
+        ({"price": "inf"}, "can not be interpreted as price per unit"),
+    ],
+)
+def test_raise_exception_for_invalid_price_per_unit(
+    data: dict[str | int, object],
+    message: str,
+) -> None:
+    column = CharacteristicColumnPricePerUnit(
+        column_name="price",
+        characteristic_name="price",
+        currency="EUR",
+        unit="kilogram",
+    )
+    with pytest.raises(ValueError, match=message):
+        column.get_value(data)
+
+
+def test_get_price_per_unit_values_of_a_batch() -> None:
+    column = CharacteristicColumnPricePerUnit(
+        "price",
+        "price",
+        currency_column=Column("currency"),
+        unit_column=Column("unit"),
+        normalize=True,
+    )
+    values = column.get_values(
+        [
+            {"price": "10", "currency": "nok", "unit": "LB"},
+            {"price": "", "currency": "nok", "unit": "LB"},
+            {"price": "x", "currency": "nok", "unit": "LB"},
+            {"price": "3", "currency": "", "unit": "piece"},
+            {"price": "3", "currency": "eur", "unit": " piece "},
+        ]
+    )
+    assert values[0] == price("NOK", 22, 46226218, "kilogram")
+    assert values[1] == Characteristic(name="price", value=CharacteristicValue())
+    assert isinstance(values[2], ValueError)
+    assert isinstance(values[3], ValueError)
+    assert values[4] == price("EUR", 3, 0, "piece")
+
+
+def test_raise_exception_without_currency() -> None:
+    with pytest.raises(ValueError, match="either currency or currency column"):
+        CharacteristicColumnPricePerUnit(
+            column_name="price",
+            characteristic_name="price",
+            unit="kilogram",
+        )
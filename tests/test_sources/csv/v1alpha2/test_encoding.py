@@ -0,0 +1,103 @@
+import codecs
+import io
+from pathlib import Path
+
+import pytest
+
+from volur.sdk.v1alpha2.sources.csv import (
+    Column,
+    ProductsCSVFileSource,
+    detect_encoding,
+    preflight,
+)
+from volur.sdk.v1alpha2.sources.csv.encoding import decode_lines
+
+CONTENT = "product_id,plant\nkjøttdeig,Råholt\nærfugl,Ås\n"
+
+
+def create_source(
+    path: str | io.BufferedIOBase,
+    **options: object,
+) -> ProductsCSVFileSource:
+    return ProductsCSVFileSource(
+        path,
+        product_id_column=Column(column_name="product_id"),
+        **options,  # type: ignore[arg-type]
+    )
+
+
+async def read(source: ProductsCSVFileSource) -> list[str]:
+    return [_.product_id async for _ in source]
+
+
+@pytest.mark.parametrize(
+    ("sample", "expected"),
+    [
+        (b"product_id\n", "utf-8"),
+        (CONTENT.encode("utf-8"), "utf-8"),
+        # a sample cut in the middle of a multibyte character
+        (CONTENT.encode("utf-8")[:20], "utf-8"),
+        (codecs.BOM_UTF8 + b"product_id\n", "utf-8-sig"),
+        (CONTENT.encode("utf-16"), "utf-16"),
+        (CONTENT.encode("cp1252"), "cp1252"),
+        (b"product_id\n\x81\n", "latin-1"),
+    ],
+)
+def test_detect_encoding(sample: bytes, expected: str) -> None:
+    assert detect_encoding(sample) == expected
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 7, 1 << 20])
+def test_decode_lines_in_blocks(block_size: int) -> None:
+    content = CONTENT + "no-newline"
+    lines = decode_lines(
+        io.BytesIO(content.encode("utf-8")),
+        "utf-8",
+        block_size=block_size,
+    )
+    assert list(lines) == content.splitlines(keepends=True)
+
+
+@pytest.mark.parametrize(
+    "encoding",
+    ["utf-8", "utf-8-sig", "utf-16", "cp1252"],
+)
+@pytest.mark.asyncio
+async def test_detect_encoding_of_a_file(tmpdir: Path, encoding: str) -> None:
+    path = Path(tmpdir / "products.csv")
+    path.write_bytes(CONTENT.encode(encoding))
+    expected = ["kjøttdeig", "ærfugl"]
+    assert await read(create_source(str(path))) == expected
+    assert await read(create_source(io.BytesIO(path.read_bytes()))) == expected
+
+
+@pytest.mark.asyncio
+async def test_strip_bom_of_a_configured_encoding(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    path.write_bytes(CONTENT.encode("utf-8-sig"))
+    source = create_source(str(path), encoding="utf-8")
+    assert await read(source) == ["kjøttdeig", "ærfugl"]
+
+
+@pytest.mark.asyncio
+async def test_replace_undecodable_bytes() -> None:
+    content = b"product_id\nproduct-1\nkj\xf8ttdeig\n"
+    source = create_source(io.BytesIO(content), encoding="utf-8")
+    with pytest.raises(UnicodeDecodeError):
+        await read(source)
+    source = create_source(
+        io.BytesIO(content),
+        encoding="utf-8",
+        encoding_errors="replace",
+    )
+    assert await read(source) == ["product-1", "kj�ttdeig"]
+
+
+def test_preflight_reports_encoding(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    path.write_bytes(CONTENT.encode("cp1252"))
+    report = preflight(create_source(str(path)))
+    assert report.encoding == "cp1252"
+    assert not report.problems()
+    report = preflight(create_source(str(path), encoding="utf-8"))
+    assert report.malformed == 2
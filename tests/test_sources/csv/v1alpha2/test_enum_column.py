@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import pytest
+
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.sdk.v1alpha2.sources.csv import (
+    Column,
+    EnumColumn,
+    MaterialsCSVFileSource,
+    enum_labels,
+)
+
+
+def test_enum_labels() -> None:
+    assert enum_labels(material_pb2.MaterialType.DESCRIPTOR) == {
+        "material_type_unspecified": 0,
+        "unspecified": 0,
+        "0": 0,
+        "material_type_carcass": 1,
+        "carcass": 1,
+        "1": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("MATERIAL_TYPE_CARCASS", material_pb2.MATERIAL_TYPE_CARCASS),
+        ("Carcass", material_pb2.MATERIAL_TYPE_CARCASS),
+        (" slakt ", material_pb2.MATERIAL_TYPE_CARCASS),
+        ("1", material_pb2.MATERIAL_TYPE_CARCASS),
+        (1, material_pb2.MATERIAL_TYPE_CARCASS),
+        ("unspecified", material_pb2.MATERIAL_TYPE_UNSPECIFIED),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_get_enum_value(value: object, expected: int | None) -> None:
+    column = EnumColumn(
+        "type",
+        enum=material_pb2.MaterialType,
+        aliases={"Slakt": "carcass"},
+    )
+    assert column.get_value({"type": value}) == expected
+    # the second lookup hits the cached label
+    assert column.get_value({"type": value}) == expected
+
+
+def test_raise_exception_for_unknown_label() -> None:
+    column = EnumColumn("type", enum=material_pb2.MaterialType.DESCRIPTOR)
+    with pytest.raises(
+        ValueError,
+        match="provided value side in column type is not a known label",
+    ):
+        column.get_value({"type": "side"})
+
+
+def test_raise_exception_for_unknown_alias() -> None:
+    with pytest.raises(ValueError, match="side is not a value of MaterialType"):
+        EnumColumn("type", enum=material_pb2.MaterialType, aliases={"a": "side"})
+
+
+@pytest.mark.asyncio
+async def test_read_material_type(tmp_path: Path) -> None:
+    path = tmp_path / "materials.csv"
+    path.write_text("material_id,type\nm-1,carcass\nm-2,\n")
+    source = MaterialsCSVFileSource(
+        path,
+        material_id_column=Column("material_id"),
+        type_column=EnumColumn("type", enum=material_pb2.MaterialType),
+    )
+    assert [_ async for _ in source] == [
+        material_pb2.Material(
+            material_id="m-1",
+            type=material_pb2.MATERIAL_TYPE_CARCASS,
+        ),
+        material_pb2.Material(material_id="m-2"),
+    ]
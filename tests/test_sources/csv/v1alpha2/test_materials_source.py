@@ -372,3 +372,61 @@ async def test_load_from_io_buffered_without_header(
     actual_materials.sort(key=lambda _: _.material_id)
     expected_materials.sort(key=lambda _: _.material_id)
     assert actual_materials == expected_materials
+
+
+class NonSeekableBytesIO(io.BytesIO):
+    def seekable(self) -> bool:
+        return False
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        raise io.UnsupportedOperation("seek")
+
+
+@pytest.mark.asyncio
+async def test_load_from_non_seekable_stream_without_header(
+    materials_csv_without_header_content: list[str],
+    expected_materials: list[material_pb2.Material],
+) -> None:
+    stream = NonSeekableBytesIO(
+        "".join(f"{_}\n" for _ in materials_csv_without_header_content).encode()
+    )
+    source = MaterialsCSVFileSource(
+        path=stream,
+        has_header=False,
+        material_id_column=Column(column_name=0),
+        plant_id_column=Column(column_name=1),
+        quantity_column=QuantityColumn(column_name=2, unit="kilogram"),
+        characteristics_columns=[
+            CharacteristicColumnFloat(
+                column_name=3,
+                characteristic_name="float-characteristic",
+            ),
+            CharacteristicColumnInteger(
+                column_name=4,
+                characteristic_name="integer-characteristic",
+            ),
+            CharacteristicColumnString(
+                column_name=5,
+                characteristic_name="string-characteristic",
+            ),
+            CharacteristicColumnBool(
+                column_name=6,
+                characteristic_name="bool-characteristic",
+            ),
+        ],
+    )
+    actual_materials = [_ async for _ in source]
+    assert actual_materials == expected_materials
+
+
+@pytest.mark.asyncio
+async def test_load_file_without_header_rejects_column_names(
+    materials_csv_without_header_file: str,
+) -> None:
+    source = MaterialsCSVFileSource(
+        path=materials_csv_without_header_file,
+        has_header=False,
+        material_id_column=Column(column_name="id"),
+    )
+    with pytest.raises(ValueError, match="column id must be referenced by index"):
+        _ = [_ async for _ in source]
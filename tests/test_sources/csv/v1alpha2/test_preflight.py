@@ -0,0 +1,116 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnBool,
+    CharacteristicColumnExpression,
+    CharacteristicColumnFloat,
+    Column,
+    MaterialsCSVFileSource,
+    QuantityColumn,
+    preflight,
+)
+
+
+@pytest.fixture
+def materials_file(tmpdir: Path) -> str:
+    path = Path(tmpdir / "materials.csv")
+    with open(path, "w") as f:
+        f.write("material_id,weight,frozen,category\n")
+        for index in range(10_000):
+            f.write(f"material-{index},{index / 2},{index % 2 == 0},cat-{index % 3}\n")
+    return str(path)
+
+
+def test_infer_types_and_pass(materials_file: str) -> None:
+    source = MaterialsCSVFileSource(
+        materials_file,
+        material_id_column=Column("material_id"),
+        quantity_column=QuantityColumn("weight", unit="kilogram"),
+        characteristics_columns=[
+            CharacteristicColumnBool(
+                column_name="frozen",
+                characteristic_name="is_frozen",
+            ),
+        ],
+    )
+    report = preflight(source, sample_size=300)
+    assert 300 <= report.rows < 400
+    assert [_.inferred_type for _ in report.columns] == [
+        "string",
+        "float",
+        "boolean",
+    ]
+    assert report.problems() == []
+    report.raise_for_problems()
+
+
+def test_sample_tail_of_file(materials_file: str) -> None:
+    source = MaterialsCSVFileSource(
+        materials_file,
+        material_id_column=Column("material_id"),
+    )
+    report = preflight(source, sample_size=30)
+    assert report.rows > 10
+    assert report.malformed == 0
+
+
+def test_report_missing_and_misconfigured_columns(materials_file: str) -> None:
+    source = MaterialsCSVFileSource(
+        materials_file,
+        material_id_column=Column("id"),
+        characteristics_columns=[
+            CharacteristicColumnFloat(
+                column_name="category",
+                characteristic_name="category",
+            ),
+        ],
+    )
+    report = preflight(source, sample_size=90)
+    assert report.missing_columns == ["id"]
+    category = report.columns[1]
+    assert category.inferred_type == "string"
+    assert category.error_rate == 1.0
+    with pytest.raises(ValueError, match="columns id are not present in the file"):
+        report.raise_for_problems()
+
+
+def test_check_columns_of_expressions(materials_file: str) -> None:
+    source = MaterialsCSVFileSource(
+        materials_file,
+        material_id_column=Column("material_id"),
+        characteristics_columns=[
+            CharacteristicColumnExpression(
+                column_name="weight * 2",
+                characteristic_name="double_weight",
+            ),
+            CharacteristicColumnExpression(
+                column_name="weight / volume",
+                characteristic_name="density",
+            ),
+        ],
+    )
+    report = preflight(source, sample_size=30)
+    assert report.missing_columns == ["volume"]
+    assert report.columns[1].column_id == "weight * 2"
+    assert report.columns[1].inferred_type == "float"
+    assert report.columns[1].errors == 0
+    with pytest.raises(ValueError, match="columns volume are not present in the file"):
+        report.raise_for_problems()
+
+
+def test_check_buffer_without_header() -> None:
+    stream = io.BytesIO(b"m-1,1\nm-2,x\nm-3,3\n")
+    source = MaterialsCSVFileSource(
+        stream,
+        has_header=False,
+        material_id_column=Column(0),
+        quantity_column=QuantityColumn(1, unit="kilogram"),
+    )
+    report = preflight(source)
+    assert report.rows == 3
+    assert report.columns[1].errors == 1
+    assert report.problems(max_error_rate=0.5) == []
+    assert stream.tell() == 0
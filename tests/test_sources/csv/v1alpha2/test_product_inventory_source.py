@@ -0,0 +1,126 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from volur.pork.product_inventory.v1alpha1 import product_inventory_pb2
+from volur.pork.shared.v1alpha1 import quantity_pb2
+from volur.pork.shared.v1alpha1.characteristic_pb2 import (
+    Characteristic,
+    CharacteristicValue,
+)
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnString,
+    Column,
+    ProductInventoryCSVFileSource,
+    QuantityColumn,
+)
+
+CONTENT = [
+    "status,plant,product_id,pieces",
+    "available,plant-1,product-1,12",
+    "in transit,plant-2,product-2,",
+    "available,plant-1,product-3,7",
+]
+
+
+@pytest.fixture
+def csv_file(tmpdir: Path) -> str:
+    path = Path(tmpdir / "inventory.csv")
+    path.write_text("\n".join(CONTENT) + "\n")
+    return str(path)
+
+
+def expected_inventory() -> list[product_inventory_pb2.ProductInventory]:
+    inventory = []
+    for _ in CONTENT[1:]:
+        status, plant, product_id, pieces = _.split(",")
+        value = quantity_pb2.QuantityValue()
+        if pieces:
+            value.piece = int(pieces)
+        inventory.append(
+            product_inventory_pb2.ProductInventory(
+                product_id=product_id,
+                plant=plant,
+                quantity=quantity_pb2.Quantity(value=value),
+                characteristics=[
+                    Characteristic(
+                        name="status",
+                        value=CharacteristicValue(value_string=status),
+                    ),
+                ],
+            )
+        )
+    return inventory
+
+
+def create_source(
+    path: str | io.BufferedIOBase,
+    has_header: bool = True,
+    **options: object,
+) -> ProductInventoryCSVFileSource:
+    return ProductInventoryCSVFileSource(
+        path,
+        has_header=has_header,
+        product_id_column=Column(column_name="product_id" if has_header else 2),
+        plant_id_column=Column(column_name="plant" if has_header else 1),
+        quantity_column=QuantityColumn(
+            column_name="pieces" if has_header else 3,
+            unit="piece",
+        ),
+        characteristics_columns=[
+            CharacteristicColumnString(
+                column_name="status" if has_header else 0,
+                characteristic_name="status",
+            ),
+        ],
+        **options,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1024])
+@pytest.mark.asyncio
+async def test_load_product_inventory_from_a_file(
+    csv_file: str,
+    batch_size: int,
+) -> None:
+    source = create_source(csv_file, batch_size=batch_size)
+    assert [_ async for _ in source] == expected_inventory()
+
+
+@pytest.mark.asyncio
+async def test_load_product_inventory_from_a_buffer(csv_file: str) -> None:
+    with open(csv_file, "rb") as file:
+        source = create_source(file)
+        assert [_ async for _ in source] == expected_inventory()
+
+
+@pytest.mark.asyncio
+async def test_load_product_inventory_without_header(tmpdir: Path) -> None:
+    path = Path(tmpdir / "inventory.csv")
+    path.write_text("\n".join(CONTENT[1:]) + "\n")
+    source = create_source(str(path), has_header=False)
+    assert [_ async for _ in source] == expected_inventory()
+
+
+@pytest.mark.asyncio
+async def test_select_product_inventory_rows(csv_file: str) -> None:
+    source = create_source(csv_file, offset=1, limit=1)
+    assert [_ async for _ in source] == expected_inventory()[1:2]
+
+
+@pytest.mark.asyncio
+async def test_fail_on_a_missing_column(csv_file: str) -> None:
+    source = ProductInventoryCSVFileSource(
+        csv_file,
+        product_id_column=Column(column_name="sku"),
+    )
+    with pytest.raises(ValueError, match="column sku is not present"):
+        _ = [_ async for _ in source]
+
+
+def test_validate_batch_size(csv_file: str) -> None:
+    with pytest.raises(ValueError, match="batch size"):
+        create_source(csv_file, batch_size=0)
+    with pytest.raises(ValueError, match="offset"):
+        create_source(csv_file, offset=-1)
@@ -0,0 +1,101 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from volur.sdk.v1alpha2.sources.csv import Column, ProductsCSVFileSource
+
+
+@pytest.fixture
+def content() -> str:
+    lines = ["product_id,plant"]
+    lines.extend(f"product-{index},plant-{index % 10}" for index in range(1000))
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def products_file(tmpdir: Path, content: str) -> str:
+    path = Path(tmpdir / "products.csv")
+    path.write_text(content)
+    return str(path)
+
+
+def create_source(
+    path: str | io.BufferedIOBase,
+    **options: object,
+) -> ProductsCSVFileSource:
+    return ProductsCSVFileSource(
+        path,
+        product_id_column=Column(column_name="product_id"),
+        **options,  # type: ignore[arg-type]
+    )
+
+
+async def read(source: ProductsCSVFileSource) -> list[str]:
+    return [_.product_id async for _ in source]
+
+
+@pytest.mark.asyncio
+async def test_offset_and_limit(products_file: str, content: str) -> None:
+    expected = [f"product-{_}" for _ in range(10, 15)]
+    assert await read(create_source(products_file, offset=10, limit=5)) == expected
+    buffered = io.BytesIO(content.encode())
+    assert await read(create_source(buffered, offset=10, limit=5)) == expected
+
+
+@pytest.mark.asyncio
+async def test_sample_rate_is_deterministic(products_file: str, content: str) -> None:
+    first = await read(create_source(products_file, sample_rate=0.1))
+    second = await read(create_source(io.BytesIO(content.encode()), sample_rate=0.1))
+    assert first == second
+    assert 50 < len(first) < 150
+    assert await read(create_source(products_file, sample_rate=0)) == []
+    assert len(await read(create_source(products_file, sample_rate=1))) == 1000
+
+
+@pytest.mark.asyncio
+async def test_sample_by_key(products_file: str) -> None:
+    source = create_source(
+        products_file,
+        sample_rate=0.5,
+        sample_by_key=Column(column_name="plant"),
+        limit=1000,
+    )
+    plants = {int(_.split("-")[1]) % 10 for _ in await read(source)}
+    sampled = await read(source)
+    assert 0 < len(plants) < 10
+    assert len(sampled) == 100 * len(plants)
+
+
+@pytest.mark.asyncio
+async def test_sample_by_key_without_header(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    path.write_text("".join(f"product-{_},plant-{_ % 4}\n" for _ in range(100)))
+    source = ProductsCSVFileSource(
+        str(path),
+        has_header=False,
+        product_id_column=Column(column_name=0),
+        sample_rate=0.5,
+        sample_by_key=Column(column_name=1),
+    )
+    assert len(await read(source)) % 25 == 0
+
+
+@pytest.mark.asyncio
+async def test_select_rows_with_multiline_fields(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    path.write_text('product_id,name\np-1,"line1\nline2"\np-2,"line3\nline4"\np-3,x\n')
+    assert await read(create_source(str(path), offset=1)) == ["p-2", "p-3"]
+    assert await read(create_source(str(path), limit=1)) == ["p-1"]
+    assert await read(create_source(str(path), offset=1, limit=1)) == ["p-2"]
+    assert len(await read(create_source(str(path), sample_rate=0.5))) <= 3
+    assert len(await read(create_source(str(path), sample_rate=1))) == 3
+
+
+def test_raise_exception_for_invalid_options(products_file: str) -> None:
+    with pytest.raises(ValueError, match="sample rate must be between 0 and 1"):
+        create_source(products_file, sample_rate=2)
+    with pytest.raises(ValueError, match="sample rate must be set to sample by key"):
+        create_source(products_file, sample_by_key=Column(column_name="plant"))
+    with pytest.raises(ValueError, match="offset can not be negative"):
+        create_source(products_file, offset=-1)
@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from google.protobuf.timestamp_pb2 import Timestamp
+
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.sdk.v1alpha2.sources.csv import (
+    Column,
+    MaterialsCSVFileSource,
+    TimestampColumn,
+)
+
+
+def timestamp(value: str) -> Timestamp:
+    _ = Timestamp()
+    _.FromDatetime(datetime.fromisoformat(value))
+    return _
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2024-03-01T10:15:00Z", "2024-03-01T10:15:00+00:00"),
+        ("2024-03-01 10:15:00", "2024-03-01T10:15:00+01:00"),
+        ("2024-07-01T10:15:00", "2024-07-01T10:15:00+02:00"),
+        ("2024-03-01T10:15:00.250+05:00", "2024-03-01T10:15:00.250+05:00"),
+        ("2024-03-01", "2024-03-01T00:00:00+01:00"),
+        ("01.03.2024 10:15", "2024-03-01T10:15:00+01:00"),
+        (datetime(2024, 3, 1, 10, 15), "2024-03-01T10:15:00+01:00"),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_get_timestamp_value(value: object, expected: str | None) -> None:
+    column = TimestampColumn(
+        column_name="arrived_at",
+        formats=["%d.%m.%Y %H:%M"],
+        timezone="Europe/Oslo",
+    )
+    actual = column.get_value({"arrived_at": value})
+    assert actual == (timestamp(expected) if expected is not None else None)
+
+
+def test_lock_the_first_matching_format() -> None:
+    column = TimestampColumn(
+        column_name=0,
+        formats=["%d.%m.%Y", "%d/%m/%Y %H:%M"],
+    )
+    assert column.get_value({0: "01/03/2024 10:15"}) == timestamp(
+        "2024-03-01T10:15:00+00:00"
+    )
+    assert column._format == "%d/%m/%Y %H:%M"
+    # other values are still parsed after a format is locked
+    assert column.get_value({0: "2024-03-02"}) == timestamp("2024-03-02T00:00+00:00")
+    assert column.get_value({0: "03.03.2024"}) == timestamp("2024-03-03T00:00+00:00")
+    assert column._format == "%d.%m.%Y"
+
+
+def test_raise_exception_for_invalid_timestamp() -> None:
+    column = TimestampColumn(column_name="arrived_at")
+    with pytest.raises(ValueError, match="can not be interpreted as timestamp"):
+        column.get_value({"arrived_at": "yesterday"})
+    with pytest.raises(ValueError, match="unknown time zone"):
+        TimestampColumn(column_name="arrived_at", timezone="Nowhere/City")
+
+
+@pytest.mark.asyncio
+async def test_load_timestamps_of_materials(tmpdir: Path) -> None:
+    path = Path(tmpdir / "materials.csv")
+    path.write_text(
+        "material_id,arrived_at,expires_at\n"
+        "material-1,2024-03-01T10:15:00Z,2024-03-15\n"
+        "material-2,,\n"
+    )
+    source = MaterialsCSVFileSource(
+        str(path),
+        material_id_column=Column(column_name="material_id"),
+        arrived_at_column=TimestampColumn(column_name="arrived_at"),
+        expires_at_column=TimestampColumn(column_name="expires_at"),
+    )
+    assert [_ async for _ in source] == [
+        material_pb2.Material(
+            material_id="material-1",
+            arrived_at=timestamp("2024-03-01T10:15:00+00:00"),
+            expires_at=timestamp(
+                datetime(2024, 3, 15, tzinfo=timezone.utc).isoformat(),
+            ),
+        ),
+        material_pb2.Material(material_id="material-2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parse_distinct_timestamps_once_per_batch(
+    tmpdir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = Path(tmpdir / "materials.csv")
+    path.write_text(
+        "material_id,arrived_at\n"
+        "material-1,2024-03-01\n"
+        "material-2,2024-03-01\n"
+        "material-3,yesterday\n"
+        "material-4,2024-03-02\n"
+        "material-5,2024-03-01\n"
+    )
+    column = TimestampColumn(column_name="arrived_at")
+    parsed: list[str] = []
+    parse = column.parse
+
+    def track(value: str) -> datetime:
+        parsed.append(value)
+        return parse(value)
+
+    monkeypatch.setattr(column, "parse", track)
+    source = MaterialsCSVFileSource(
+        str(path),
+        material_id_column=Column(column_name="material_id"),
+        arrived_at_column=column,
+        on_error="skip",
+        batch_size=4,
+    )
+    materials = [_ async for _ in source]
+    assert [_.material_id for _ in materials] == [
+        "material-1",
+        "material-2",
+        "material-4",
+        "material-5",
+    ]
+    assert materials[1].arrived_at == timestamp("2024-03-01T00:00+00:00")
+    assert source.invalid == 1
+    assert parsed == ["2024-03-01", "yesterday", "2024-03-02", "2024-03-01"]
@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import pytest
+
+from volur.pork.product_inventory.v1alpha1 import product_inventory_pb2
+from volur.pork.shared.v1alpha1.weight_pb2 import Weight, WeightValue
+from volur.sdk.v1alpha2.sources.csv import (
+    Column,
+    ProductInventoryCSVFileSource,
+    WeightColumn,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "unit", "normalize", "expected"),
+    [
+        ("10.5", "kg", False, Weight(value=WeightValue(kilogram=10.5))),
+        ("10.5", " KG ", False, Weight(value=WeightValue(kilogram=10.5))),
+        ("2", "lbs", False, Weight(value=WeightValue(pound=2))),
+        ("2", "Pound", True, Weight(value=WeightValue(kilogram=0.90718474))),
+        ("5", "kilo", True, Weight(value=WeightValue(kilogram=5))),
+        ("", "kg", False, None),
+        (None, "kg", False, None),
+    ],
+)
+def test_get_weight_value(
+    value: str | None,
+    unit: str,
+    normalize: bool,
+    expected: Weight | None,
+) -> None:
+    column = WeightColumn(
+        column_name="weight",
+        unit_column=Column("unit"),
+        unit_aliases={"kilo": "kilogram"},
+        normalize=normalize,
+    )
+    assert column.get_value({"weight": value, "unit": unit}) == expected
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({}, "either unit or unit column must be set"),
+        (
+            {"unit": "kilogram", "unit_column": Column("unit")},
+            "either unit or unit column must be set",
+        ),
+        (
+            {"unit": "kilogram", "unit_aliases": {"st": "stone"}},
+            "unit stone of label st is not a weight unit",
+        ),
+    ],
+)
+def test_raise_exception_for_invalid_weight_column(
+    kwargs: dict[str, object],
+    message: str,
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        WeightColumn("weight", **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (
+            {"weight": "1", "unit": "stone"},
+            "provided unit stone in column unit is not a weight unit",
+        ),
+        (
+            {"weight": "heavy", "unit": "kg"},
+            "provided value heavy in column weight can not be interpreted as weight",
+        ),
+    ],
+)
+def test_raise_exception_for_invalid_weight_value(
+    data: dict[str | int, object],
+    message: str,
+) -> None:
+    column = WeightColumn("weight", unit_column=Column("unit"))
+    with pytest.raises(ValueError, match=message):
+        column.get_value(data)
+
+
+@pytest.mark.asyncio
+async def test_read_product_inventory_with_mixed_units(tmp_path: Path) -> None:
+    path = tmp_path / "inventory.csv"
+    path.write_text("product_id,weight,unit\np-1,10,kg\np-2,10,lbs\np-3,,\n")
+    source = ProductInventoryCSVFileSource(
+        path,
+        product_id_column=Column("product_id"),
+        weight_column=WeightColumn(
+            "weight",
+            unit_column=Column("unit"),
+            normalize=True,
+        ),
+    )
+    assert [_ async for _ in source] == [
+        product_inventory_pb2.ProductInventory(
+            product_id="p-1",
+            weight=Weight(value=WeightValue(kilogram=10)),
+        ),
+        product_inventory_pb2.ProductInventory(
+            product_id="p-2",
+            weight=Weight(value=WeightValue(kilogram=4.5359237)),
+        ),
+        product_inventory_pb2.ProductInventory(product_id="p-3"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_drop_rows_with_invalid_units_of_a_batch(tmp_path: Path) -> None:
+    path = tmp_path / "inventory.csv"
+    path.write_text(
+        "product_id,weight,unit\np-1,10,kg\np-2,10,stone\np-3,x,lbs\np-4,2,LBS\n"
+    )
+    source = ProductInventoryCSVFileSource(
+        path,
+        product_id_column=Column("product_id"),
+        weight_column=WeightColumn("weight", unit_column=Column("unit")),
+        on_error="skip",
+    )
+    assert [(_.product_id, _.weight) async for _ in source] == [
+        ("p-1", Weight(value=WeightValue(kilogram=10))),
+        ("p-4", Weight(value=WeightValue(pound=2))),
+    ]
+    assert source.invalid == 2
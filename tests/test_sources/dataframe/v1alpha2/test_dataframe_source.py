@@ -0,0 +1,152 @@
+import datetime
+from typing import Any
+
+import pytest
+
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.shared.v1alpha1 import characteristic_pb2
+from volur.pork.shared.v1alpha1.quantity_pb2 import Quantity, QuantityValue
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnFloat,
+    Column,
+    QuantityColumn,
+    TimestampColumn,
+)
+
+pa = pytest.importorskip("pyarrow")
+pd = pytest.importorskip("pandas")
+
+from volur.sdk.v1alpha2.sources.dataframe import MaterialsDataFrameSource  # noqa: E402
+
+
+@pytest.fixture
+def data() -> dict[str, list[Any]]:
+    return {
+        "id": ["material-id-1", "material-id-2", "material-id-3"],
+        "quantity": [1, 2, 3],
+        "unused": ["a", "b", "c"],
+    }
+
+
+@pytest.fixture
+def expected_materials() -> list[material_pb2.Material]:
+    return [
+        material_pb2.Material(
+            material_id=f"material-id-{_}",
+            quantity=Quantity(value=QuantityValue(piece=_)),
+        )
+        for _ in range(1, 4)
+    ]
+
+
+async def load(source: MaterialsDataFrameSource) -> list[material_pb2.Material]:
+    return [_ async for _ in source]
+
+
+@pytest.mark.asyncio
+async def test_load_pandas(
+    data: dict[str, list[Any]],
+    expected_materials: list[material_pb2.Material],
+) -> None:
+    source = MaterialsDataFrameSource(
+        pd.DataFrame(data),
+        batch_size=2,
+        material_id_column=Column("id"),
+        quantity_column=QuantityColumn("quantity", unit="piece"),
+    )
+    assert await load(source) == expected_materials
+
+
+@pytest.mark.asyncio
+async def test_load_pandas_by_position(
+    data: dict[str, list[Any]],
+    expected_materials: list[material_pb2.Material],
+) -> None:
+    source = MaterialsDataFrameSource(
+        pd.DataFrame(data),
+        material_id_column=Column(0),
+        quantity_column=QuantityColumn(1, unit="piece"),
+    )
+    assert await load(source) == expected_materials
+
+
+@pytest.mark.asyncio
+async def test_load_pandas_with_missing_values_and_timestamps() -> None:
+    frame = pd.DataFrame(
+        {
+            "id": ["material-id-1", "material-id-2"],
+            "quality": [1.5, float("nan")],
+            "arrived_at": pd.to_datetime(
+                ["2024-01-02T03:04:05Z", "2024-01-03T00:00:00Z"]
+            ),
+        }
+    )
+    source = MaterialsDataFrameSource(
+        frame,
+        material_id_column=Column("id"),
+        arrived_at_column=TimestampColumn("arrived_at"),
+        characteristics_columns=[CharacteristicColumnFloat("quality", "quality")],
+    )
+    materials = await load(source)
+    assert [_.characteristics[0].value for _ in materials] == [
+        characteristic_pb2.CharacteristicValue(value_float=1.5),
+        characteristic_pb2.CharacteristicValue(),
+    ]
+    assert materials[0].arrived_at.ToDatetime(
+        tzinfo=datetime.timezone.utc
+    ) == datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_load_arrow_table(
+    data: dict[str, list[Any]],
+    expected_materials: list[material_pb2.Material],
+) -> None:
+    source = MaterialsDataFrameSource(
+        pa.table(data),
+        material_id_column=Column("id"),
+        quantity_column=QuantityColumn("quantity", unit="piece"),
+    )
+    assert await load(source) == expected_materials
+
+
+@pytest.mark.asyncio
+async def test_load_polars(
+    data: dict[str, list[Any]],
+    expected_materials: list[material_pb2.Material],
+) -> None:
+    pl = pytest.importorskip("polars")
+    source = MaterialsDataFrameSource(
+        pl.DataFrame(data),
+        material_id_column=Column("id"),
+        quantity_column=QuantityColumn("quantity", unit="piece"),
+    )
+    assert await load(source) == expected_materials
+
+
+@pytest.mark.asyncio
+async def test_missing_column(data: dict[str, list[Any]]) -> None:
+    source = MaterialsDataFrameSource(
+        pd.DataFrame(data),
+        material_id_column=Column("missing"),
+    )
+    with pytest.raises(ValueError, match="column missing is not present"):
+        await load(source)
+
+
+def test_unsupported_frame() -> None:
+    source = MaterialsDataFrameSource(
+        [{"id": "material-id-1"}],
+        material_id_column=Column("id"),
+    )
+    with pytest.raises(ValueError, match="list is not a pandas"):
+        list(source._read_rows())
+
+
+def test_invalid_batch_size() -> None:
+    with pytest.raises(ValueError, match="batch size must be more than 0"):
+        MaterialsDataFrameSource(
+            pd.DataFrame(),
+            batch_size=0,
+            material_id_column=Column("id"),
+        )
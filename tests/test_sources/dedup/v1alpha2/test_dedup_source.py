@@ -0,0 +1,141 @@
+from pathlib import Path
+
+import pytest
+
+from volur.pork.products.v1alpha3 import product_pb2
+from volur.sdk.v1alpha2.report import UploadReport
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnString,
+    Column,
+    ProductsCSVFileSource,
+)
+from volur.sdk.v1alpha2.sources.dedup import (
+    DeduplicateSource,
+    KeyTable,
+    LossyKeySet,
+    hash_check,
+    hash_key,
+)
+
+
+@pytest.fixture
+def products_file(tmpdir: Path) -> str:
+    path = Path(tmpdir / "products.csv")
+    with open(path, "w") as f:
+        f.write("product_id,name\n")
+        f.write("1,a\n2,b\n1,c\n3,d\n2,e\n1,f\n")
+    return str(path)
+
+
+def create_source(path: str) -> ProductsCSVFileSource:
+    return ProductsCSVFileSource(
+        path,
+        product_id_column=Column(column_name="product_id"),
+        characteristics_columns=[
+            CharacteristicColumnString(
+                column_name="name",
+                characteristic_name="name",
+            ),
+        ],
+    )
+
+
+async def read(source: DeduplicateSource[product_pb2.Product]) -> list[str]:
+    return [
+        f"{_.product_id}{_.characteristics[0].value.value_string}" async for _ in source
+    ]
+
+
+@pytest.mark.asyncio
+async def test_keep_first(products_file: str) -> None:
+    source = DeduplicateSource(create_source(products_file))
+    assert await read(source) == ["1a", "2b", "3d"]
+    report = UploadReport()
+    source.upload_finished(report)
+    assert report.duplicates == 3
+
+
+@pytest.mark.asyncio
+async def test_keep_last(products_file: str) -> None:
+    source = DeduplicateSource(create_source(products_file), keep="last")
+    assert await read(source) == ["3d", "2e", "1f"]
+    assert source.duplicates == 3
+
+
+@pytest.mark.parametrize(
+    ("keep", "expected"),
+    [("first", ["1a", "2b", "3d"]), ("last", ["3d", "2e", "1f"])],
+)
+@pytest.mark.asyncio
+async def test_keep_records_of_keys_with_colliding_hashes(
+    products_file: str,
+    monkeypatch: pytest.MonkeyPatch,
+    keep: str,
+    expected: list[str],
+) -> None:
+    monkeypatch.setattr(
+        "volur.sdk.v1alpha2.sources.dedup.source.hash_key",
+        lambda _: 1,
+    )
+    source = DeduplicateSource(
+        create_source(products_file),
+        keep=keep,  # type: ignore[arg-type]
+    )
+    assert await read(source) == expected
+    assert source.duplicates == 3
+
+
+@pytest.mark.parametrize("keep", ["first", "last"])
+@pytest.mark.asyncio
+async def test_never_drop_unique_records_beyond_exact_keys(
+    products_file: str,
+    keep: str,
+) -> None:
+    source = DeduplicateSource(
+        create_source(products_file),
+        keep=keep,  # type: ignore[arg-type]
+        max_exact_keys=1,
+        lossy_size=1,
+    )
+    actual = await read(source)
+    assert {_[0] for _ in actual} == {"1", "2", "3"}
+
+
+def test_key_table_grows() -> None:
+    table = KeyTable(100_000, values=True)
+    for index in range(10_000):
+        assert table.put(hash_key(str(index)), index)
+    assert table.size == 10_000
+    assert all(table.get(hash_key(str(_))) == _ for _ in range(10_000))
+    assert table.get(hash_key("missing")) is None
+
+
+def test_key_table_tells_apart_keys_by_checks() -> None:
+    table = KeyTable(1_000, values=True, checks=True)
+    for index in range(500):
+        assert table.put(1, index, hash_check(str(index)))
+    assert table.size == 500
+    assert all(table.get(1, hash_check(str(_))) == _ for _ in range(500))
+    assert table.get(1, hash_check("missing")) is None
+
+
+def test_key_table_rejects_keys_when_full() -> None:
+    table = KeyTable(2)
+    assert table.put(1)
+    assert table.put(2)
+    assert table.put(2)
+    assert not table.put(3)
+    assert table.get(3) is None
+
+
+def test_lossy_key_set() -> None:
+    keys = LossyKeySet(1)
+    assert not keys.add(1)
+    assert keys.add(1)
+    assert not keys.add(2)
+    assert not keys.add(1)
+
+
+def test_raise_exception_for_invalid_keep(products_file: str) -> None:
+    with pytest.raises(ValueError, match="keep must be either first or last"):
+        DeduplicateSource(create_source(products_file), keep="any")  # type: ignore[arg-type]
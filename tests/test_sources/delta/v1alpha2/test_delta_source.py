@@ -0,0 +1,179 @@
+from pathlib import Path
+
+import pytest
+
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+from volur.sdk.v1alpha2.report import UploadReport
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnString,
+    Column,
+    ProductsCSVFileSource,
+)
+from volur.sdk.v1alpha2.sources.delta import DeltaSource, StateStore, default_key
+
+
+def write_products(path: Path, products: list[tuple[str, str]]) -> None:
+    with open(path, "w") as f:
+        f.write("product_id,name\n")
+        for product_id, name in products:
+            f.write(f"{product_id},{name}\n")
+
+
+def create_source(
+    path: Path,
+    store: StateStore,
+    deleted: list[str] | None = None,
+) -> DeltaSource[product_pb2.Product]:
+    return DeltaSource(
+        ProductsCSVFileSource(
+            str(path),
+            product_id_column=Column(column_name="product_id"),
+            characteristics_columns=[
+                CharacteristicColumnString(
+                    column_name="name",
+                    characteristic_name="name",
+                ),
+            ],
+        ),
+        store=store,
+        namespace="products",
+        on_deleted=deleted.extend if deleted is not None else None,
+        batch_size=2,
+    )
+
+
+async def upload(
+    source: DeltaSource[product_pb2.Product],
+    code: int = 0,
+) -> tuple[list[str], UploadReport]:
+    records = [_.product_id async for _ in source]
+    report = UploadReport(code=code, sent=len(records), acknowledged=len(records))
+    source.upload_finished(report)
+    return records, report
+
+
+@pytest.mark.asyncio
+async def test_upload_only_changed_records(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    store = StateStore(Path(tmpdir / "state.sqlite"))
+    write_products(path, [("1", "a"), ("2", "b"), ("3", "c")])
+    records, report = await upload(create_source(path, store))
+    assert records == ["1", "2", "3"]
+    assert report.skipped == 0
+
+    records, report = await upload(create_source(path, store))
+    assert records == []
+    assert report.skipped == 3
+
+    write_products(path, [("1", "a"), ("2", "x"), ("3", "c"), ("4", "d")])
+    records, report = await upload(create_source(path, store))
+    assert records == ["2", "4"]
+    assert report.skipped == 2
+
+
+@pytest.mark.asyncio
+async def test_keep_state_when_upload_failed(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    store = StateStore(":memory:")
+    write_products(path, [("1", "a"), ("2", "b")])
+    records, _ = await upload(create_source(path, store), code=14)
+    assert records == ["1", "2"]
+    records, _ = await upload(create_source(path, store))
+    assert records == ["1", "2"]
+    records, _ = await upload(create_source(path, store))
+    assert records == []
+
+
+@pytest.mark.asyncio
+async def test_report_deleted_records(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    store = StateStore(":memory:")
+    write_products(path, [("1", "a"), ("2", "b"), ("3", "c")])
+    deleted: list[str] = []
+    await upload(create_source(path, store, deleted))
+    assert deleted == []
+
+    write_products(path, [("1", "a"), ("3", "c")])
+    records, report = await upload(create_source(path, store, deleted))
+    assert records == []
+    assert deleted == ["2"]
+    assert report.deleted == 1
+    assert list(store.keys("products")) == ["1", "3"]
+
+
+@pytest.mark.asyncio
+async def test_prune_missing_keys(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    store = StateStore(":memory:")
+    write_products(path, [("1", "a"), ("2", "b"), ("3", "c")])
+    await upload(create_source(path, store))
+
+    write_products(path, [("1", "a"), ("3", "c")])
+    source = create_source(path, store)
+    source.prune = True
+    records, report = await upload(source)
+    assert records == []
+    assert report.deleted == 0
+    assert list(store.keys("products")) == ["1", "3"]
+
+
+def test_default_key() -> None:
+    assert default_key(product_pb2.Product(product_id="p-1")) == "p-1"
+    assert (
+        default_key(material_pb2.Material(material_id="m-1", plant="Plant1"))
+        == "Plant1/m-1"
+    )
+    with pytest.raises(ValueError, match="key must be provided for Demand"):
+        default_key(demand_pb2.Demand())
+
+
+@pytest.mark.asyncio
+async def test_resume_after_acknowledged_records(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    store = StateStore(":memory:")
+    write_products(path, [("1", "a"), ("2", "b"), ("3", "c")])
+    source = create_source(path, store)
+    source.resume = True
+    records = [_.product_id async for _ in source]
+    source.upload_finished(UploadReport(code=14, sent=3, acknowledged=2))
+    assert records == ["1", "2", "3"]
+    records, _ = await upload(create_source(path, store))
+    assert records == ["3"]
+
+
+@pytest.mark.asyncio
+async def test_keep_state_when_records_were_rejected(tmpdir: Path) -> None:
+    path = Path(tmpdir / "products.csv")
+    store = StateStore(":memory:")
+    write_products(path, [("1", "a"), ("2", "b"), ("3", "c")])
+    source = create_source(path, store)
+    source.resume = True
+    records = [_.product_id async for _ in source]
+    source.upload_finished(UploadReport(sent=3, acknowledged=2, rejected=1))
+    assert records == ["1", "2", "3"]
+    assert list(store.keys("products")) == []
+
+    source = create_source(path, store)
+    source.resume = True
+    records = [_.product_id async for _ in source]
+    source.upload_finished(
+        UploadReport(code=14, sent=3, acknowledged=1, rejected=1),
+    )
+    assert list(store.keys("products")) == []
+    records, _ = await upload(create_source(path, store))
+    assert records == ["1", "2", "3"]
+    assert list(store.keys("products")) == ["1", "2", "3"]
+
+
+def test_stage_digests_until_committed() -> None:
+    store = StateStore(":memory:")
+    store.stage("products", [("1", b"a"), ("2", b"b"), ("1", b"c")])
+    assert store.digests("products", ["1", "2"]) == {}
+    assert store.commit("products", limit=2) == 2
+    assert store.digests("products", ["1", "2"]) == {"1": b"a", "2": b"b"}
+    assert store.commit("products") == 3
+    assert store.digests("products", ["1", "2"]) == {"1": b"c", "2": b"b"}
+    store.clear_staged("products")
+    assert store.commit("products") == 0
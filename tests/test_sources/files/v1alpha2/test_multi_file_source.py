@@ -0,0 +1,110 @@
+import functools
+from pathlib import Path
+
+import pytest
+
+from volur.pork.products.v1alpha3 import product_pb2
+from volur.sdk.v1alpha2.report import UploadListener, UploadReport
+from volur.sdk.v1alpha2.sources.csv import Column, ProductsCSVFileSource
+from volur.sdk.v1alpha2.sources.files import MultiFileSource
+
+create_source = functools.partial(
+    ProductsCSVFileSource,
+    product_id_column=Column(column_name="product_id"),
+)
+
+
+@pytest.fixture
+def products_directory(tmpdir: Path) -> Path:
+    directory = Path(tmpdir)
+    for index in range(5):
+        with open(directory / f"products-{index}.csv", "w") as f:
+            f.write("product_id\n")
+            for row in range(10):
+                f.write(f"product-{index}-{row}\n")
+    return directory
+
+
+def expected_products(indices: range) -> list[product_pb2.Product]:
+    return [
+        product_pb2.Product(product_id=f"product-{index}-{row}")
+        for index in indices
+        for row in range(10)
+    ]
+
+
+@pytest.mark.parametrize("concurrency", [1, 2, 8])
+@pytest.mark.asyncio
+async def test_load_files_from_glob(
+    products_directory: Path,
+    concurrency: int,
+) -> None:
+    source = MultiFileSource(
+        str(products_directory / "products-*.csv"),
+        source=create_source,
+        concurrency=concurrency,
+        buffer_size=3,
+    )
+    actual_products = [_ async for _ in source]
+    assert sorted(actual_products, key=lambda _: _.product_id) == expected_products(
+        range(5)
+    )
+    assert [_.records for _ in source.files.values()] == [10] * 5
+    assert all(_.ok for _ in source.files.values())
+
+
+@pytest.mark.asyncio
+async def test_load_files_from_manifest(products_directory: Path) -> None:
+    manifest = products_directory / "manifest.txt"
+    manifest.write_text("# products\nproducts-3.csv\n\nproducts-1.csv\n")
+    source = MultiFileSource.from_manifest(
+        manifest,
+        source=create_source,
+        concurrency=1,
+    )
+    actual_products = [_ async for _ in source]
+    assert actual_products == expected_products(range(3, 4)) + expected_products(
+        range(1, 2)
+    )
+
+
+@pytest.mark.asyncio
+async def test_report_failed_files(products_directory: Path) -> None:
+    source = MultiFileSource(
+        [
+            products_directory / "products-0.csv",
+            products_directory / "missing.csv",
+        ],
+        source=create_source,
+    )
+    actual_products = [_ async for _ in source]
+    assert actual_products == expected_products(range(1))
+    assert isinstance(source, UploadListener)
+    report = UploadReport()
+    source.upload_finished(report)
+    assert report.files[str(products_directory / "products-0.csv")].ok
+    failed = report.files[str(products_directory / "missing.csv")]
+    assert not failed.ok
+    assert failed.records == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_readers_when_closed_early(products_directory: Path) -> None:
+    source = MultiFileSource(
+        str(products_directory / "products-*.csv"),
+        source=create_source,
+        concurrency=2,
+        buffer_size=1,
+    )
+    records = aiter(source)
+    assert await anext(records) is not None
+    assert source._reading
+    assert source._data is not None
+    await source._data.aclose()  # type: ignore[attr-defined]
+    # readers have finished their cleanup by the time the iterator is closed
+    assert source._reading == []
+
+
+def test_raise_exception_for_invalid_concurrency() -> None:
+    with pytest.raises(ValueError, match="concurrency must be more than 0"):
+        MultiFileSource("*.csv", source=create_source, concurrency=0)
@@ -0,0 +1,241 @@
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+from volur.pork.shared.v1alpha1.characteristic_pb2 import (
+    Characteristic,
+    CharacteristicValue,
+)
+from volur.pork.shared.v1alpha1.quantity_pb2 import Quantity, QuantityValue
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnBool,
+    CharacteristicColumnString,
+    Column,
+    QuantityColumn,
+)
+from volur.sdk.v1alpha2.sources.jsonl import (
+    DemandJSONLinesFileSource,
+    MaterialsJSONLinesFileSource,
+    ProductsJSONLinesFileSource,
+)
+from volur.sdk.v1alpha2.sources.jsonl.source import field_getter
+
+
+@pytest.fixture
+def materials_jsonl_content() -> list[dict[str, Any]]:
+    return [
+        {
+            "id": "material-id-1",
+            "plant": {"code": "Plant1"},
+            "weight": {"kg": 100.5},
+            "frozen": True,
+            "labels": ["label-1"],
+        },
+        {
+            "id": "material-id-2",
+            "plant": {"code": "Plant2"},
+            "weight": {"kg": None},
+            "frozen": False,
+            "labels": [],
+        },
+        {
+            "id": "material-id-3",
+            "weight": {"kg": "3"},
+        },
+    ]
+
+
+@pytest.fixture
+def expected_materials() -> list[material_pb2.Material]:
+    return [
+        material_pb2.Material(
+            material_id="material-id-1",
+            plant="Plant1",
+            quantity=Quantity(value=QuantityValue(kilogram=100.5)),
+            characteristics=[
+                Characteristic(
+                    name="is_frozen",
+                    value=CharacteristicValue(value_bool=True),
+                ),
+                Characteristic(
+                    name="label",
+                    value=CharacteristicValue(value_string="label-1"),
+                ),
+            ],
+        ),
+        material_pb2.Material(
+            material_id="material-id-2",
+            plant="Plant2",
+            quantity=Quantity(value=QuantityValue()),
+            characteristics=[
+                Characteristic(
+                    name="is_frozen",
+                    value=CharacteristicValue(value_bool=False),
+                ),
+                Characteristic(
+                    name="label",
+                    value=CharacteristicValue(),
+                ),
+            ],
+        ),
+        material_pb2.Material(
+            material_id="material-id-3",
+            quantity=Quantity(value=QuantityValue(kilogram=3)),
+            characteristics=[
+                Characteristic(
+                    name="is_frozen",
+                    value=CharacteristicValue(),
+                ),
+                Characteristic(
+                    name="label",
+                    value=CharacteristicValue(),
+                ),
+            ],
+        ),
+    ]
+
+
+@pytest.fixture
+def jsonl_file(
+    tmpdir: Path,
+    materials_jsonl_content: list[dict[str, Any]],
+) -> str:
+    path = Path(tmpdir / "test.jsonl")
+    with open(path, "w") as f:
+        for _ in materials_jsonl_content:
+            f.write(json.dumps(_))
+            f.write("\n\n")
+    return str(path)
+
+
+def create_materials_source(
+    path: str | io.BufferedIOBase,
+    batch_size: int,
+) -> MaterialsJSONLinesFileSource:
+    return MaterialsJSONLinesFileSource(
+        path,
+        batch_size=batch_size,
+        material_id_column=Column(column_name="id"),
+        plant_id_column=Column(column_name="plant.code"),
+        quantity_column=QuantityColumn(column_name="weight.kg", unit="kilogram"),
+        characteristics_columns=[
+            CharacteristicColumnBool(
+                column_name="frozen",
+                characteristic_name="is_frozen",
+            ),
+            CharacteristicColumnString(
+                column_name="labels.0",
+                characteristic_name="label",
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 100])
+@pytest.mark.asyncio
+async def test_load_file(
+    jsonl_file: str,
+    expected_materials: list[material_pb2.Material],
+    batch_size: int,
+) -> None:
+    source = create_materials_source(jsonl_file, batch_size)
+    actual_materials = [_ async for _ in source]
+    assert actual_materials == expected_materials
+
+
+@pytest.mark.asyncio
+async def test_load_from_io_buffered(
+    materials_jsonl_content: list[dict[str, Any]],
+    expected_materials: list[material_pb2.Material],
+) -> None:
+    stream = io.BytesIO(
+        "\n".join(json.dumps(_) for _ in materials_jsonl_content).encode()
+    )
+    source = create_materials_source(stream, 2)
+    actual_materials = [_ async for _ in source]
+    assert actual_materials == expected_materials
+
+
+@pytest.mark.asyncio
+async def test_load_products_and_demand() -> None:
+    content = b'{"order": {"product_id": 1, "customer": {"id": "c-1"}}}\n'
+    products = ProductsJSONLinesFileSource(
+        io.BytesIO(content),
+        product_id_column=Column(column_name="order.product_id"),
+    )
+    demand = DemandJSONLinesFileSource(
+        io.BytesIO(content),
+        product_id_column=Column(column_name="order.product_id"),
+        customer_id_column=Column(column_name="order.customer.id"),
+    )
+    assert [_ async for _ in products] == [product_pb2.Product(product_id="1")]
+    assert [_ async for _ in demand] == [
+        demand_pb2.Demand(
+            product=product_pb2.Product(product_id="1"),
+            customer_id="c-1",
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_raise_exception_for_invalid_json() -> None:
+    source = ProductsJSONLinesFileSource(
+        io.BytesIO(b'{"id": "product-id-1"}\n{"id": \n'),
+        product_id_column=Column(column_name="id"),
+    )
+    with pytest.raises(ValueError, match="line 2 is not a valid JSON"):
+        _ = [_ async for _ in source]
+
+
+@pytest.mark.asyncio
+async def test_raise_exception_for_column_index() -> None:
+    source = ProductsJSONLinesFileSource(
+        io.BytesIO(b'{"id": "product-id-1"}\n'),
+        product_id_column=Column(column_name=0),
+    )
+    with pytest.raises(ValueError, match="column 0 must be referenced by name"):
+        _ = [_ async for _ in source]
+
+
+field_getter_test_ids = [
+    "return-top-level-field",
+    "return-nested-field",
+    "return-array-element",
+    "return-field-with-dots-in-name",
+    "return-none-for-missing-field",
+    "return-none-for-out-of-range-index",
+    "return-none-for-path-through-scalar",
+]
+
+field_getter_test_data = [
+    ("a", {"a": 1}, 1),
+    ("a.b.c", {"a": {"b": {"c": 1}}}, 1),
+    ("a.1.b", {"a": [{"b": 1}, {"b": 2}]}, 2),
+    ("a.b", {"a.b": 1, "a": {"b": 2}}, 1),
+    ("a.c", {"a": {"b": 1}}, None),
+    ("a.2", {"a": [1, 2]}, None),
+    ("a.b", {"a": 1}, None),
+]
+
+
+@pytest.mark.parametrize(
+    argnames=(
+        "key",
+        "data",
+        "expected",
+    ),
+    argvalues=field_getter_test_data,
+    ids=field_getter_test_ids,
+)
+def test_field_getter(
+    key: str,
+    data: dict[str, Any],
+    expected: Any,  # noqa: ANN401
+) -> None:
+    assert field_getter(key)(data) == expected
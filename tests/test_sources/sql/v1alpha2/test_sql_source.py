@@ -0,0 +1,152 @@
+import sqlite3
+from typing import Iterator
+
+import pytest
+
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.pork.products.v1alpha3 import product_pb2
+from volur.pork.shared.v1alpha1.characteristic_pb2 import (
+    Characteristic,
+    CharacteristicValue,
+)
+from volur.pork.shared.v1alpha1.quantity_pb2 import Quantity, QuantityValue
+from volur.sdk.v1alpha2.sources.csv import (
+    CharacteristicColumnBool,
+    CharacteristicColumnFloat,
+    Column,
+    QuantityColumn,
+)
+from volur.sdk.v1alpha2.sources.sql import (
+    DemandSQLSource,
+    MaterialsSQLSource,
+    ProductsSQLSource,
+)
+
+
+@pytest.fixture
+def connection() -> Iterator[sqlite3.Connection]:
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    connection.execute(
+        "CREATE TABLE materials (id INTEGER, plant TEXT, weight REAL, lean REAL)"
+    )
+    connection.executemany(
+        "INSERT INTO materials VALUES (?, ?, ?, ?)",
+        [(_, f"Plant{_ % 2}", _ * 10.0, None if _ % 3 else 0.5) for _ in range(10)],
+    )
+    yield connection
+    connection.close()
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 100])
+@pytest.mark.asyncio
+async def test_load_materials(
+    connection: sqlite3.Connection,
+    batch_size: int,
+) -> None:
+    source = MaterialsSQLSource(
+        connection,
+        "SELECT id, plant, weight, lean FROM materials ORDER BY id",
+        batch_size=batch_size,
+        material_id_column=Column(column_name="id"),
+        plant_id_column=Column(column_name=1),
+        quantity_column=QuantityColumn(column_name="weight", unit="kilogram"),
+        characteristics_columns=[
+            CharacteristicColumnFloat(
+                column_name="lean",
+                characteristic_name="lean_percentage",
+            ),
+        ],
+    )
+    actual_materials = [_ async for _ in source]
+    assert actual_materials == [
+        material_pb2.Material(
+            material_id=str(_),
+            plant=f"Plant{_ % 2}",
+            quantity=Quantity(value=QuantityValue(kilogram=_ * 10.0)),
+            characteristics=[
+                Characteristic(
+                    name="lean_percentage",
+                    value=CharacteristicValue(value_float=0.5)
+                    if _ % 3 == 0
+                    else CharacteristicValue(),
+                ),
+            ],
+        )
+        for _ in range(10)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_load_boolean_column() -> None:
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    connection.execute("CREATE TABLE materials (id TEXT, frozen BOOLEAN)")
+    connection.executemany(
+        "INSERT INTO materials VALUES (?, ?)",
+        [("m-1", True), ("m-2", False), ("m-3", None), ("m-4", 2)],
+    )
+    source = MaterialsSQLSource(
+        connection,
+        "SELECT id, frozen FROM materials ORDER BY id",
+        material_id_column=Column(column_name="id"),
+        characteristics_columns=[
+            CharacteristicColumnBool(
+                column_name="frozen",
+                characteristic_name="is_frozen",
+            ),
+        ],
+        on_error="skip",
+    )
+    materials = [_ async for _ in source]
+    assert [_.characteristics[0].value for _ in materials] == [
+        CharacteristicValue(value_bool=True),
+        CharacteristicValue(value_bool=False),
+        CharacteristicValue(),
+    ]
+    assert source.invalid == 1
+    connection.close()
+
+
+@pytest.mark.asyncio
+async def test_load_with_parameters(connection: sqlite3.Connection) -> None:
+    products = ProductsSQLSource(
+        connection,
+        "SELECT id FROM materials WHERE plant = ? ORDER BY id",
+        parameters=("Plant1",),
+        product_id_column=Column(column_name="id"),
+    )
+    demand = DemandSQLSource(
+        connection,
+        "SELECT id, plant FROM materials WHERE id < :limit ORDER BY id",
+        parameters={"limit": 2},
+        product_id_column=Column(column_name="id"),
+        plant_id_column=Column(column_name="plant"),
+    )
+    assert [_ async for _ in products] == [
+        product_pb2.Product(product_id=str(_)) for _ in range(1, 10, 2)
+    ]
+    assert [_ async for _ in demand] == [
+        demand_pb2.Demand(
+            product=product_pb2.Product(product_id=str(_)),
+            plant=f"Plant{_}",
+        )
+        for _ in range(2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_raise_exception_for_missing_column(
+    connection: sqlite3.Connection,
+) -> None:
+    source = ProductsSQLSource(
+        connection,
+        "SELECT id FROM materials",
+        product_id_column=Column(column_name="product_id"),
+    )
+    with pytest.raises(ValueError, match="column product_id is not present"):
+        _ = [_ async for _ in source]
+
+
+def test_raise_exception_for_empty_query(connection: sqlite3.Connection) -> None:
+    with pytest.raises(ValueError, match="query can not be empty string"):
+        ProductsSQLSource(connection, "")
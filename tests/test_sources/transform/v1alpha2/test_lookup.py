@@ -0,0 +1,221 @@
+from pathlib import Path
+
+import pytest
+
+from volur.pork.demand.v1alpha2 import demand_pb2
+from volur.pork.shared.v1alpha1.characteristic_pb2 import (
+    Characteristic,
+    CharacteristicValue,
+)
+from volur.sdk.v1alpha2.report import UploadReport
+from volur.sdk.v1alpha2.sources.csv import Column, DemandCSVFileSource
+from volur.sdk.v1alpha2.sources.transform import (
+    Enrich,
+    LookupTable,
+    TransformSource,
+)
+
+
+@pytest.fixture
+def customers(tmp_path: Path) -> Path:
+    path = tmp_path / "customers.csv"
+    path.write_bytes(
+        "\ufeffCUSTOMER;PLANT;REGION\r\n"
+        "c-1;P1;north\r\n"
+        "\r\n"
+        'c-2;P2;"south; east"\r\n'
+        "c-1;P9;west\r\n"
+        "c-3;;\r\n"
+        "c-4".encode()
+    )
+    return path
+
+
+@pytest.fixture
+def demand(tmp_path: Path) -> Path:
+    path = tmp_path / "demand.csv"
+    path.write_text("product,customer\np-1,c-1\np-2,c-5\np-3,c-2\np-4,c-3\n")
+    return path
+
+
+def test_get(customers: Path) -> None:
+    table = LookupTable(customers, key_column="CUSTOMER", delimiter=";")
+    assert table.size == 4
+    assert table.names == ["CUSTOMER", "PLANT", "REGION"]
+    assert table.get("c-1") == {"CUSTOMER": "c-1", "PLANT": "P1", "REGION": "north"}
+    assert table.get("c-2") == {
+        "CUSTOMER": "c-2",
+        "PLANT": "P2",
+        "REGION": "south; east",
+    }
+    assert table.get("c-4") == {"CUSTOMER": "c-4", "PLANT": "", "REGION": ""}
+    assert table.get("c-5") is None
+    table.close()
+
+
+def test_get_keys_with_colliding_hashes(
+    customers: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        "volur.sdk.v1alpha2.sources.transform.lookup.hash_key",
+        lambda _: 1,
+    )
+    table = LookupTable(customers, key_column="CUSTOMER", delimiter=";")
+    assert table.size == 4
+    assert table.get("c-1") == {"CUSTOMER": "c-1", "PLANT": "P1", "REGION": "north"}
+    assert table.get("c-2") == {
+        "CUSTOMER": "c-2",
+        "PLANT": "P2",
+        "REGION": "south; east",
+    }
+    assert table.get("c-4") == {"CUSTOMER": "c-4", "PLANT": "", "REGION": ""}
+    assert table.get("c-5") is None
+
+
+def test_get_columns_without_cache(customers: Path) -> None:
+    table = LookupTable(
+        customers,
+        key_column="CUSTOMER",
+        columns=["PLANT"],
+        delimiter=";",
+        cache_size=0,
+    )
+    assert table.get("c-2") == {"PLANT": "P2"}
+    assert table.get("c-2") == {"PLANT": "P2"}
+
+
+@pytest.mark.parametrize(
+    ("columns", "message"),
+    [
+        (None, "column CODE is not present in the header"),
+        (["CODE"], "column CODE is not present in the header"),
+    ],
+)
+def test_raise_exception_for_missing_column(
+    customers: Path,
+    columns: list[str] | None,
+    message: str,
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        LookupTable(
+            customers,
+            key_column="CUSTOMER" if columns else "CODE",
+            columns=columns,
+            delimiter=";",
+        )
+
+
+def test_raise_exception_for_empty_table(tmp_path: Path) -> None:
+    path = tmp_path / "empty.csv"
+    path.write_text("")
+    with pytest.raises(ValueError, match="is empty"):
+        LookupTable(path, key_column="CUSTOMER")
+
+
+def create_source(
+    demand: Path,
+    enrich: Enrich[demand_pb2.Demand],
+) -> TransformSource[demand_pb2.Demand]:
+    return TransformSource(
+        DemandCSVFileSource(
+            demand,
+            product_id_column=Column("product"),
+            customer_id_column=Column("customer"),
+        ),
+        stages=[enrich],
+        executor="thread",
+    )
+
+
+@pytest.mark.asyncio
+async def test_enrich(customers: Path, demand: Path) -> None:
+    enrich = Enrich[demand_pb2.Demand](
+        LookupTable(customers, key_column="CUSTOMER", delimiter=";"),
+        key=lambda _: _.customer_id,
+        fields={"PLANT": "plant"},
+        characteristics={"REGION": "region"},
+    )
+    source = create_source(demand, enrich)
+    records = [_ async for _ in source]
+    assert [(_.customer_id, _.plant) for _ in records] == [
+        ("c-1", "P1"),
+        ("c-5", ""),
+        ("c-2", "P2"),
+        ("c-3", ""),
+    ]
+    assert list(records[2].characteristics) == [
+        Characteristic(
+            name="region",
+            value=CharacteristicValue(value_string="south; east"),
+        ),
+    ]
+    assert not records[3].characteristics
+    assert (enrich.hits, enrich.misses) == (3, 1)
+    report = UploadReport()
+    source.upload_finished(report)
+    assert (report.lookup_hits, report.lookup_misses) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_reset_counters_of_every_upload(customers: Path, demand: Path) -> None:
+    enrich = Enrich[demand_pb2.Demand](
+        LookupTable(customers, key_column="CUSTOMER", delimiter=";"),
+        key=lambda _: _.customer_id,
+    )
+    source = create_source(demand, enrich)
+    for _ in range(2):
+        assert len([_ async for _ in source]) == 4
+        report = UploadReport()
+        source.upload_finished(report)
+        assert (report.lookup_hits, report.lookup_misses) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_drop_missing(customers: Path, demand: Path) -> None:
+    enrich = Enrich[demand_pb2.Demand](
+        LookupTable(customers, key_column="CUSTOMER", delimiter=";"),
+        key=lambda _: _.customer_id,
+        on_missing="drop",
+    )
+    records = [_.customer_id async for _ in create_source(demand, enrich)]
+    assert records == ["c-1", "c-2", "c-3"]
+
+
+@pytest.mark.asyncio
+async def test_raise_on_missing(customers: Path, demand: Path) -> None:
+    enrich = Enrich[demand_pb2.Demand](
+        LookupTable(customers, key_column="CUSTOMER", delimiter=";"),
+        key=lambda _: _.customer_id,
+        on_missing="raise",
+    )
+    with pytest.raises(ValueError, match="key c-5 is not present"):
+        _ = [_ async for _ in create_source(demand, enrich)]
+
+
+def test_raise_exception_for_invalid_enrich(customers: Path, demand: Path) -> None:
+    table = LookupTable(
+        customers, key_column="CUSTOMER", columns=["PLANT"], delimiter=";"
+    )
+    with pytest.raises(ValueError, match="can not run in processes"):
+        TransformSource(
+            DemandCSVFileSource(
+                demand,
+                product_id_column=Column("product"),
+                customer_id_column=Column("customer"),
+            ),
+            stages=[Enrich[demand_pb2.Demand](table, key=lambda _: _.customer_id)],
+            executor="process",
+        )
+    with pytest.raises(ValueError, match="column REGION is not a column"):
+        Enrich[demand_pb2.Demand](
+            table,
+            key=lambda _: _.customer_id,
+            characteristics={"REGION": "region"},
+        )
+    with pytest.raises(ValueError, match="on missing must be either"):
+        Enrich[demand_pb2.Demand](
+            table,
+            key=lambda _: _.customer_id,
+            on_missing="ignore",  # type: ignore[arg-type]
+        )
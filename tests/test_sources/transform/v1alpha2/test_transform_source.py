@@ -0,0 +1,127 @@
+import operator
+from pathlib import Path
+
+import pytest
+
+from volur.pork.materials.v1alpha3 import material_pb2
+from volur.sdk.v1alpha2.report import UploadReport
+from volur.sdk.v1alpha2.sources.core import OnError
+from volur.sdk.v1alpha2.sources.csv import (
+    Column,
+    MaterialsCSVFileSource,
+    QuantityColumn,
+)
+from volur.sdk.v1alpha2.sources.transform import (
+    Filter,
+    FlatMap,
+    Map,
+    TransformSource,
+)
+from volur.sdk.v1alpha2.sources.transform.source import Executor
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    path = tmp_path / "materials.csv"
+    path.write_text("id\n" + "".join(f" m-{_}\n" for _ in range(10)) + "\n")
+    return path
+
+
+def create_source(path: Path, on_error: OnError = "raise") -> MaterialsCSVFileSource:
+    return MaterialsCSVFileSource(
+        path,
+        material_id_column=Column("id"),
+        batch_size=3,
+        on_error=on_error,
+    )
+
+
+def normalize(material: material_pb2.Material) -> material_pb2.Material:
+    material.material_id = material.material_id.strip().upper()
+    return material
+
+
+def split(material: material_pb2.Material) -> list[material_pb2.Material]:
+    return [material, material_pb2.Material(material_id=f"{material.material_id}+")]
+
+
+@pytest.mark.parametrize("executor", ["inline", "thread"])
+@pytest.mark.asyncio
+async def test_transform(path: Path, executor: Executor) -> None:
+    source = TransformSource(
+        create_source(path),
+        stages=[
+            Map(normalize),
+            Filter[material_pb2.Material](lambda _: _.material_id not in ("", "M-1")),
+            FlatMap(split),
+        ],
+        executor=executor,
+        workers=2,
+        batch_size=4,
+    )
+    expected = [
+        _ for index in range(10) if index != 1 for _ in (f"M-{index}", f"M-{index}+")
+    ]
+    assert [_.material_id async for _ in source] == expected
+    assert [len(_) async for _ in source.aiter_batches(5)] == [4, 5, 1, 5, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_transform_unordered(path: Path) -> None:
+    source = TransformSource(
+        create_source(path),
+        stages=[Map(normalize)],
+        executor="thread",
+        ordered=False,
+    )
+    materials = [_.material_id async for _ in source]
+    assert sorted(materials) == sorted(["", *(f"M-{_}" for _ in range(10))])
+
+
+@pytest.mark.asyncio
+async def test_transform_in_process(path: Path) -> None:
+    source = TransformSource(
+        create_source(path),
+        stages=[Filter(operator.attrgetter("material_id"))],
+        executor="process",
+        workers=2,
+    )
+    assert [_.material_id async for _ in source] == [f" m-{_}" for _ in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_raise_error_of_stage(path: Path) -> None:
+    def fail(material: material_pb2.Material) -> material_pb2.Material:
+        raise ValueError(f"invalid material {material.material_id}")
+
+    source = TransformSource(create_source(path), stages=[Map(fail)], executor="thread")
+    with pytest.raises(ValueError, match="invalid material"):
+        _ = [_ async for _ in source]
+
+
+@pytest.mark.asyncio
+async def test_report_of_source(tmp_path: Path) -> None:
+    path = tmp_path / "materials.csv"
+    path.write_text("id,weight\nm-1,1\nm-2,heavy\n")
+    source = TransformSource(
+        MaterialsCSVFileSource(
+            path,
+            material_id_column=Column("id"),
+            quantity_column=QuantityColumn("weight", unit="kilogram"),
+            on_error="skip",
+        ),
+        stages=[],
+    )
+    assert [_.material_id async for _ in source] == ["m-1"]
+    report = UploadReport()
+    source.upload_finished(report)
+    assert report.invalid == 1
+
+
+def test_invalid_arguments(path: Path) -> None:
+    with pytest.raises(ValueError, match="executor must be either"):
+        TransformSource(create_source(path), stages=[], executor="fork")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="number of workers must be more than 0"):
+        TransformSource(create_source(path), stages=[], workers=0)
+    with pytest.raises(ValueError, match="batch size must be more than 0"):
+        TransformSource(create_source(path), stages=[], batch_size=0)